@@ -1,14 +1,19 @@
 from django.contrib import admin
 from django.contrib.auth import get_user_model
 
+from config.paginator import EstimatedCountPaginator
+
 User = get_user_model()
 
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ("email", "full_name", "role", "is_active", "is_staff")
-    search_fields = ("email", "full_name")
+    # Pencarian awalan memakai index UPPER(email) / UPPER(full_name).
+    search_fields = ("^email", "^full_name")
     list_filter = ("role", "is_active", "is_staff")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 
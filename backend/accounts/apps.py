@@ -6,5 +6,5 @@ class AccountsConfig(AppConfig):
     name = "accounts"
     verbose_name = "Akun & Autentikasi"
 
-
-
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
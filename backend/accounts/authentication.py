@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+PROFILE_ID_CLAIM = "profile_id"
+# Kolom user yang disimpan di cache principal; kolom lain (termasuk hash
+# password) tidak ikut dan baru dimuat dari database bila diakses.
+PRINCIPAL_FIELDS = ("id", "is_active", "is_staff", "is_superuser")
+
+
+def user_cache_key(user_id) -> str:
+    return f"accounts:principal:{user_id}"
+
+
+def invalidate_cached_user(user_id) -> None:
+    cache.delete(user_cache_key(user_id))
+
+
+def lookup_profile_id(user_id):
+    from talents.models import StudentProfile
+
+    return (
+        StudentProfile.objects.filter(user_id=user_id)
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def principal_user(principal: dict):
+    """
+    User dari data principal di cache. Hanya PRINCIPAL_FIELDS yang terisi;
+    kolom lain di-defer sehingga diakses = dimuat dari database, dan
+    `save()` hanya menulis kolom yang diubah (DirtyFieldsMixin).
+    """
+    User = get_user_model()
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in principal]
+    user = User.from_db(DEFAULT_DB_ALIAS, names, [principal[name] for name in names])
+    user.cached_profile_id = principal["profile_id"]
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication yang menyimpan principal (id, status, id profil) di
+    cache berumur pendek, sehingga request terautentikasi tidak perlu query
+    user dan profil setiap kali. Cache dihapus oleh signal saat user
+    berubah (nonaktif, ganti role/password) atau dihapus.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = user_cache_key(user_id)
+        principal = cache.get(key)
+        if principal is None:
+            user = super().get_user(validated_token)
+            profile_id = validated_token.get(PROFILE_ID_CLAIM)
+            if profile_id is None:
+                profile_id = lookup_profile_id(user.pk)
+            user.cached_profile_id = profile_id
+            principal = {name: getattr(user, name) for name in PRINCIPAL_FIELDS}
+            principal["profile_id"] = profile_id
+            if api_settings.CHECK_REVOKE_TOKEN:
+                principal["revoke_token"] = get_md5_hash_password(user.password)
+            cache.set(key, principal, settings.AUTH_USER_CACHE_TIMEOUT)
+            return user
+
+        if not principal["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != principal.get("revoke_token"):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return principal_user(principal)
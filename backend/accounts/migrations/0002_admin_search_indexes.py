@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:43
+
+from django.db import migrations
+
+from config.migration_operations import prefix_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        prefix_search_index('accounts', 'User', 'email', 'user_email_upper_idx'),
+        prefix_search_index('accounts', 'User', 'full_name', 'user_full_name_upper_idx'),
+    ]
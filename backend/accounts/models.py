@@ -1,8 +1,10 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+from config.dirty_fields import DirtyFieldsMixin
 
-class User(AbstractUser):
+
+class User(DirtyFieldsMixin, AbstractUser):
     class Roles(models.TextChoices):
         MAHASISWA = "MAHASISWA", "Mahasiswa"
         ADMIN = "ADMIN", "Admin"
@@ -16,6 +18,10 @@ class User(AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    # Index pencarian awalan tanpa beda huruf (admin, `^email` /
+    # `^full_name`) khusus PostgreSQL, dibuat di migrasi
+    # 0002_admin_search_indexes (lihat config.migration_operations).
+
     def __str__(self) -> str:  # pragma: no cover - simple repr
         return self.email
 
@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_user
+
+User = get_user_model()
+
+# Kolom yang tidak memengaruhi principal yang di-cache.
+PRINCIPAL_IGNORED_FIELDS = {"last_login"}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, update_fields=None, **kwargs):
+    """
+    Hapus principal yang di-cache supaya perubahan status aktif, role,
+    atau password langsung berlaku pada request berikutnya.
+    """
+    if update_fields is not None and update_fields <= PRINCIPAL_IGNORED_FIELDS:
+        return
+    invalidate_cached_user(instance.pk)
@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from .authentication import PROFILE_ID_CLAIM, lookup_profile_id
+
 
 User = get_user_model()
 
@@ -11,10 +13,18 @@ class EmailLowercaseTokenObtainPairSerializer(TokenObtainPairSerializer):
     sehingga pengguna tidak bingung soal huruf besar/kecil saat login.
     """
 
+    @classmethod
+    def get_token(cls, user):
+        """
+        Tambahkan id profil ke token supaya autentikasi tidak perlu mencari
+        profil lagi di database.
+        """
+        token = super().get_token(user)
+        token[PROFILE_ID_CLAIM] = lookup_profile_id(user.pk)
+        return token
+
     def validate(self, attrs):
         email = attrs.get(self.username_field)
         if isinstance(email, str):
             attrs[self.username_field] = email.strip().lower()
         return super().validate(attrs)
-
-
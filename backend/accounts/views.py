@@ -2,6 +2,8 @@ from django.contrib.auth import get_user_model
 from rest_framework import generics, permissions
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from config.throttling import LoginThrottle, RegisterThrottle
+
 from .serializers import RegisterSerializer, UserSerializer
 from .token_serializers import EmailLowercaseTokenObtainPairSerializer
 
@@ -15,6 +17,7 @@ class RegisterView(generics.CreateAPIView):
 
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RegisterThrottle]
 
 
 class MeView(generics.RetrieveAPIView):
@@ -25,7 +28,9 @@ class MeView(generics.RetrieveAPIView):
     serializer_class = UserSerializer
 
     def get_object(self):
-        return self.request.user
+        # request.user bisa berupa principal dari cache yang hanya memuat
+        # sebagian kolom; ambil data lengkapnya sekali.
+        return User.objects.get(pk=self.request.user.pk)
 
 
 class LoginView(TokenObtainPairView):
@@ -35,6 +40,7 @@ class LoginView(TokenObtainPairView):
     """
 
     serializer_class = EmailLowercaseTokenObtainPairSerializer
+    throttle_classes = [LoginThrottle]
 
 
 
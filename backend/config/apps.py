@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    """
+    Komponen lintas app (skema OpenAPI, middleware, routing database) yang
+    perlu terdaftar sebagai app, mis. untuk perintah manajemen.
+    """
+
+    name = "config"
+    verbose_name = "Konfigurasi"
+
+    def ready(self) -> None:
+        from . import checks  # noqa: F401
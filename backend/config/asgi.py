@@ -4,7 +4,16 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
 
+# Diimpor setelah Django siap (app registry sudah dimuat).
+from django.conf import settings  # noqa: E402
 
+from talents.events import talent_events_app  # noqa: E402
 
+
+async def application(scope, receive, send):
+    # Stream SSE dilayani langsung tanpa middleware Django.
+    if scope["type"] == "http" and scope["path"] == settings.TALENTS_EVENTS_PATH:
+        return await talent_events_app(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def cache_is_process_local(alias: str = "default") -> bool:
+    """
+    True bila cache `alias` tidak dibagi antarproses (mis. LocMemCache).
+    """
+    return settings.CACHES[alias]["BACKEND"] in PROCESS_LOCAL_CACHES
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if settings.DEBUG or not cache_is_process_local():
+        return []
+    return [
+        Warning(
+            "Cache default hanya berlaku per proses.",
+            hint=(
+                "Isi REDIS_URL. Tanpa cache bersama, invalidasi versi "
+                "direktori, peta skill, cache principal JWT, throttle dan "
+                "hitungan kunjungan profil tidak terlihat oleh proses lain."
+            ),
+            id="config.W001",
+        )
+    ]
@@ -0,0 +1,101 @@
+"""
+Routing read replica. Query baca hanya dikirim ke replica bila request
+sedang berada dalam konteks "boleh replica" (diatur oleh
+config.middleware.ReplicaRoutingMiddleware untuk GET publik) dan tidak
+sedang di-pin ke primary; selain itu semuanya ke `default`. Replica dipilih
+sekali saat konteks dibuka, sehingga semua query satu request membaca dari
+replica yang sama.
+"""
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+# Alias replica untuk query baca di konteks ini; None = primary.
+_replica_alias = contextvars.ContextVar("replica_alias", default=None)
+
+_health: dict[str, tuple[bool, float]] = {}
+_health_lock = threading.Lock()
+
+
+def pick_replica() -> str | None:
+    """
+    Pilih satu replica sehat secara acak, atau None bila tidak ada.
+    """
+    candidates = [alias for alias in settings.DATABASE_REPLICAS if replica_is_healthy(alias)]
+    return random.choice(candidates) if candidates else None
+
+
+@contextmanager
+def replica_reads(enabled: bool = True):
+    token = _replica_alias.set(pick_replica() if enabled else None)
+    try:
+        yield
+    finally:
+        _replica_alias.reset(token)
+
+
+def use_primary():
+    """
+    Paksa semua query di dalam blok ke primary (mis. tepat setelah menulis).
+    """
+    return replica_reads(False)
+
+
+def _check_replica(alias: str) -> bool:
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # Selama semua WAL yang diterima sudah di-replay, lag dianggap
+                # nol: umur transaksi terakhir saja terus bertambah ketika
+                # primary sedang sepi.
+                cursor.execute(
+                    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+                    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+                    " END"
+                )
+                (lag,) = cursor.fetchone()
+                return lag is None or float(lag) <= settings.DATABASE_REPLICA_MAX_LAG
+            cursor.execute("SELECT 1")
+            return True
+    except DatabaseError:
+        connection.close()
+        return False
+
+
+def replica_is_healthy(alias: str) -> bool:
+    """
+    Status replica dari pemeriksaan terakhir; diperiksa ulang (koneksi dan
+    lag replikasi) paling sering tiap DATABASE_REPLICA_HEALTH_INTERVAL detik.
+    """
+    now = time.monotonic()
+    healthy, checked_at = _health.get(alias, (True, None))
+    if checked_at is not None and now - checked_at < settings.DATABASE_REPLICA_HEALTH_INTERVAL:
+        return healthy
+    with _health_lock:
+        healthy, checked_at = _health.get(alias, (True, None))
+        if checked_at is None or now - checked_at >= settings.DATABASE_REPLICA_HEALTH_INTERVAL:
+            healthy = _check_replica(alias)
+            _health[alias] = (healthy, time.monotonic())
+    return healthy
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _replica_alias.get() or "default"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary dan replica berisi data yang sama.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -0,0 +1,100 @@
+"""
+Pelacakan field yang berubah (dirty) pada instance model.
+
+Nilai kolom dicatat saat instance dimuat dari database dan setelah setiap
+`save()`. Save berikutnya hanya menulis kolom yang nilainya berbeda
+(ditambah kolom `auto_now`), dan dilewati sama sekali (tanpa query maupun
+signal) bila tidak ada yang berubah. Karena `update_fields` ikut diteruskan
+ke signal `pre_save`/`post_save`, receiver bisa membatalkan cache hanya
+untuk kolom yang memang berubah.
+"""
+
+from django.db.models import FileField
+from django.db.models.fields.files import FieldFile
+
+
+def _comparable(field, value):
+    if isinstance(field, FileField):
+        # Kolom file bisa berisi string dari database, FieldFile, atau None.
+        return (value.name if isinstance(value, FieldFile) else value) or ""
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return value
+
+
+class DirtyFieldsMixin:
+    """
+    Mixin untuk model konkret; letakkan sebelum kelas model dasarnya,
+    mis. `class User(DirtyFieldsMixin, AbstractUser)`.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_saved_state()
+        return instance
+
+    def _remember_saved_state(self, fields=None):
+        state = self.__dict__.setdefault("_saved_state", {})
+        loaded = self.__dict__
+        for field in self._meta.concrete_fields:
+            if field.attname not in loaded:
+                continue
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+            value = loaded[field.attname]
+            if hasattr(value, "resolve_expression"):
+                # Mis. F("x") + 1: nilai sebenarnya baru diketahui setelah
+                # dimuat ulang.
+                state.pop(field.attname, None)
+            else:
+                state[field.attname] = _comparable(field, value)
+
+    def get_dirty_fields(self) -> set[str]:
+        """
+        Nama field yang nilainya berbeda dari yang terakhir dimuat atau
+        disimpan. Field yang di-defer dan belum disentuh tidak dihitung.
+        """
+        state = self.__dict__.get("_saved_state")
+        if state is None:
+            return {field.name for field in self._meta.concrete_fields if not field.primary_key}
+        dirty = set()
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in self.__dict__:
+                continue
+            value = self.__dict__[field.attname]
+            if isinstance(value, FieldFile) and not value._committed:
+                dirty.add(field.name)
+            elif field.attname not in state or state[field.attname] != _comparable(field, value):
+                dirty.add(field.name)
+        return dirty
+
+    def save(self, *args, **kwargs):
+        tracked = (
+            "_saved_state" in self.__dict__
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+        )
+        if tracked:
+            dirty = self.get_dirty_fields()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                dirty = {
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if field.name in dirty
+                    and (field.name in update_fields or field.attname in update_fields)
+                }
+            if not dirty:
+                return
+            kwargs["update_fields"] = dirty | {
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            }
+        super().save(*args, **kwargs)
+        self._remember_saved_state(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._remember_saved_state(fields)
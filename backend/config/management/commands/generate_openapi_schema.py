@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from config.schema import MEDIA_TYPES, artifact_path, code_version, generate_schema_document
+
+
+class Command(BaseCommand):
+    help = (
+        "Buat skema OpenAPI (JSON dan YAML) untuk versi kode saat ini. "
+        "Jalankan sekali setiap deploy, setelah collectstatic."
+    )
+
+    def handle(self, *args, **options):
+        version = code_version()
+        for fmt in MEDIA_TYPES:
+            path = artifact_path(fmt, version)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(generate_schema_document(fmt))
+            self.stdout.write(f"Skema ditulis ke {path}")
+        self.stdout.write(self.style.SUCCESS(f"Skema OpenAPI versi {version} siap."))
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import re
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .db_router import replica_reads, use_primary
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependensi opsional
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+re_write_statement = _lazy_re_compile(r"\s*(INSERT|UPDATE|DELETE|REPLACE|MERGE)\b", re.IGNORECASE)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Kompresi respons dengan brotli (bila paket `brotli` terpasang dan
+    klien mendukung) atau gzip, hanya untuk respons di atas
+    `COMPRESSION_MIN_SIZE` byte. Event stream tidak dikompresi supaya
+    tidak tertahan di buffer. Dipasang setelah WhiteNoise sehingga file
+    statis tetap dilayani dengan versi terkompresi milik WhiteNoise.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        if response.get("Content-Type", "").startswith(settings.COMPRESSION_EXCLUDED_TYPES):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if brotli is None or response.streaming or not re_accepts_brotli.search(accept_encoding):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
+
+
+class _WriteDetector:
+    """
+    execute_wrapper yang mencatat apakah ada statement penulisan.
+    """
+
+    def __init__(self):
+        self.wrote = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if not self.wrote and re_write_statement.match(sql):
+            self.wrote = True
+        return execute(sql, params, many, context)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Izinkan request GET/HEAD publik membaca dari read replica. Request
+    lain dilayani primary, dan bila benar-benar menulis ke database
+    (INSERT/UPDATE/DELETE), klien di-pin (cookie dan hash header
+    Authorization) ke primary selama DATABASE_REPLICA_PIN_SECONDS supaya
+    perubahan yang baru dibuat langsung terbaca (read-your-writes). POST
+    yang hanya membaca (mis. /api/talents/match/) tidak mem-pin.
+    """
+
+    cookie_name = "db_pin"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        if request.method in ("GET", "HEAD", "OPTIONS"):
+            allowed = not self.is_pinned(request) and not request.path.startswith(
+                settings.DATABASE_REPLICA_EXCLUDED_PATHS
+            )
+            with replica_reads(allowed):
+                return self.get_response(request)
+
+        detector = _WriteDetector()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(detector))
+            with use_primary():
+                response = self.get_response(request)
+        if detector.wrote and response.status_code < 400:
+            self.pin(request, response)
+        return response
+
+    def _auth_key(self, request):
+        authorization = request.META.get("HTTP_AUTHORIZATION")
+        if not authorization:
+            return None
+        return "db:pin:" + hashlib.sha1(authorization.encode()).hexdigest()
+
+    def is_pinned(self, request):
+        if request.COOKIES.get(self.cookie_name):
+            return True
+        key = self._auth_key(request)
+        return bool(key and cache.get(key))
+
+    def pin(self, request, response):
+        seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+        response.set_cookie(self.cookie_name, "1", max_age=seconds, httponly=True, samesite="Lax")
+        key = self._auth_key(request)
+        if key:
+            cache.set(key, 1, seconds)
+
+
+class SnapshotWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise yang juga melayani snapshot direktori publik
+    (talents.snapshot) dari TALENTS_SNAPSHOT_ROOT. File snapshot dibuat
+    setelah server berjalan dan dihapus lagi oleh GC snapshot, jadi dicari
+    di disk setiap request dan tidak disimpan di tabel file WhiteNoise
+    (yang akan tumbuh tanpa batas dan menunjuk file yang sudah hilang).
+    File berhash di-cache selamanya oleh klien; manifest memakai max-age
+    biasa.
+    """
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings=settings)
+        self.snapshot_root = os.path.join(os.path.abspath(settings.TALENTS_SNAPSHOT_ROOT), "")
+        self.snapshot_prefix = settings.TALENTS_SNAPSHOT_URL
+        self.snapshot_manifest = self.snapshot_prefix + "manifest.json"
+
+    def __call__(self, request):
+        path = request.path_info
+        if path.startswith(self.snapshot_prefix):
+            static_file = self.find_snapshot_file(path)
+            if static_file is not None:
+                try:
+                    return self.serve(static_file, request)
+                except FileNotFoundError:
+                    pass  # terhapus GC di antara stat dan open: 404 biasa
+        return super().__call__(request)
+
+    def find_snapshot_file(self, url):
+        path = os.path.normpath(os.path.join(self.snapshot_root, url[len(self.snapshot_prefix):]))
+        if not path.startswith(self.snapshot_root) or not os.path.isfile(path):
+            return None
+        try:
+            return self.get_static_file(path, url)
+        except FileNotFoundError:
+            return None
+
+    def immutable_file_test(self, path, url):
+        if url.startswith(self.snapshot_prefix):
+            return url != self.snapshot_manifest
+        return super().immutable_file_test(path, url)
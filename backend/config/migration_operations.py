@@ -0,0 +1,39 @@
+"""
+Operasi migrasi yang hanya berlaku di PostgreSQL.
+
+Index dengan operator class (`text_pattern_ops`) tidak dikenal database
+lain, jadi tidak bisa dideklarasikan di `Meta.indexes` tanpa membuat
+`migrate` gagal di SQLite. Index seperti itu dibuat lewat operasi di sini,
+yang melewati database selain PostgreSQL.
+"""
+
+from django.db import migrations
+
+
+def prefix_search_index(app_label: str, model_name: str, field_name: str, name: str):
+    """
+    Index `UPPER(kolom) text_pattern_ops` untuk pencarian awalan tanpa beda
+    huruf (`istartswith`, pencarian `^field`/`=field` admin). Di SQLite
+    operasi ini tidak melakukan apa-apa.
+    """
+
+    def create(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        model = apps.get_model(app_label, model_name)
+        quote = schema_editor.quote_name
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS %s ON %s (UPPER(%s) text_pattern_ops)"
+            % (
+                quote(name),
+                quote(model._meta.db_table),
+                quote(model._meta.get_field(field_name).column),
+            )
+        )
+
+    def drop(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        schema_editor.execute("DROP INDEX IF EXISTS %s" % schema_editor.quote_name(name))
+
+    return migrations.RunPython(create, drop, elidable=False)
@@ -0,0 +1,49 @@
+"""
+Pemanasan aplikasi sebelum gunicorn melakukan fork (mode preload), supaya
+setiap worker baru langsung mewarisi URLconf, serializer dan cache _meta
+model yang sudah siap, termasuk setelah worker didaur ulang oleh
+`--max-requests`.
+"""
+
+import inspect
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+SERIALIZER_MODULES = ("accounts.serializers", "talents.serializers")
+
+
+def warm() -> None:
+    # URLconf: impor semua modul view dan bangun tabel reverse/resolve.
+    resolver = get_resolver()
+    resolver.url_patterns
+    resolver.reverse_dict
+
+    # Kelas autentikasi, permission, renderer dan parser DRF (string impor).
+    api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    api_settings.DEFAULT_PERMISSION_CLASSES
+    api_settings.DEFAULT_RENDERER_CLASSES
+    api_settings.DEFAULT_PARSER_CLASSES
+
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+    for module_name in SERIALIZER_MODULES:
+        module = __import__(module_name, fromlist=["*"])
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, serializers.Serializer) and cls.__module__ == module_name:
+                cls().fields
+
+    # Isi cache bersama (Redis) sekali di master, sebelum worker menerima
+    # trafik.
+    if settings.CACHE_WARM_ON_STARTUP:
+        from talents.warmup import warm_caches
+
+        warm_caches()
+
+    # Jangan wariskan koneksi database ke proses hasil fork.
+    connections.close_all()
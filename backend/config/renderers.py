@@ -0,0 +1,59 @@
+"""
+Renderer dan parser JSON berbasis orjson. Bila orjson tidak terpasang,
+data tidak bisa diproses orjson, atau format keluaran diatur berbeda dari
+bawaan DRF (UNICODE_JSON/COMPACT_JSON), kembali ke implementasi standar DRF.
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependensi opsional
+    orjson = None
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    # Tipe yang tidak dikenal orjson (Decimal, lazy string, QuerySet, ...)
+    # serta datetime/date/time (OPT_PASSTHROUGH_DATETIME) ditangani encoder
+    # DRF supaya hasilnya sama dengan JSONRenderer, mis. UTC sebagai "Z".
+    return _fallback_encoder.default(obj)
+
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # orjson selalu menghasilkan JSON ringkas tanpa escape non-ASCII,
+        # yaitu bawaan DRF (UNICODE_JSON dan COMPACT_JSON True).
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_default, option=_OPTIONS)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Sama seperti JSONRenderer: escape U+2028/U+2029 agar tetap subset
+        # JavaScript yang valid.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
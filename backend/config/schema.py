@@ -0,0 +1,135 @@
+import functools
+import hashlib
+import threading
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_GET
+
+# drf_yasg (dan seluruh mesin introspeksinya) baru diimpor saat skema atau
+# halaman dokumentasi pertama kali diminta, bukan saat worker start.
+
+MEDIA_TYPES = {"json": "application/json", "yaml": "application/yaml"}
+
+
+def api_info():
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="Talenta Mahasiswa UMS API",
+        default_version="v1",
+        description="REST API untuk aplikasi Talenta Mahasiswa UMS.",
+    )
+
+
+@functools.cache
+def get_schema_view_class():
+    from drf_yasg.views import get_schema_view
+    from rest_framework import permissions
+
+    return get_schema_view(
+        api_info(),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+def ui_view(renderer: str):
+    """
+    View halaman swagger/redoc yang dibuat saat request pertama.
+    """
+
+    @functools.cache
+    def build():
+        return get_schema_view_class().with_ui(
+            renderer, cache_timeout=settings.OPENAPI_SCHEMA_CACHE_MAX_AGE
+        )
+
+    def view(request, *args, **kwargs):
+        return build()(request, *args, **kwargs)
+
+    view.csrf_exempt = True
+    return view
+
+
+_documents: dict[tuple[str, str], bytes] = {}
+_lock = threading.Lock()
+
+
+@functools.cache
+def code_version() -> str:
+    """
+    Versi kode yang menentukan kapan skema perlu dibuat ulang: APP_VERSION
+    dari environment bila diisi saat deploy, atau hash file .py milik app
+    proyek (app di bawah BASE_DIR). Virtualenv, node_modules dan paket
+    pihak ketiga lain tidak ikut di-hash.
+    """
+    if settings.APP_VERSION:
+        return settings.APP_VERSION
+    base_dir = Path(settings.BASE_DIR).resolve()
+    digest = hashlib.sha256()
+    for app_config in sorted(apps.get_app_configs(), key=lambda app: app.name):
+        app_path = Path(app_config.path).resolve()
+        if not app_path.is_relative_to(base_dir):
+            continue
+        for path in sorted(app_path.rglob("*.py")):
+            digest.update(str(path.relative_to(base_dir)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def artifact_path(fmt: str, version: str | None = None) -> Path:
+    return Path(settings.OPENAPI_SCHEMA_DIR) / f"openapi-{version or code_version()}.{fmt}"
+
+
+def generate_schema_document(fmt: str) -> bytes:
+    from drf_yasg.generators import OpenAPISchemaGenerator
+    from drf_yasg.renderers import SwaggerJSONRenderer, SwaggerYAMLRenderer
+
+    renderer = {"json": SwaggerJSONRenderer, "yaml": SwaggerYAMLRenderer}[fmt]
+    schema = OpenAPISchemaGenerator(api_info()).get_schema(request=None, public=True)
+    return renderer().render(schema)
+
+
+def get_schema_document(fmt: str) -> bytes:
+    """
+    Skema untuk versi kode saat ini: dari memori, lalu dari artefak hasil
+    `manage.py generate_openapi_schema`, dan baru dibuat bila keduanya
+    belum ada (sekali per proses).
+    """
+    key = (code_version(), fmt)
+    document = _documents.get(key)
+    if document is None:
+        with _lock:
+            document = _documents.get(key)
+            if document is None:
+                path = artifact_path(fmt)
+                document = path.read_bytes() if path.exists() else generate_schema_document(fmt)
+                _documents[key] = document
+    return document
+
+
+def _format(format=None) -> str:
+    return "yaml" if format == ".yaml" else "json"
+
+
+def schema_etag(request, format=None) -> str:
+    return f"{code_version()}-{_format(format)}"
+
+
+@require_GET
+@condition(etag_func=schema_etag)
+def cached_schema_view(request, format=None):
+    """
+    Sajikan skema OpenAPI yang sudah jadi dengan ETag berbasis versi kode
+    dan header cache panjang, tanpa introspeksi ulang setiap request.
+    """
+    fmt = _format(format)
+    response = HttpResponse(
+        get_schema_document(fmt), content_type=f"{MEDIA_TYPES[fmt]}; charset=utf-8"
+    )
+    patch_cache_control(response, public=True, max_age=settings.OPENAPI_SCHEMA_CACHE_MAX_AGE)
+    return response
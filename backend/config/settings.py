@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 
@@ -27,15 +28,24 @@ INSTALLED_APPS = [
     "rest_framework.authtoken",
     "rest_framework_simplejwt",
     "corsheaders",
-    "drf_yasg",
     # Local apps
+    "config",
     "accounts",
     "talents",
+    "jobs",
 ]
 
+# Dokumentasi API (drf_yasg) bisa dimatikan di worker produksi supaya
+# paketnya tidak ikut dimuat saat start.
+API_DOCS_ENABLED = os.getenv("API_DOCS_ENABLED", "True") == "True"
+if API_DOCS_ENABLED:
+    INSTALLED_APPS.append("drf_yasg")
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "config.middleware.SnapshotWhiteNoiseMiddleware",
+    "config.middleware.CompressionMiddleware",
+    "config.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -82,6 +92,39 @@ DATABASES = {
     }
 }
 
+# Read replica opsional: "host[:port][/nama_db]" dipisah koma, contoh
+# POSTGRES_REPLICAS="replica1.internal,localhost:5432/talentaums_replica".
+# Kredensial dan opsi lain mengikuti database default.
+DATABASE_REPLICAS: list[str] = []
+for _index, _spec in enumerate(filter(None, os.getenv("POSTGRES_REPLICAS", "").split(",")), start=1):
+    _location, _, _name = _spec.strip().partition("/")
+    _host, _, _port = _location.partition(":")
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "PORT": _port or DATABASES["default"]["PORT"],
+        "NAME": _name or DATABASES["default"]["NAME"],
+        "OPTIONS": {**DATABASES["default"]["OPTIONS"], "connect_timeout": 2},
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index}")
+
+# Replica dengan konfigurasi lengkap ala DATABASES (engine apa pun, mis. dua
+# database SQLite lokal untuk pengujian), dalam JSON:
+# DATABASE_REPLICA_CONFIG='{"replica_local": {"ENGINE": "django.db.backends.sqlite3", "NAME": "replica.sqlite3"}}'
+for _alias, _config in json.loads(os.getenv("DATABASE_REPLICA_CONFIG") or "{}").items():
+    DATABASES[_alias] = {"TEST": {"MIRROR": "default"}, **_config}
+    DATABASE_REPLICAS.append(_alias)
+
+DATABASE_ROUTERS = ["config.db_router.ReplicaRouter"]
+# Lama klien di-pin ke primary setelah menulis (read-your-writes).
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv("DATABASE_REPLICA_PIN_SECONDS", "15"))
+# Replica diperiksa ulang tiap N detik; lag di atas MAX_LAG detik = tidak sehat.
+DATABASE_REPLICA_HEALTH_INTERVAL = int(os.getenv("DATABASE_REPLICA_HEALTH_INTERVAL", "10"))
+DATABASE_REPLICA_MAX_LAG = int(os.getenv("DATABASE_REPLICA_MAX_LAG", "30"))
+# Endpoint milik user (/me/...), akun dan admin selalu membaca dari primary.
+DATABASE_REPLICA_EXCLUDED_PATHS = ("/api/talents/me/", "/api/accounts/", "/admin/")
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -118,17 +161,160 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "accounts.User"
 
+# Gunakan Redis bila tersedia supaya cache (dan invalidasinya) berlaku
+# di semua worker gunicorn; tanpa REDIS_URL cache lokal per proses, yang
+# cukup untuk pengembangan dan perintah manajemen. Versi direktori, peta
+# skill, cache principal, state throttle dan hitungan kunjungan baru
+# konsisten antarproses lewat cache bersama, jadi `manage.py check`
+# memperingatkan (config.W001) bila DEBUG=False tanpa cache bersama.
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+        if os.getenv("REDIS_URL")
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+# Lama (detik) principal JWT (user + id profil) disimpan di cache.
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv("AUTH_USER_CACHE_TIMEOUT", "300"))
+
+# Cache hitungan facet direktori publik (detik); dibuang saat data berubah.
+TALENTS_FACETS_CACHE_TIMEOUT = int(os.getenv("TALENTS_FACETS_CACHE_TIMEOUT", "600"))
+
+# Cache urutan id hasil PublicTalentListView: segar selama TIMEOUT detik,
+# lalu masih boleh disajikan (sambil dihitung ulang) selama STALE detik.
+TALENTS_LIST_CACHE_TIMEOUT = int(os.getenv("TALENTS_LIST_CACHE_TIMEOUT", "60"))
+TALENTS_LIST_CACHE_STALE = int(os.getenv("TALENTS_LIST_CACHE_STALE", "300"))
+
+# Batas waktu query (milidetik, 0 = tanpa batas) per endpoint mahal,
+# dipasang di sesi database (config.statement_timeout). Bila terlampaui,
+# endpoint menjawab versi ringan dengan header X-Degraded (hasil cache
+# lama, atau pencarian terbatas pada kolom terindeks) atau 503, bukan 500.
+STATEMENT_TIMEOUTS = {
+    "public-talents": int(os.getenv("STATEMENT_TIMEOUT_PUBLIC_TALENTS", "1500")),
+    "talent-facets": int(os.getenv("STATEMENT_TIMEOUT_TALENT_FACETS", "2000")),
+}
+# Lama (detik) hasil terakhir disimpan sebagai cadangan saat timeout.
+TALENTS_DEGRADED_CACHE_TIMEOUT = int(os.getenv("TALENTS_DEGRADED_CACHE_TIMEOUT", "3600"))
+
+# Changelist admin memakai taksiran planner untuk jumlah baris di atas
+# batas ini (lihat config.paginator), di bawahnya COUNT(*) biasa.
+ADMIN_EXACT_COUNT_LIMIT = int(os.getenv("ADMIN_EXACT_COUNT_LIMIT", "10000"))
+
+# Cache respons gabungan home/ (detik), sengaja pendek.
+TALENTS_HOME_CACHE_TIMEOUT = int(os.getenv("TALENTS_HOME_CACHE_TIMEOUT", "15"))
+
+# Cache detail satu talenta (detik); dibuang saat data direktori berubah.
+TALENTS_DETAIL_CACHE_TIMEOUT = int(os.getenv("TALENTS_DETAIL_CACHE_TIMEOUT", "600"))
+
+# Snapshot statis direktori publik (talents.snapshot, manage.py
+# build_snapshot): dilayani WhiteNoise di TALENTS_SNAPSHOT_URL. Bila ENABLED,
+# perubahan data menjadwalkan build ulang (lewat antrean job) paling cepat
+# DEBOUNCE detik kemudian; file lama dihapus setelah KEEP_SECONDS.
+TALENTS_SNAPSHOT_ENABLED = os.getenv("TALENTS_SNAPSHOT_ENABLED", "False") == "True"
+TALENTS_SNAPSHOT_ROOT = Path(os.getenv("TALENTS_SNAPSHOT_ROOT", BASE_DIR / "snapshot"))
+TALENTS_SNAPSHOT_URL = os.getenv("TALENTS_SNAPSHOT_URL", "/snapshot/")
+TALENTS_SNAPSHOT_PAGE_SIZE = int(os.getenv("TALENTS_SNAPSHOT_PAGE_SIZE", "50"))
+TALENTS_SNAPSHOT_DEBOUNCE = int(os.getenv("TALENTS_SNAPSHOT_DEBOUNCE", "120"))
+TALENTS_SNAPSHOT_KEEP_SECONDS = int(os.getenv("TALENTS_SNAPSHOT_KEEP_SECONDS", "3600"))
+
+# Sinkronisasi delta changes/: jumlah baris log per respons, jeda aman
+# (detik) sebelum baris log dibaca, dan masa simpan log (hari) untuk
+# manage.py prune_profile_changes.
+TALENTS_CHANGES_PAGE_SIZE = int(os.getenv("TALENTS_CHANGES_PAGE_SIZE", "500"))
+TALENTS_CHANGES_SAFETY_LAG = int(os.getenv("TALENTS_CHANGES_SAFETY_LAG", "5"))
+TALENTS_CHANGES_RETENTION_DAYS = int(os.getenv("TALENTS_CHANGES_RETENTION_DAYS", "30"))
+
+# Rentang maksimum (hari) statistik pengunjung me/visitors/.
+TALENTS_VISITORS_MAX_DAYS = int(os.getenv("TALENTS_VISITORS_MAX_DAYS", "366"))
+# Jeda (detik) sebelum kunjungan profil yang dikumpulkan di cache ditulis
+# ke database oleh job talents.flush_profile_views.
+TALENTS_VIEWS_FLUSH_INTERVAL = int(os.getenv("TALENTS_VIEWS_FLUSH_INTERVAL", "60"))
+
+# Jumlah maksimum profil per request endpoint batch/.
+TALENTS_BATCH_MAX_SIZE = int(os.getenv("TALENTS_BATCH_MAX_SIZE", "50"))
+
+# Pemanasan cache (manage.py warm_caches): URL dasar untuk link absolut,
+# query daftar publik yang dipanaskan (dipisah `;`, string kosong = tanpa
+# filter), jumlah halaman per query dan jumlah profil terpopuler.
+# ON_MIGRATE memanaskan setelah `migrate`; ON_STARTUP saat DJANGO_PRELOAD.
+CACHE_WARM_BASE_URL = os.getenv("CACHE_WARM_BASE_URL", "http://localhost:8000")
+CACHE_WARM_QUERIES: list[str] = os.getenv("CACHE_WARM_QUERIES", "").split(";")
+CACHE_WARM_PAGES = int(os.getenv("CACHE_WARM_PAGES", "3"))
+CACHE_WARM_POPULAR_PROFILES = int(os.getenv("CACHE_WARM_POPULAR_PROFILES", "50"))
+CACHE_WARM_WORKERS = int(os.getenv("CACHE_WARM_WORKERS", "4"))
+CACHE_WARM_ON_MIGRATE = os.getenv("CACHE_WARM_ON_MIGRATE", "False") == "True"
+CACHE_WARM_ON_STARTUP = os.getenv("CACHE_WARM_ON_STARTUP", "False") == "True"
+
+# Stream SSE halaman utama (talents.events, hanya di config.asgi): path,
+# interval heartbeat, interval cek perubahan dari proses lain, batas
+# koneksi per proses dan panjang antrean per klien.
+TALENTS_EVENTS_PATH = os.getenv("TALENTS_EVENTS_PATH", "/api/talents/stream/")
+TALENTS_EVENTS_HEARTBEAT = int(os.getenv("TALENTS_EVENTS_HEARTBEAT", "15"))
+TALENTS_EVENTS_POLL_INTERVAL = int(os.getenv("TALENTS_EVENTS_POLL_INTERVAL", "5"))
+TALENTS_EVENTS_MAX_CONNECTIONS = int(os.getenv("TALENTS_EVENTS_MAX_CONNECTIONS", "1000"))
+TALENTS_EVENTS_QUEUE_SIZE = int(os.getenv("TALENTS_EVENTS_QUEUE_SIZE", "100"))
+
+# Indeks vektor skill per proses: dibangun ulang penuh setiap MAX_AGE detik,
+# perubahan dari worker lain disinkronkan paling lambat tiap SYNC_INTERVAL.
+TALENTS_SKILL_INDEX_MAX_AGE = int(os.getenv("TALENTS_SKILL_INDEX_MAX_AGE", "3600"))
+TALENTS_SKILL_INDEX_SYNC_INTERVAL = int(os.getenv("TALENTS_SKILL_INDEX_SYNC_INTERVAL", "30"))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "config.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "config.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    # Rate rata-rata per IP (anonim) atau per user untuk config.throttling.
+    "DEFAULT_THROTTLE_RATES": {
+        "public": os.getenv("THROTTLE_RATE_PUBLIC", "120/min"),
+        "login": os.getenv("THROTTLE_RATE_LOGIN", "10/min"),
+        "register": os.getenv("THROTTLE_RATE_REGISTER", "5/hour"),
+    },
+}
+
+# Jumlah request yang boleh datang beruntun (kapasitas token bucket).
+THROTTLE_BURSTS = {
+    "public": int(os.getenv("THROTTLE_BURST_PUBLIC", "40")),
+    "login": int(os.getenv("THROTTLE_BURST_LOGIN", "5")),
+    "register": int(os.getenv("THROTTLE_BURST_REGISTER", "3")),
 }
 
+# Antrian pekerjaan (app jobs, manage.py run_worker).
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", "5"))
+JOBS_RETRY_BACKOFF = int(os.getenv("JOBS_RETRY_BACKOFF", "10"))
+JOBS_RETRY_BACKOFF_MAX = int(os.getenv("JOBS_RETRY_BACKOFF_MAX", "3600"))
+JOBS_LOCK_TIMEOUT = int(os.getenv("JOBS_LOCK_TIMEOUT", "900"))
+JOBS_POLL_INTERVAL = float(os.getenv("JOBS_POLL_INTERVAL", "1"))
+# Seberapa sering (detik) worker mengembalikan job milik worker mati.
+JOBS_REQUEUE_INTERVAL = float(os.getenv("JOBS_REQUEUE_INTERVAL", "60"))
+# Seberapa sering (detik) worker memperbarui locked_at job yang sedang
+# berjalan; harus jauh di bawah JOBS_LOCK_TIMEOUT.
+JOBS_HEARTBEAT_INTERVAL = float(os.getenv("JOBS_HEARTBEAT_INTERVAL", "60"))
+# Masa simpan (hari) job done/dead sebelum dihapus manage.py prune_jobs.
+JOBS_RETENTION_DAYS = int(os.getenv("JOBS_RETENTION_DAYS", "14"))
+
+# Kompresi respons (config.middleware.CompressionMiddleware).
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+COMPRESSION_EXCLUDED_TYPES = ("text/event-stream",)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
@@ -139,9 +325,11 @@ CORS_ALLOW_ALL_ORIGINS = os.getenv("CORS_ALLOW_ALL_ORIGINS", "True") == "True"
 
 CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if os.getenv("CORS_ALLOWED_ORIGINS") else []
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ["X-Degraded"]
 
 SWAGGER_SETTINGS = {
     "USE_SESSION_AUTH": False,
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
     "SECURITY_DEFINITIONS": {
         "Bearer": {
             "type": "apiKey",
@@ -151,5 +339,12 @@ SWAGGER_SETTINGS = {
     },
 }
 
+REDOC_SETTINGS = {
+    "SPEC_URL": ("schema-json", {"format": ".json"}),
+}
 
-
+# Versi kode untuk skema OpenAPI yang dibuat sekali per deploy
+# (`manage.py generate_openapi_schema`). Kosong = hash source code app proyek.
+APP_VERSION = os.getenv("APP_VERSION", "")
+OPENAPI_SCHEMA_DIR = BASE_DIR / "openapi"
+OPENAPI_SCHEMA_CACHE_MAX_AGE = int(os.getenv("OPENAPI_SCHEMA_CACHE_MAX_AGE", "86400"))
@@ -0,0 +1,127 @@
+"""
+Batas waktu query per endpoint, diterapkan di sesi database.
+
+    with statement_timeout("public-talents"):
+        ...  # query di sini dibatalkan database bila melewati batas
+
+Batas diambil dari setting STATEMENT_TIMEOUTS (milidetik; 0 atau tidak ada
+berarti tanpa batas). Di PostgreSQL batas dipasang lewat
+`SET statement_timeout` pada koneksi yang benar-benar dipakai di dalam blok
+(primary maupun replica) lalu dikembalikan ke default; di SQLite lewat
+progress handler. Query yang dibatalkan menjadi StatementTimeout dan
+dihitung per nama endpoint (lihat timeout_counts), supaya view bisa
+menjawab versi ringan alih-alih 500.
+"""
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, OperationalError, connections
+
+logger = logging.getLogger(__name__)
+
+COUNT_KEY = "db:statement-timeouts:%s"
+# SQLSTATE query_canceled di PostgreSQL.
+QUERY_CANCELED = "57014"
+# Jumlah instruksi VM SQLite di antara pemeriksaan batas waktu.
+SQLITE_CHECK_INTERVAL = 1000
+
+
+class StatementTimeout(OperationalError):
+    """
+    Query di dalam blok statement_timeout dibatalkan karena melewati batas.
+    """
+
+
+def _is_timeout(exc) -> bool:
+    cause = exc.__cause__
+    code = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    return code == QUERY_CANCELED or str(cause) == "interrupted"
+
+
+class _TimeoutWrapper:
+    def __init__(self, name, milliseconds):
+        self.name = name
+        self.milliseconds = milliseconds
+        self.session_set = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        connection = context["connection"]
+        try:
+            if connection.vendor == "postgresql":
+                if connection.alias not in self.session_set:
+                    context["cursor"].cursor.execute(
+                        "SET statement_timeout = %d" % self.milliseconds
+                    )
+                    self.session_set.add(connection.alias)
+                return execute(sql, params, many, context)
+            if connection.vendor == "sqlite":
+                deadline = time.monotonic() + self.milliseconds / 1000
+                connection.connection.set_progress_handler(
+                    lambda: time.monotonic() > deadline, SQLITE_CHECK_INTERVAL
+                )
+                try:
+                    return execute(sql, params, many, context)
+                finally:
+                    connection.connection.set_progress_handler(None, 0)
+            return execute(sql, params, many, context)
+        except OperationalError as exc:
+            if not _is_timeout(exc):
+                raise
+            record_timeout(self.name)
+            raise StatementTimeout(f"Query '{self.name}' melewati {self.milliseconds} ms.") from exc
+
+    def reset(self):
+        for alias in self.session_set:
+            connection = connections[alias]
+            if connection.connection is None or connection.needs_rollback:
+                continue
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET statement_timeout TO DEFAULT")
+            except DatabaseError:
+                # Koneksi yang rusak tidak dipakai ulang; jangan sampai
+                # sesi berikutnya mewarisi batas endpoint ini.
+                connection.close()
+
+
+@contextmanager
+def statement_timeout(name: str):
+    milliseconds = settings.STATEMENT_TIMEOUTS.get(name) or 0
+    if milliseconds <= 0:
+        yield
+        return
+    wrapper = _TimeoutWrapper(name, milliseconds)
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(wrapper))
+        try:
+            yield
+        finally:
+            wrapper.reset()
+
+
+def record_timeout(name: str) -> None:
+    logger.warning("Statement timeout pada %s.", name)
+    key = COUNT_KEY % name
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:  # terhapus di antara add dan incr
+        cache.set(key, 1, None)
+
+
+def timeout_counts() -> dict:
+    """
+    Jumlah timeout per endpoint sejak penghitung terakhir direset.
+    """
+    names = list(settings.STATEMENT_TIMEOUTS)
+    counts = cache.get_many([COUNT_KEY % name for name in names])
+    return {name: counts.get(COUNT_KEY % name, 0) for name in names}
+
+
+def reset_timeout_counts() -> None:
+    cache.delete_many([COUNT_KEY % name for name in settings.STATEMENT_TIMEOUTS])
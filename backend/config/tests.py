@@ -0,0 +1,167 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from talents.models import StudentProfile
+
+from .statement_timeout import (
+    StatementTimeout,
+    reset_timeout_counts,
+    statement_timeout,
+    timeout_counts,
+)
+from .throttling import TokenBucketThrottle
+
+
+class BucketThrottle(TokenBucketThrottle):
+    scope = "test"
+    rate = "6/min"  # satu token tiap 10 detik
+
+
+@override_settings(THROTTLE_BURSTS={"test": 3})
+class TokenBucketThrottleTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = 1_000_000.0
+        self.factory = RequestFactory()
+
+    def hit(self, ip="10.0.0.1"):
+        request = self.factory.get("/", REMOTE_ADDR=ip)
+        request.user = AnonymousUser()
+        throttle = BucketThrottle()
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(request, None), throttle.wait()
+
+    def test_burst_then_reject_with_wait(self):
+        for _ in range(3):
+            self.assertEqual(self.hit(), (True, None))
+        allowed, wait = self.hit()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 10, places=2)
+
+    def test_rejected_request_does_not_consume_a_token(self):
+        for _ in range(3):
+            self.hit()
+        self.assertFalse(self.hit()[0])
+        self.assertFalse(self.hit()[0])
+        self.now += 10
+        self.assertTrue(self.hit()[0])
+        self.assertFalse(self.hit()[0])
+
+    def test_bucket_refills_while_idle(self):
+        for _ in range(3):
+            self.hit()
+        self.now += 60
+        for _ in range(3):
+            self.assertTrue(self.hit()[0])
+        self.assertFalse(self.hit()[0])
+
+    def test_clients_have_separate_buckets(self):
+        for _ in range(3):
+            self.hit("10.0.0.1")
+        self.assertFalse(self.hit("10.0.0.1")[0])
+        self.assertTrue(self.hit("10.0.0.2")[0])
+
+
+class DirtyFieldsMixinTests(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create(
+            username="budi", email="l200230277@student.ums.ac.id", full_name="Budi"
+        )
+        StudentProfile.objects.create(
+            user=user, nim="L200230277", prodi="Informatika", angkatan="2023"
+        )
+        self.profile = StudentProfile.objects.get(nim="L200230277")
+        self.saved_fields = []
+        post_save.connect(self.on_save, sender=StudentProfile)
+        self.addCleanup(post_save.disconnect, self.on_save, sender=StudentProfile)
+
+    def on_save(self, sender, instance, update_fields=None, **kwargs):
+        self.saved_fields.append(update_fields)
+
+    def test_unchanged_save_is_skipped(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.profile.save()
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(self.saved_fields, [])
+
+    def test_only_changed_and_auto_now_fields_are_written(self):
+        self.profile.headline = "Backend developer"
+        self.assertEqual(self.profile.get_dirty_fields(), {"headline"})
+        self.profile.save()
+        self.assertEqual(self.saved_fields, [frozenset({"headline", "updated_at"})])
+        self.assertEqual(self.profile.get_dirty_fields(), set())
+
+    def test_setting_the_same_value_is_not_dirty(self):
+        self.profile.prodi = "Informatika"
+        self.assertEqual(self.profile.get_dirty_fields(), set())
+
+    def test_update_fields_is_limited_to_dirty_fields(self):
+        self.profile.headline = "Backend developer"
+        self.profile.save(update_fields=["headline", "bio"])
+        self.assertEqual(self.saved_fields, [frozenset({"headline", "updated_at"})])
+
+        self.profile.bio = "Halo"
+        self.profile.save(update_fields=["headline"])
+        self.assertEqual(len(self.saved_fields), 1)
+        self.assertEqual(self.profile.get_dirty_fields(), {"bio"})
+
+    def test_expression_is_tracked_after_refresh(self):
+        self.profile.views_count = F("views_count") + 1
+        self.profile.save()
+        self.assertIn("views_count", self.saved_fields[0])
+        self.profile.refresh_from_db(fields=["views_count"])
+        self.assertEqual(self.profile.views_count, 1)
+        self.assertEqual(self.profile.get_dirty_fields(), set())
+
+    def test_unsaved_instance_writes_every_field(self):
+        profile = StudentProfile(nim="L200230278", prodi="Informatika", angkatan="2024")
+        self.assertIn("nim", profile.get_dirty_fields())
+        self.assertNotIn("id", profile.get_dirty_fields())
+
+
+SLOW_QUERY = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 3000000) "
+    "SELECT COUNT(*) FROM c"
+)
+
+
+@override_settings(STATEMENT_TIMEOUTS={"fast": 1, "unlimited": 0})
+class StatementTimeoutSQLiteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        reset_timeout_counts()
+
+    def run_query(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchone()[0]
+
+    def test_slow_query_is_interrupted_and_counted(self):
+        with self.assertRaises(StatementTimeout):
+            with statement_timeout("fast"):
+                self.run_query(SLOW_QUERY)
+        self.assertEqual(timeout_counts(), {"fast": 1, "unlimited": 0})
+
+    def test_limit_is_removed_after_the_block(self):
+        with statement_timeout("fast"):
+            self.assertEqual(self.run_query("SELECT 1"), 1)
+        self.assertEqual(self.run_query(SLOW_QUERY), 3000000)
+
+    def test_zero_or_unknown_name_means_no_limit(self):
+        with statement_timeout("unlimited"):
+            self.assertEqual(self.run_query(SLOW_QUERY), 3000000)
+        with statement_timeout("unknown"):
+            self.assertEqual(self.run_query("SELECT 1"), 1)
+
+    def test_other_errors_are_not_timeouts(self):
+        with self.assertRaises(OperationalError) as raised:
+            with statement_timeout("fast"):
+                self.run_query("SELECT * FROM tabel_tidak_ada")
+        self.assertNotIsInstance(raised.exception, StatementTimeout)
+        self.assertEqual(timeout_counts()["fast"], 0)
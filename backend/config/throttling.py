@@ -0,0 +1,78 @@
+"""
+Throttle token bucket (algoritma GCRA) yang disimpan di cache Django
+dengan operasi `incr` atomik, sehingga batasnya berlaku bersama di semua
+worker gunicorn selama cache-nya dipakai bersama (mis. Redis).
+
+Rate diambil dari `REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"][scope]` dan
+ukuran burst dari `THROTTLE_BURSTS[scope]`. Identitas klien adalah user
+untuk request terautentikasi dan IP untuk anonim.
+"""
+
+from django.conf import settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    cache_format = "throttle:bucket:%(scope)s:%(ident)s"
+
+    def __init__(self):
+        super().__init__()
+        # Jarak antar token dan kapasitas bucket, dalam milidetik.
+        self.interval = max(int(self.duration * 1000 / self.num_requests), 1)
+        self.burst = settings.THROTTLE_BURSTS.get(self.scope, self.num_requests)
+        self.capacity = self.burst * self.interval
+        self.retry_after = None
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{self.get_ident(request)}"
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        now = int(self.timer() * 1000)
+        timeout = self.capacity // 1000 + 1
+        # Nilai di cache adalah "theoretical arrival time" (TAT). Setiap
+        # request memesan satu interval dengan incr atomik.
+        try:
+            tat = self.cache.incr(key, self.interval)
+        except ValueError:
+            self.cache.add(key, now, timeout)
+            tat = self.cache.incr(key, self.interval)
+        if tat - self.interval < now:
+            # Bucket sempat terisi lagi saat idle: majukan TAT ke sekarang.
+            # Penanda per detik mencegah beberapa request yang datang
+            # bersamaan memajukannya berkali-kali.
+            if self.cache.add(f"{key}:catchup:{now // 1000}", 1, 2):
+                tat = self.cache.incr(key, now - (tat - self.interval))
+            else:
+                tat = max(tat, now + self.interval)
+        self.cache.touch(key, timeout)
+
+        if tat - now <= self.capacity:
+            return True
+        self.cache.decr(key, self.interval)
+        self.retry_after = (tat - now - self.capacity) / 1000
+        return False
+
+    def wait(self):
+        return self.retry_after
+
+
+class PublicThrottle(TokenBucketThrottle):
+    scope = "public"
+
+
+class LoginThrottle(TokenBucketThrottle):
+    scope = "login"
+
+
+class RegisterThrottle(TokenBucketThrottle):
+    scope = "register"
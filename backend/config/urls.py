@@ -3,37 +3,23 @@ from django.urls import include, path, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Talenta Mahasiswa UMS API",
-        default_version="v1",
-        description="REST API untuk aplikasi Talenta Mahasiswa UMS.",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from .schema import cached_schema_view, ui_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/accounts/", include("accounts.urls")),
     path("api/talents/", include("talents.urls")),
-    re_path(
-        r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
-        name="schema-json",
-    ),
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
-    path(
-        "redoc/",
-        schema_view.with_ui("redoc", cache_timeout=0),
-        name="schema-redoc",
-    ),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+if settings.API_DOCS_ENABLED:
+    urlpatterns += [
+        re_path(
+            r"^swagger(?P<format>\.json|\.yaml)$",
+            cached_schema_view,
+            name="schema-json",
+        ),
+        # Halaman UI hanya berisi HTML; spesifikasinya diambil dari schema-json
+        # (lihat SPEC_URL di settings) sehingga ikut memakai skema yang di-cache.
+        path("swagger/", ui_view("swagger"), name="schema-swagger-ui"),
+        path("redoc/", ui_view("redoc"), name="schema-redoc"),
+    ]
@@ -6,5 +6,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
 
+if os.getenv("DJANGO_PRELOAD") == "True":
+    from .preload import warm
+
+    warm()
+
 
 
@@ -0,0 +1,19 @@
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+# Mode preload: aplikasi dimuat dan dipanaskan sekali di master
+# (config.preload.warm), lalu worker cukup fork tanpa mengulang impor.
+preload_app = os.getenv("GUNICORN_PRELOAD", "False") == "True"
+if preload_app:
+    os.environ.setdefault("DJANGO_PRELOAD", "True")
+
+# Mode ASGI (uvicorn worker) diperlukan untuk stream SSE halaman utama.
+if os.getenv("GUNICORN_ASGI", "False") == "True":
+    worker_class = "uvicorn.workers.UvicornWorker"
+    wsgi_app = "config.asgi:application"
+else:
+    wsgi_app = "config.wsgi:application"
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "status", "attempts", "max_attempts", "run_at", "finished_at")
+    list_filter = ("status", "task")
+    search_fields = ("task",)
+    readonly_fields = ("locked_at", "locked_by", "last_error", "created_at", "finished_at")
+    actions = ["requeue"]
+
+    @admin.action(description="Antrekan ulang job terpilih")
+    def requeue(self, request, queryset):
+        queryset.update(
+            status=Job.Status.QUEUED, attempts=0, run_at=timezone.now(), locked_at=None, locked_by=""
+        )
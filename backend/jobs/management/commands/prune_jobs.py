@@ -0,0 +1,24 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.queue import prune_finished
+
+
+class Command(BaseCommand):
+    help = "Hapus job yang sudah selesai (done/dead) dan lebih tua dari masa simpan."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.JOBS_RETENTION_DAYS,
+            help="Masa simpan job dalam hari (default JOBS_RETENTION_DAYS).",
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - datetime.timedelta(days=options["days"])
+        deleted = prune_finished(older_than)
+        self.stdout.write(self.style.SUCCESS(f"{deleted} job dihapus."))
@@ -0,0 +1,103 @@
+import signal
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connections
+
+from jobs.queue import claim, heartbeat, requeue_stale, run, worker_name
+
+
+class Command(BaseCommand):
+    help = "Jalankan worker antrian pekerjaan (jobs.Job)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=1, help="Jumlah thread worker.")
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help="Jeda (detik) saat antrian kosong.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Kerjakan job yang sudah siap lalu berhenti.",
+        )
+
+    def handle(self, *args, **options):
+        self.stopping = threading.Event()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        # Job `running` milik worker yang mati dikembalikan ke antrian saat
+        # start dan berkala setiap JOBS_REQUEUE_INTERVAL detik selama berjalan.
+        self.requeue_lock = threading.Lock()
+        self.next_requeue = 0.0
+
+        name = worker_name()
+        workers = [f"{name}:{index}" for index in range(options["concurrency"])]
+        threads = [
+            threading.Thread(target=self.loop, args=(worker, options["poll_interval"], options["once"]))
+            for worker in workers
+        ]
+        # Selama thread worker berjalan, locked_at job-nya diperbarui berkala
+        # supaya job yang lama tidak dikembalikan ke antrian oleh worker lain.
+        self.finished = threading.Event()
+        beat = threading.Thread(target=self.heartbeat, args=(workers,))
+        self.stdout.write(f"Worker {name} berjalan dengan {len(threads)} thread.")
+        for thread in threads:
+            thread.start()
+        beat.start()
+        for thread in threads:
+            thread.join()
+        self.finished.set()
+        beat.join()
+        self.stdout.write("Worker berhenti.")
+
+    def stop(self, signum, frame):
+        self.stdout.write("Menunggu job yang sedang berjalan selesai...")
+        self.stopping.set()
+
+    def requeue_if_due(self):
+        with self.requeue_lock:
+            now = time.monotonic()
+            if now < self.next_requeue:
+                return
+            self.next_requeue = now + settings.JOBS_REQUEUE_INTERVAL
+        requeued = requeue_stale()
+        if requeued:
+            self.stdout.write(f"{requeued} job terkunci dikembalikan ke antrian.")
+
+    def heartbeat(self, workers):
+        try:
+            while not self.finished.wait(settings.JOBS_HEARTBEAT_INTERVAL):
+                close_old_connections()
+                try:
+                    heartbeat(workers)
+                except DatabaseError as exc:
+                    self.stderr.write(f"Heartbeat gagal: {exc}")
+        finally:
+            connections.close_all()
+
+    def loop(self, worker, poll_interval, once):
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                self.requeue_if_due()
+                jobs = claim(worker)
+                if not jobs:
+                    if once:
+                        return
+                    self.stopping.wait(poll_interval)
+                    continue
+                for job in jobs:
+                    started = time.monotonic()
+                    ok = run(job)
+                    self.stdout.write(
+                        f"[{worker}] {job.task} #{job.pk} "
+                        f"{'selesai' if ok else 'gagal'} ({time.monotonic() - started:.2f} dtk)"
+                    )
+        finally:
+            connections.close_all()
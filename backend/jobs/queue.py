@@ -0,0 +1,147 @@
+"""
+Antrian pekerjaan sederhana di database (tanpa broker).
+
+Daftarkan fungsi dengan `@task` di modul `<app>/tasks.py`, lalu antrekan
+dengan `enqueue("nama.task", {...})`. Baris job ditulis di transaksi yang
+sama dengan pemanggil, sehingga worker baru melihatnya setelah transaksi
+tersebut commit (dan ikut batal bila transaksinya rollback). Jalankan
+worker dengan `manage.py run_worker`.
+"""
+
+import os
+import random
+import socket
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import Job
+
+_registry: dict = {}
+
+
+def task(name: str):
+    def decorator(func):
+        _registry[name] = func
+        return func
+
+    return decorator
+
+
+def get_task(name: str):
+    if name not in _registry:
+        autodiscover_modules("tasks")
+    return _registry[name]
+
+
+def enqueue(name: str, payload: dict | None = None, *, delay: float = 0, max_attempts: int | None = None) -> Job:
+    return Job.objects.create(
+        task=name,
+        payload=payload or {},
+        run_at=timezone.now() + timedelta(seconds=delay),
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+    )
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim(worker: str, limit: int = 1) -> list[Job]:
+    """
+    Ambil hingga `limit` job yang siap jalan dan tandai sebagai running.
+    Di PostgreSQL memakai SELECT ... FOR UPDATE SKIP LOCKED; di database
+    lain, UPDATE bersyarat status memastikan satu job hanya diambil satu
+    worker.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        qs = Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=now).order_by("run_at", "id")
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+        claimed = []
+        for job in qs[:limit]:
+            updated = Job.objects.filter(pk=job.pk, status=Job.Status.QUEUED).update(
+                status=Job.Status.RUNNING,
+                locked_at=now,
+                locked_by=worker,
+                attempts=F("attempts") + 1,
+            )
+            if updated:
+                job.status, job.locked_at, job.locked_by = Job.Status.RUNNING, now, worker
+                job.attempts += 1
+                claimed.append(job)
+    return claimed
+
+
+def backoff_seconds(attempts: int) -> float:
+    base = settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return min(base, settings.JOBS_RETRY_BACKOFF_MAX) * random.uniform(0.8, 1.2)
+
+
+def run(job: Job) -> bool:
+    """
+    Jalankan satu job yang sudah di-claim. Gagal -> dijadwalkan ulang dengan
+    backoff eksponensial, atau menjadi `dead` setelah max_attempts.
+    """
+    try:
+        get_task(job.task)(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.Status.DEAD, last_error=error, finished_at=timezone.now()
+            )
+        else:
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.Status.QUEUED,
+                last_error=error,
+                run_at=timezone.now() + timedelta(seconds=backoff_seconds(job.attempts)),
+            )
+        return False
+    Job.objects.filter(pk=job.pk).update(status=Job.Status.DONE, finished_at=timezone.now())
+    return True
+
+
+def heartbeat(workers: list[str]) -> int:
+    """
+    Perbarui `locked_at` job yang sedang dikerjakan `workers`, supaya job
+    yang berjalan lama tidak dianggap milik worker mati oleh requeue_stale.
+    """
+    return Job.objects.filter(status=Job.Status.RUNNING, locked_by__in=workers).update(
+        locked_at=timezone.now()
+    )
+
+
+def requeue_stale(timeout: int | None = None) -> int:
+    """
+    Kembalikan job `running` yang terkunci terlalu lama (worker mati) ke
+    antrian. Percobaan itu tetap terhitung (attempts sudah dinaikkan saat
+    claim), sehingga job yang selalu mematikan worker menjadi `dead` setelah
+    max_attempts alih-alih diulang tanpa akhir.
+    """
+    cutoff = timezone.now() - timedelta(seconds=timeout or settings.JOBS_LOCK_TIMEOUT)
+    stale = Job.objects.filter(status=Job.Status.RUNNING, locked_at__lt=cutoff)
+    error = "Worker berhenti atau hilang saat menjalankan job."
+    dead = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.Status.DEAD, last_error=error, finished_at=timezone.now()
+    )
+    requeued = stale.update(
+        status=Job.Status.QUEUED, last_error=error, locked_at=None, locked_by=""
+    )
+    return dead + requeued
+
+
+def prune_finished(older_than) -> int:
+    """
+    Hapus job `done`/`dead` yang selesai sebelum `older_than`.
+    """
+    deleted, _ = Job.objects.filter(
+        status__in=[Job.Status.DONE, Job.Status.DEAD], finished_at__lt=older_than
+    ).delete()
+    return deleted
@@ -1,10 +1,13 @@
 from django.contrib import admin
 
+from config.paginator import EstimatedCountPaginator
+
 from .models import (
     Endorsement,
     Experience,
     PortfolioProject,
     Skill,
+    SkillAlias,
     SocialLink,
     StudentProfile,
     StudentSkill,
@@ -12,47 +15,88 @@ from .models import (
 )
 
 
+class ScalableAdmin(admin.ModelAdmin):
+    """
+    Dasar admin untuk tabel besar: jumlah baris ditaksir (tanpa COUNT(*)
+    penuh) dan hitungan "total tanpa filter" tidak ditampilkan.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
 @admin.register(StudentProfile)
-class StudentProfileAdmin(admin.ModelAdmin):
+class StudentProfileAdmin(ScalableAdmin):
     list_display = ("nim", "user", "prodi", "angkatan", "is_public", "is_active")
-    search_fields = ("nim", "user__full_name", "user__email", "prodi")
+    list_select_related = ("user",)
+    # `=` (iexact) dan `^` (istartswith) memakai index UPPER(...) pada
+    # nim, email dan nama; pencarian "mengandung" memindai seluruh tabel.
+    search_fields = ("=nim", "^user__email", "^user__full_name")
     list_filter = ("prodi", "angkatan", "is_public", "is_active")
+    autocomplete_fields = ("user",)
 
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
-    search_fields = ("name",)
+    list_display = ("name", "normalized_name")
+    search_fields = ("name", "normalized_name")
+
+
+@admin.register(SkillAlias)
+class SkillAliasAdmin(admin.ModelAdmin):
+    list_display = ("alias", "skill")
+    list_select_related = ("skill",)
+    search_fields = ("alias", "skill__name")
+    autocomplete_fields = ("skill",)
 
 
 @admin.register(StudentSkill)
-class StudentSkillAdmin(admin.ModelAdmin):
+class StudentSkillAdmin(ScalableAdmin):
     list_display = ("student", "skill", "level", "endorsement_count")
-    search_fields = ("student__nim", "skill__name")
+    list_select_related = ("student__user", "skill")
+    search_fields = ("=student__nim", "skill__name")
+    autocomplete_fields = ("student", "skill")
 
 
 @admin.register(Experience)
-class ExperienceAdmin(admin.ModelAdmin):
+class ExperienceAdmin(ScalableAdmin):
     list_display = ("student", "title", "company", "start_date", "end_date")
+    list_select_related = ("student__user",)
+    search_fields = ("=student__nim",)
+    autocomplete_fields = ("student",)
 
 
 @admin.register(PortfolioProject)
-class PortfolioProjectAdmin(admin.ModelAdmin):
+class PortfolioProjectAdmin(ScalableAdmin):
     list_display = ("student", "title")
+    list_select_related = ("student__user",)
+    search_fields = ("=student__nim",)
+    autocomplete_fields = ("student",)
 
 
 @admin.register(SocialLink)
-class SocialLinkAdmin(admin.ModelAdmin):
+class SocialLinkAdmin(ScalableAdmin):
     list_display = ("student", "platform", "url_or_handle")
+    list_select_related = ("student__user",)
+    search_fields = ("=student__nim",)
+    autocomplete_fields = ("student",)
 
 
 @admin.register(ProfileView)
-class ProfileViewAdmin(admin.ModelAdmin):
+class ProfileViewAdmin(ScalableAdmin):
     list_display = ("student", "viewer_ip", "viewed_at")
+    list_select_related = ("student__user",)
+    search_fields = ("=student__nim",)
+    raw_id_fields = ("student",)
 
 
 @admin.register(Endorsement)
-class EndorsementAdmin(admin.ModelAdmin):
+class EndorsementAdmin(ScalableAdmin):
     list_display = ("endorsed_skill", "endorser", "created_at")
-
-
-
+    list_select_related = (
+        "endorsed_skill__student",
+        "endorsed_skill__skill",
+        "endorser__user",
+    )
+    search_fields = ("=endorser__nim", "=endorsed_skill__student__nim")
+    autocomplete_fields = ("endorsed_skill", "endorser")
@@ -8,3 +8,14 @@ class TalentsConfig(AppConfig):
 
 
 
+
+    def ready(self) -> None:
+        from django.conf import settings
+        from django.db.models.signals import post_migrate
+
+        from . import signals  # noqa: F401
+
+        if settings.CACHE_WARM_ON_MIGRATE:
+            from .warmup import warm_after_migrate
+
+            post_migrate.connect(warm_after_migrate, sender=self)
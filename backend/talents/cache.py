@@ -0,0 +1,123 @@
+import contextvars
+import hashlib
+import json
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connections
+
+from config.statement_timeout import StatementTimeout
+
+DIRECTORY_VERSION_KEY = "talents:directory:version"
+# Batas waktu kunci single-flight, jaga-jaga bila pemegangnya mati.
+LOCK_TIMEOUT = 30
+
+
+def directory_version() -> int:
+    version = cache.get(DIRECTORY_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(DIRECTORY_VERSION_KEY, version, None)
+    return version
+
+
+def bump_directory_version() -> None:
+    """
+    Invalidasi semua cache turunan direktori publik sekaligus: kunci lama
+    tidak lagi dirujuk dan kedaluwarsa sendiri.
+    """
+    try:
+        cache.incr(DIRECTORY_VERSION_KEY)
+    except ValueError:
+        cache.set(DIRECTORY_VERSION_KEY, 2, None)
+
+
+def directory_cache_key(prefix: str, params: dict | None = None, versioned: bool = True) -> str:
+    """
+    Kunci cache untuk turunan direktori. Kunci `versioned` otomatis basi
+    saat direktori berubah; kunci tanpa versi dipakai `get_or_compute`,
+    yang memeriksa versi di dalam entri supaya nilai lama masih bisa
+    disajikan sebagai stale.
+    """
+    digest = hashlib.md5(
+        json.dumps(params or {}, sort_keys=True).encode()
+    ).hexdigest()
+    if not versioned:
+        return f"talents:{prefix}:{digest}"
+    return f"talents:{prefix}:v{directory_version()}:{digest}"
+
+
+def _store(key, value, version, fresh_for, stale_for):
+    entry = {"value": value, "version": version, "fresh_until": time.time() + fresh_for}
+    cache.set(key, entry, fresh_for + stale_for)
+
+
+def _revalidate(key, compute, version, fresh_for, stale_for, lock_key):
+    try:
+        _store(key, compute(), version, fresh_for, stale_for)
+    except StatementTimeout:
+        pass  # sudah dicatat; entri lama tetap disajikan sampai kedaluwarsa
+    except Exception:
+        # Nilai tidak lagi bisa dihitung (mis. halaman di luar jangkauan
+        # setelah hasil menyusut): buang entri lama, request berikutnya
+        # menghitung ulang sendiri dan mendapat galatnya.
+        cache.delete(key)
+    finally:
+        cache.delete(lock_key)
+        connections.close_all()
+
+
+def refresh(key, compute, fresh_for, stale_for):
+    """
+    Hitung ulang entri `get_or_compute` secara sinkron, apa pun kondisinya
+    (dipakai saat pemanasan cache).
+    """
+    version = directory_version()
+    value = compute()
+    _store(key, value, version, fresh_for, stale_for)
+    return value
+
+
+def get_or_compute(key, compute, fresh_for, stale_for, wait=2.0):
+    """
+    Cache dengan stale-while-revalidate dan single-flight.
+
+    Entri segar (belum lewat `fresh_for` detik dan versi direktori masih
+    sama) langsung dikembalikan. Entri basi tetap disajikan selama
+    `stale_for` detik berikutnya sementara satu worker saja (pemegang
+    kunci `cache.add`) menghitung ulang di background. Bila belum ada
+    entri sama sekali, request lain menunggu hasil pemegang kunci paling
+    lama `wait` detik sebelum menghitung sendiri.
+    """
+    version = directory_version()
+    entry = cache.get(key)
+    if entry is not None and entry["version"] == version and entry["fresh_until"] > time.time():
+        return entry["value"]
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        if entry is not None:
+            # Context request (mis. routing replica) ikut dibawa ke thread.
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(_revalidate, key, compute, version, fresh_for, stale_for, lock_key),
+                daemon=True,
+            ).start()
+            return entry["value"]
+        try:
+            value = compute()
+            _store(key, value, version, fresh_for, stale_for)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    if entry is not None:
+        return entry["value"]
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["value"]
+    return compute()
@@ -0,0 +1,112 @@
+"""
+Log perubahan untuk sinkronisasi delta direktori publik
+(`GET /api/talents/changes/?since=<token>`).
+
+Setiap perubahan profil atau baris turunannya (skill, pengalaman, proyek,
+tautan, endorsement, nama/email user) mencatat id profil ke ProfileChange
+setelah transaksi commit. Token adalah id baris log terakhir yang sudah
+dibaca, jadi satu sinkronisasi hanya membaca baris log sesudahnya (lewat
+primary key) dan profil yang disebut di sana.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from config.db_router import use_primary
+
+from .directory import refresh_directory_entries
+from .models import ProfileChange, StudentProfile, StudentSkill
+
+
+class TokenExpired(Exception):
+    """
+    Token lebih tua dari log yang masih disimpan; klien harus sinkron ulang
+    penuh lalu melanjutkan dari token terbaru.
+    """
+
+
+def log_profile_changes(profile_ids) -> None:
+    """
+    Catat perubahan profil setelah transaksi yang sedang berjalan commit,
+    sekaligus perbarui barisnya di read model direktori
+    (talents.directory). Ditulis sesudah commit supaya urutan id log
+    mengikuti urutan data terlihat oleh pembaca.
+    """
+    ids = {pk for pk in profile_ids if pk is not None}
+    if ids:
+        transaction.on_commit(lambda: _record_changes(ids))
+
+
+def _record_changes(ids) -> None:
+    refresh_directory_entries(ids)
+    ProfileChange.objects.bulk_create([ProfileChange(student_id=pk) for pk in ids])
+
+
+def log_skill_holders(skill_ids) -> None:
+    """
+    Catat semua profil pemilik skill (mis. saat nama skill berubah).
+    """
+    log_profile_changes(
+        StudentSkill.objects.filter(skill_id__in=skill_ids).values_list("student_id", flat=True)
+    )
+
+
+def head_token() -> int:
+    with use_primary():
+        latest = ProfileChange.objects.order_by("-id").values_list("id", flat=True).first()
+    return latest or 0
+
+
+def changes_since(since: int, limit: int):
+    """
+    Perubahan setelah token `since`: (id profil yang masih tampil,
+    id profil yang harus dihapus mirror, token berikutnya, masih ada sisa).
+
+    Baris log yang lebih muda dari TALENTS_CHANGES_SAFETY_LAG detik belum
+    dibaca, supaya baris dari transaksi yang commit hampir bersamaan tidak
+    terlewat oleh token yang sudah maju. Semua dibaca dari primary.
+    """
+    cutoff = timezone.now() - datetime.timedelta(seconds=settings.TALENTS_CHANGES_SAFETY_LAG)
+    with use_primary():
+        if since:
+            oldest = ProfileChange.objects.aggregate(oldest=Min("id"))["oldest"]
+            if oldest is not None and since < oldest - 1:
+                raise TokenExpired
+        rows = list(
+            ProfileChange.objects.filter(id__gt=since, created_at__lte=cutoff)
+            .order_by("id")
+            .values_list("id", "student_id")[: limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        changed = list(dict.fromkeys(student_id for _, student_id in rows))
+        visible = set(
+            StudentProfile.objects.filter(
+                pk__in=changed, is_public=True, is_active=True
+            ).values_list("id", flat=True)
+        )
+    next_token = rows[-1][0] if rows else since
+    return (
+        [pk for pk in changed if pk in visible],
+        [pk for pk in changed if pk not in visible],
+        next_token,
+        has_more,
+    )
+
+
+def prune_changes(older_than: datetime.datetime) -> int:
+    """
+    Hapus log lebih tua dari `older_than`; token sebelum batas itu menjadi
+    kedaluwarsa (TokenExpired).
+    """
+    # Baris terbaru selalu disisakan sebagai patokan kedaluwarsa token.
+    deleted, _ = (
+        ProfileChange.objects.filter(created_at__lt=older_than)
+        .exclude(pk=head_token())
+        .delete()
+    )
+    return deleted
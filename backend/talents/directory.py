@@ -0,0 +1,109 @@
+"""
+Read model direktori publik (DirectoryEntry): satu baris per profil publik
+dan aktif dengan field tampilan, teks skill dan kunci urutan yang sudah
+digabung, sehingga daftar publik dan pencarian cukup membaca satu tabel
+tanpa join. Facet mengelompokkan baris ini (lihat talents.facets).
+
+Baris diperbarui secara inkremental (upsert, atau dihapus bila profil tidak
+lagi tampil) setelah transaksi commit, untuk setiap profil yang dicatat
+talents.changes.log_profile_changes. `manage.py rebuild_directory`
+membangun ulang seluruh tabel bila diperlukan.
+"""
+
+from django.db.models import F
+
+from .filters import folded
+from .models import DirectoryEntry
+
+SKILL_SEPARATOR = "\n"
+ENTRY_FIELDS = (
+    "full_name",
+    "nim",
+    "prodi",
+    "angkatan",
+    "headline",
+    "skill_text",
+    "search_text",
+    "created_at",
+    "updated_at",
+    "views_count",
+    "skill_count",
+    "endorsement_total",
+    "completeness",
+    "experience_months",
+    "currently_employed",
+)
+
+
+def _entry(entry_model, profile):
+    skill_text = SKILL_SEPARATOR.join(
+        sorted(folded(item.skill.name) for item in profile.student_skills.all())
+    )
+    full_name = profile.user.full_name
+    return entry_model(
+        profile_id=profile.pk,
+        full_name=full_name,
+        nim=profile.nim,
+        prodi=profile.prodi,
+        angkatan=profile.angkatan,
+        headline=profile.headline,
+        skill_text=skill_text,
+        search_text=SKILL_SEPARATOR.join(
+            [folded(full_name), folded(profile.nim), folded(profile.prodi), skill_text]
+        ),
+        created_at=profile.created_at,
+        updated_at=profile.updated_at,
+        views_count=profile.views_count,
+        skill_count=profile.skill_count,
+        endorsement_total=profile.endorsement_total,
+        completeness=profile.completeness,
+        experience_months=profile.experience_months,
+        currently_employed=profile.currently_employed,
+    )
+
+
+def refresh_directory_entries(profile_ids, profile_model=None) -> None:
+    """
+    Selaraskan baris read model untuk `profile_ids` dengan data profilnya.
+    `profile_model` untuk model historis di migrasi.
+    """
+    if profile_model is None:
+        from .models import StudentProfile as profile_model
+    entry_model = profile_model._meta.get_field("directory_entry").related_model
+    ids = list(profile_ids)
+    profiles = list(
+        profile_model.objects.filter(pk__in=ids, is_public=True, is_active=True)
+        .select_related("user")
+        .prefetch_related("student_skills__skill")
+    )
+    entry_model.objects.filter(profile_id__in=ids).exclude(
+        profile_id__in=[profile.pk for profile in profiles]
+    ).delete()
+    entry_model.objects.bulk_create(
+        [_entry(entry_model, profile) for profile in profiles],
+        update_conflicts=True,
+        unique_fields=["profile"],
+        update_fields=ENTRY_FIELDS,
+        batch_size=500,
+    )
+
+
+def rebuild_directory(chunk_size=1000, profile_model=None) -> int:
+    """
+    Bangun ulang seluruh read model per potongan `chunk_size` profil.
+    Mengembalikan jumlah baris setelahnya.
+    """
+    if profile_model is None:
+        from .models import StudentProfile as profile_model
+    entry_model = profile_model._meta.get_field("directory_entry").related_model
+    ids = list(profile_model.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(ids), chunk_size):
+        refresh_directory_entries(ids[start:start + chunk_size], profile_model=profile_model)
+    return entry_model.objects.count()
+
+
+def count_directory_view(profile_id, views=1) -> None:
+    """
+    Ikuti penambahan `views_count` profil tanpa menyusun ulang barisnya.
+    """
+    DirectoryEntry.objects.filter(profile_id=profile_id).update(views_count=F("views_count") + views)
@@ -0,0 +1,242 @@
+"""
+Stream Server-Sent Events untuk halaman utama, dilayani langsung dari
+config.asgi (bukan lewat view Django) supaya satu koneksi panjang tidak
+menahan thread worker.
+
+Event yang dikirim:
+- `talent`: profil baru menjadi publik dan aktif (dari signal model di
+  proses ini).
+- `statistics`: isi endpoint statistics/ berubah.
+- `leaderboard`: urutan top-talents/ berubah.
+
+Semua koneksi di satu proses dilayani satu `EventHub`. Statistik dan
+leaderboard dihitung ulang oleh satu thread publisher saat versi cache
+direktori berubah, baik karena signal di proses ini maupun (paling lambat
+tiap TALENTS_EVENTS_POLL_INTERVAL detik) karena perubahan dari proses
+lain. Setiap event di-encode sekali lalu dibagikan ke semua antrean klien.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from config.renderers import FastJSONRenderer
+
+from .cache import directory_version
+from .models import StudentProfile
+from .views import statistics_data, top_talents_queryset
+
+logger = logging.getLogger(__name__)
+
+# Jarak minimum antar-perhitungan ulang, supaya rentetan perubahan
+# (mis. import massal) hanya menghasilkan sedikit event.
+MIN_REFRESH_INTERVAL = 1.0
+
+
+def encode_event(event: str, data) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + FastJSONRenderer().render(data) + b"\n\n"
+
+
+def leaderboard_data():
+    return [
+        {
+            "id": talent.pk,
+            "user_full_name": talent.user.full_name,
+            "skill_count": talent.skill_count,
+            "experience_count": talent.experience_count,
+        }
+        for talent in top_talents_queryset().select_related("user")
+    ]
+
+
+def talent_data(profile_id):
+    profile = (
+        StudentProfile.objects.filter(pk=profile_id, is_public=True, is_active=True)
+        .select_related("user")
+        .first()
+    )
+    if profile is None:
+        return None
+    return {
+        "id": profile.pk,
+        "user_full_name": profile.user.full_name,
+        "prodi": profile.prodi,
+        "angkatan": profile.angkatan,
+    }
+
+
+class EventHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._snapshot: dict[str, bytes] = {}
+        self._version = None
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    # -- klien ------------------------------------------------------------
+
+    def subscribe(self, loop):
+        """
+        Antrean baru untuk satu koneksi, langsung berisi snapshot terakhir
+        statistik dan leaderboard. None bila batas koneksi tercapai.
+        """
+        queue = asyncio.Queue(maxsize=settings.TALENTS_EVENTS_QUEUE_SIZE)
+        with self._lock:
+            if len(self._subscribers) >= settings.TALENTS_EVENTS_MAX_CONNECTIONS:
+                return None
+            self._subscribers[queue] = loop
+            snapshot = list(self._snapshot.values())
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="talent-events", daemon=True
+                )
+                self._thread.start()
+        for chunk in snapshot:
+            queue.put_nowait(chunk)
+        return queue
+
+    def unsubscribe(self, queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def _offer(self, queue, chunk):
+        try:
+            queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            # Klien terlalu lambat: putuskan, EventSource akan reconnect
+            # dan menerima snapshot terbaru.
+            self.unsubscribe(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    # -- publisher --------------------------------------------------------
+
+    def publish(self, event: str, data) -> None:
+        self._broadcast(encode_event(event, data))
+
+    def _broadcast(self, chunk: bytes) -> None:
+        with self._lock:
+            targets = list(self._subscribers.items())
+        for queue, loop in targets:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, chunk)
+            except RuntimeError:  # event loop sudah ditutup
+                self.unsubscribe(queue)
+
+    def publish_talent(self, profile_id) -> None:
+        if not self._subscribers:
+            return
+        data = talent_data(profile_id)
+        if data is not None:
+            self.publish("talent", data)
+
+    def notify_changed(self) -> None:
+        self._wakeup.set()
+
+    def _refresh(self) -> None:
+        version = directory_version()
+        if version == self._version:
+            return
+        self._version = version
+        for event, data in (("statistics", statistics_data()), ("leaderboard", leaderboard_data())):
+            chunk = encode_event(event, data)
+            if self._snapshot.get(event) != chunk:
+                self._snapshot[event] = chunk
+                self._broadcast(chunk)
+
+    def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            if self._subscribers:
+                try:
+                    self._refresh()
+                except Exception:
+                    logger.exception("Gagal menghitung ulang event halaman utama.")
+                finally:
+                    connections.close_all()
+            else:
+                # Tanpa pendengar snapshot bisa tertinggal; hitung ulang
+                # begitu ada klien lagi.
+                self._version = None
+            time.sleep(max(0.0, MIN_REFRESH_INTERVAL - (time.monotonic() - started)))
+            self._wakeup.wait(settings.TALENTS_EVENTS_POLL_INTERVAL)
+            self._wakeup.clear()
+
+
+hub = EventHub()
+
+
+def _allowed_origin(scope):
+    origin = dict(scope["headers"]).get(b"origin")
+    if origin is None:
+        return None
+    if settings.CORS_ALLOW_ALL_ORIGINS or origin.decode("latin-1") in settings.CORS_ALLOWED_ORIGINS:
+        return origin
+    return None
+
+
+async def _wait_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def talent_events_app(scope, receive, send):
+    """
+    Aplikasi ASGI untuk TALENTS_EVENTS_PATH.
+    """
+    if scope["method"] != "GET":
+        await send({"type": "http.response.start", "status": 405, "headers": [(b"allow", b"GET")]})
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    queue = hub.subscribe(asyncio.get_running_loop())
+    if queue is None:
+        await send({"type": "http.response.start", "status": 503, "headers": [(b"retry-after", b"30")]})
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    headers = [
+        (b"content-type", b"text/event-stream"),
+        (b"cache-control", b"no-cache"),
+        (b"x-accel-buffering", b"no"),
+    ]
+    origin = _allowed_origin(scope)
+    if origin is not None:
+        headers += [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+    disconnect = asyncio.ensure_future(_wait_disconnect(receive))
+    try:
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"retry: 5000\n\n", "more_body": True})
+        while True:
+            message = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                {message, disconnect},
+                timeout=settings.TALENTS_EVENTS_HEARTBEAT,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if disconnect in done:
+                message.cancel()
+                break
+            if message in done:
+                chunk = message.result()
+                if chunk is None:
+                    break
+            else:
+                message.cancel()
+                chunk = b": ping\n\n"
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        if not disconnect.done():
+            await send({"type": "http.response.body", "body": b""})
+    finally:
+        disconnect.cancel()
+        hub.unsubscribe(queue)
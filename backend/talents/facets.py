@@ -0,0 +1,72 @@
+from django.db.models import CharField, Count, F, Value
+
+from .filters import directory_entries, filter_public_talents
+from .models import StudentSkill
+
+FACETS = ("prodi", "angkatan", "skill", "level")
+
+
+def _matching(params, exclude=()):
+    return filter_public_talents(directory_entries(), params, exclude=exclude).order_by()
+
+
+def _grouped(qs, facet, value_field, count_field, distinct=False):
+    return (
+        qs.annotate(
+            facet=Value(facet, output_field=CharField()),
+            value=F(value_field),
+        )
+        .values("facet", "value")
+        .annotate(count=Count(count_field, distinct=distinct))
+        .order_by()
+    )
+
+
+def compute_facets(params) -> dict:
+    """
+    Hitung jumlah talenta per prodi, angkatan, skill dan level skill untuk
+    filter yang sedang aktif. Seperti facet pada umumnya, dimensi `prodi`
+    dan `skill` tidak disaring oleh pilihannya sendiri. Prodi dan angkatan
+    dikelompokkan langsung di read model direktori, skill dan level di
+    StudentSkill milik profil yang cocok; keempat agregasi digabung dengan
+    UNION ALL sehingga cukup satu query.
+
+    Skill dan level sengaja tetap di-join ke StudentSkill (dan Skill untuk
+    namanya): kolom agregat di read model tidak bisa di-GROUP BY per skill
+    tanpa dipecah lagi di Python, yang membuat biaya cache miss sebanding
+    ukuran direktori. Join-nya terbatas: StudentSkill dibaca lewat index
+    `student_id` hanya untuk id profil yang cocok, Skill lewat primary key,
+    jadi biayanya sebanding jumlah baris skill yang memang dihitung.
+    Satu profil hanya punya satu baris per skill (dan satu baris read
+    model), jadi hanya level yang butuh COUNT(DISTINCT).
+    """
+    skills = StudentSkill.objects.order_by()
+    query = _grouped(
+        _matching(params, exclude=("prodi",)), "prodi", "prodi", "profile"
+    ).union(
+        _grouped(_matching(params), "angkatan", "angkatan", "profile"),
+        _grouped(
+            skills.filter(
+                student_id__in=_matching(params, exclude=("skill",)).values("profile_id")
+            ),
+            "skill", "skill__name", "student_id",
+        ),
+        _grouped(
+            skills.filter(student_id__in=_matching(params).values("profile_id")),
+            "level", "level", "student_id", distinct=True,
+        ),
+        all=True,
+    )
+
+    facets = {name: {} for name in FACETS}
+    for row in query:
+        facets[row["facet"]][row["value"]] = row["count"]
+
+    result = {}
+    for name, counts in facets.items():
+        if name == "level":
+            ordered = [(level, counts.get(level, 0)) for level in StudentSkill.Level.values]
+        else:
+            ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        result[name] = [{"value": value, "count": count} for value, count in ordered]
+    return result
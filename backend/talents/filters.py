@@ -0,0 +1,125 @@
+from django.db.models import Q
+
+from .models import DirectoryEntry, StudentProfile
+
+PUBLIC_FILTER_PARAMS = ("search", "prodi", "skill")
+EXPERIENCE_FILTER_PARAMS = ("min_experience_months", "currently_employed")
+BOOLEAN_PARAMS = {"true": True, "1": True, "false": False, "0": False}
+
+# Mode `?sort=` direktori publik, diterapkan pada read model
+# (DirectoryEntry); setiap mode punya index sendiri.
+SORT_ORDERINGS = {
+    "newest": ("-created_at", "-profile_id"),
+    "updated": ("-updated_at", "-profile_id"),
+    "views": ("-views_count", "-profile_id"),
+    "endorsements": ("-endorsement_total", "-profile_id"),
+    "skills": ("-skill_count", "-profile_id"),
+    "completeness": ("-completeness", "-profile_id"),
+    "experience": ("-experience_months", "-profile_id"),
+}
+DEFAULT_SORT = "newest"
+
+
+def public_profiles():
+    return StudentProfile.objects.filter(is_public=True, is_active=True)
+
+
+def directory_entries():
+    """
+    Read model direktori publik (lihat talents.directory); hanya berisi
+    profil publik dan aktif.
+    """
+    return DirectoryEntry.objects.all()
+
+
+def folded(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def filter_public_talents(qs, params, exclude=(), limited_search=False):
+    """
+    Terapkan filter `search`/`prodi`/`skill` dan pengalaman
+    (`min_experience_months`/`currently_employed`, lihat
+    experience_filter_params) direktori publik ke queryset DirectoryEntry
+    `qs`. `exclude` berisi nama parameter yang diabaikan (dipakai facet
+    supaya hitungan suatu dimensi tidak tersaring oleh pilihannya sendiri).
+    `limited_search` membatasi `search` pada awalan NIM atau nama, yang
+    bisa dijawab dari index (mode darurat saat query penuh timeout).
+    """
+    search = params.get("search") if "search" not in exclude else None
+    prodi = params.get("prodi") if "prodi" not in exclude else None
+    skill_name = params.get("skill") if "skill" not in exclude else None
+    if search and limited_search:
+        qs = qs.filter(Q(nim__istartswith=search) | Q(full_name__istartswith=search))
+    elif search:
+        qs = qs.filter(search_text__contains=folded(search))
+    if prodi:
+        qs = qs.filter(prodi__iexact=prodi)
+    if skill_name:
+        qs = qs.filter(skill_text__contains=folded(skill_name))
+    min_months = params.get("min_experience_months")
+    if min_months:
+        qs = qs.filter(experience_months__gte=int(min_months))
+    employed = (params.get("currently_employed") or "").casefold()
+    if employed in BOOLEAN_PARAMS:
+        qs = qs.filter(currently_employed=BOOLEAN_PARAMS[employed])
+    return qs
+
+
+def normalized_filter_params(params, names=PUBLIC_FILTER_PARAMS) -> dict:
+    """
+    Parameter filter yang sudah dirapikan (spasi dan huruf besar/kecil)
+    untuk dipakai sebagai bagian kunci cache.
+    """
+    normalized = {}
+    for name in names:
+        value = folded(params.get(name) or "")
+        if value:
+            normalized[name] = value
+    return normalized
+
+
+def experience_filter_params(params) -> dict:
+    """
+    Filter pengalaman yang sudah divalidasi dan dirapikan:
+    `min_experience_months` (bilangan bulat, 0 berarti tanpa filter) dan
+    `currently_employed` (`true`/`false`). ValueError berisi
+    {parameter: pesan} bila nilainya tidak valid.
+    """
+    normalized = {}
+    min_months = (params.get("min_experience_months") or "").strip()
+    if min_months:
+        if not min_months.isdigit():
+            raise ValueError({"min_experience_months": "Harus berupa bilangan bulat >= 0."})
+        if int(min_months):
+            normalized["min_experience_months"] = str(int(min_months))
+    employed = (params.get("currently_employed") or "").strip().casefold()
+    if employed:
+        if employed not in BOOLEAN_PARAMS:
+            raise ValueError({"currently_employed": "Pilih 'true' atau 'false'."})
+        normalized["currently_employed"] = "true" if BOOLEAN_PARAMS[employed] else "false"
+    return normalized
+
+
+def directory_filter_params(params) -> dict:
+    """
+    Semua filter direktori publik yang sudah dirapikan (tanpa `sort`),
+    untuk kunci cache daftar maupun facet. ValueError seperti
+    experience_filter_params.
+    """
+    return {**normalized_filter_params(params), **experience_filter_params(params)}
+
+
+def directory_list_params(params) -> dict:
+    """
+    Parameter daftar publik (filter + `sort` bila bukan default) untuk
+    kunci cache. ValueError berisi {parameter: pesan} bila ada nilai yang
+    tidak valid.
+    """
+    normalized = directory_filter_params(params)
+    sort = (params.get("sort") or DEFAULT_SORT).strip().casefold()
+    if sort not in SORT_ORDERINGS:
+        raise ValueError({"sort": f"Pilih salah satu: {', '.join(SORT_ORDERINGS)}."})
+    if sort != DEFAULT_SORT:
+        normalized["sort"] = sort
+    return normalized
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from talents.snapshot import build_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Bangun snapshot statis direktori publik (JSON + .gz/.br berhash) dan "
+        "terbitkan manifest.json barunya."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--root", help="Direktori tujuan (default TALENTS_SNAPSHOT_ROOT).")
+        parser.add_argument(
+            "--base-url",
+            help="URL dasar untuk link absolut (default CACHE_WARM_BASE_URL).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        manifest = build_snapshot(root=options["root"], base_url=options["base_url"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Snapshot {manifest['version']}: {manifest['count']} profil, "
+            f"{len(manifest['pages'])} halaman, {manifest['written']} dokumen ditulis, "
+            f"{manifest['removed']} file lama dihapus ({time.perf_counter() - started:.2f} dtk)."
+        ))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from talents.models import Skill, SkillAlias, normalize_skill_name
+from talents.skills import bump_skill_map_version, merge_skills
+
+
+class Command(BaseCommand):
+    help = (
+        "Gabungkan skill duplikat ke satu skill kanonik dan catat nama lama "
+        "sebagai alias. Contoh: manage.py merge_skills Python Python3 'python 3'"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("target", help="Nama skill kanonik.")
+        parser.add_argument("sources", nargs="+", help="Nama skill yang digabungkan.")
+
+    def handle(self, *args, **options):
+        try:
+            target = Skill.objects.get(normalized_name=normalize_skill_name(options["target"]))
+        except Skill.DoesNotExist:
+            raise CommandError(f"Skill '{options['target']}' tidak ditemukan.")
+
+        sources = []
+        for name in options["sources"]:
+            normalized = normalize_skill_name(name)
+            skill = Skill.objects.filter(normalized_name=normalized).first()
+            if skill is not None:
+                sources.append(skill)
+            elif normalized != target.normalized_name:
+                SkillAlias.objects.update_or_create(alias=normalized, defaults={"skill": target})
+                bump_skill_map_version()
+                self.stdout.write(f"Alias '{normalized}' -> '{target.name}' dibuat.")
+
+        rows = merge_skills(target, sources)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(sources)} skill digabung ke '{target.name}', {rows} baris StudentSkill diperbarui."
+            )
+        )
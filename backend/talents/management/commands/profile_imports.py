@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+WARM_URLCONF = (
+    "import config.wsgi; "
+    "from django.urls import get_resolver; "
+    "get_resolver().url_patterns"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Ukur waktu import saat worker memuat config.wsgi (python -X importtime) "
+        "dan tampilkan modul paling berat."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=25, help="Jumlah modul yang ditampilkan.")
+        parser.add_argument(
+            "--no-urls",
+            action="store_true",
+            help="Jangan ikut memuat URLconf (hanya config.wsgi).",
+        )
+        parser.add_argument(
+            "--self",
+            action="store_true",
+            dest="self_time",
+            help="Urutkan berdasarkan waktu modul itu sendiri, bukan kumulatif.",
+        )
+
+    def handle(self, *args, **options):
+        code = "import config.wsgi" if options["no_urls"] else WARM_URLCONF
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "config.settings"
+        )}
+        env.pop("DJANGO_PRELOAD", None)
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        rows = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+        if not rows:
+            raise CommandError("Output -X importtime tidak ditemukan.")
+
+        # Hanya modul tingkat atas (tanpa indentasi) yang dijumlahkan supaya
+        # total tidak terhitung ganda.
+        total = sum(cumulative for _, cumulative, depth, _ in rows if depth == 0)
+        key = 0 if options["self_time"] else 1
+        rows.sort(key=lambda row: row[key], reverse=True)
+
+        self.stdout.write(f"Total import: {total / 1000:.1f} ms, {len(rows)} modul\n")
+        self.stdout.write(f"{'self ms':>9} {'kumulatif ms':>13}  modul")
+        for self_us, cumulative_us, _, name in rows[: options["limit"]]:
+            self.stdout.write(f"{self_us / 1000:9.1f} {cumulative_us / 1000:13.1f}  {name}")
@@ -0,0 +1,27 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from talents.changes import prune_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Hapus log perubahan profil (sinkronisasi delta) yang lebih tua dari "
+        "masa simpan; token mirror yang lebih tua akan mendapat 410."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TALENTS_CHANGES_RETENTION_DAYS,
+            help="Masa simpan log dalam hari (default TALENTS_CHANGES_RETENTION_DAYS).",
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - datetime.timedelta(days=options["days"])
+        deleted = prune_changes(older_than)
+        self.stdout.write(self.style.SUCCESS(f"{deleted} baris log dihapus."))
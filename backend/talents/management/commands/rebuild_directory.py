@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from talents.cache import bump_directory_version
+from talents.directory import rebuild_directory
+
+
+class Command(BaseCommand):
+    help = (
+        "Bangun ulang read model direktori publik (DirectoryEntry) dari data "
+        "profil, mis. setelah perubahan data langsung di database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        count = rebuild_directory(chunk_size=options["chunk_size"])
+        bump_directory_version()
+        self.stdout.write(self.style.SUCCESS(f"{count} profil di read model direktori."))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from talents.cache import bump_directory_version
+from talents.changes import log_profile_changes
+from talents.models import StudentProfile
+from talents.snapshot import schedule_snapshot
+from talents.stats import refresh_experience_totals, running_experience_profiles
+
+CHUNK_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Segarkan ringkasan pengalaman (total bulan, sedang bekerja, perusahaan "
+        "terakhir) profil yang pengalamannya masih berjalan. Jalankan harian."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Ikut segarkan pengalaman yang dimulai/berakhir dalam N hari terakhir.",
+        )
+        parser.add_argument(
+            "--all", action="store_true", help="Hitung ulang semua profil."
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            ids = StudentProfile.objects.order_by().values_list("id", flat=True)
+        else:
+            ids = running_experience_profiles(days=options["days"])
+        ids = list(ids)
+        changed = []
+        for start in range(0, len(ids), CHUNK_SIZE):
+            changed += refresh_experience_totals(ids[start:start + CHUNK_SIZE])
+        if changed:
+            log_profile_changes(changed)
+            bump_directory_version()
+            schedule_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(ids)} profil diperiksa, {len(changed)} diperbarui."
+        ))
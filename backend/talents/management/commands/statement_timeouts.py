@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from config.statement_timeout import reset_timeout_counts, timeout_counts
+
+
+class Command(BaseCommand):
+    help = "Tampilkan jumlah statement timeout per endpoint (STATEMENT_TIMEOUTS)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Nolkan penghitung setelah ditampilkan.")
+
+    def handle(self, *args, **options):
+        for name, count in timeout_counts().items():
+            self.stdout.write(f"{name}: {count}")
+        if options["reset"]:
+            reset_timeout_counts()
@@ -0,0 +1,59 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from talents.warmup import warm_caches
+
+
+class Command(BaseCommand):
+    help = (
+        "Panaskan cache direktori publik (halaman utama, halaman awal daftar "
+        "publik + facet, detail profil terpopuler) dan laporkan waktu per kunci."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            help="URL dasar untuk link absolut (default CACHE_WARM_BASE_URL).",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Query string daftar publik, mis. 'prodi=Informatika&skill=python'. "
+            "Bisa diulang; default CACHE_WARM_QUERIES.",
+        )
+        parser.add_argument("--pages", type=int, help="Jumlah halaman per query.")
+        parser.add_argument("--popular", type=int, help="Jumlah detail profil terpopuler.")
+        parser.add_argument("--workers", type=int, help="Jumlah thread paralel.")
+
+    def handle(self, *args, **options):
+        if "locmem" in settings.CACHES["default"]["BACKEND"]:
+            self.stderr.write(self.style.WARNING(
+                "Cache default adalah LocMemCache: hasil pemanasan hanya berlaku "
+                "di proses ini. Set REDIS_URL untuk cache bersama."
+            ))
+
+        started = time.perf_counter()
+        results = warm_caches(
+            workers=options["workers"],
+            base_url=options["base_url"],
+            queries=options["queries"],
+            pages=options["pages"],
+            popular=options["popular"],
+        )
+        elapsed = time.perf_counter() - started
+
+        failed = 0
+        for label, seconds, error in sorted(results, key=lambda row: -row[1]):
+            if error:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"{seconds * 1000:9.1f} ms  {label}  {error}"))
+            else:
+                self.stdout.write(f"{seconds * 1000:9.1f} ms  {label}")
+        total = sum(row[1] for row in results)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(results) - failed}/{len(results)} kunci dipanaskan dalam "
+            f"{elapsed:.2f} dtk (total kerja {total:.2f} dtk)."
+        ))
@@ -0,0 +1,78 @@
+# Generated by Django 5.0.3 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def normalize(name):
+    return " ".join(name.split()).casefold()
+
+
+def merge_duplicate_skills(apps, schema_editor):
+    """
+    Isi normalized_name dan lebur skill yang hanya berbeda huruf/spasi ke
+    skill dengan id terkecil, supaya kolom bisa dibuat unik.
+    """
+    Skill = apps.get_model("talents", "Skill")
+    SkillAlias = apps.get_model("talents", "SkillAlias")
+    StudentSkill = apps.get_model("talents", "StudentSkill")
+    Endorsement = apps.get_model("talents", "Endorsement")
+
+    canonical = {}
+    for skill in Skill.objects.order_by("id"):
+        key = normalize(skill.name)
+        target_id = canonical.setdefault(key, skill.pk)
+        if target_id == skill.pk:
+            skill.normalized_name = key
+            skill.save(update_fields=["normalized_name"])
+            continue
+        for row in StudentSkill.objects.filter(skill_id=skill.pk):
+            existing = StudentSkill.objects.filter(
+                student_id=row.student_id, skill_id=target_id
+            ).first()
+            if existing is None:
+                row.skill_id = target_id
+                row.save(update_fields=["skill"])
+                continue
+            endorsers = Endorsement.objects.filter(endorsed_skill_id=existing.pk).values(
+                "endorser_id"
+            )
+            moved = (
+                Endorsement.objects.filter(endorsed_skill_id=row.pk)
+                .exclude(endorser_id__in=endorsers)
+                .update(endorsed_skill_id=existing.pk)
+            )
+            if moved:
+                StudentSkill.objects.filter(pk=existing.pk).update(
+                    endorsement_count=F("endorsement_count") + moved
+                )
+            row.delete()
+        skill.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0002_alter_studentprofile_angkatan'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='normalized_name',
+            field=models.CharField(editable=False, max_length=100, null=True),
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='talents.skill')),
+            ],
+            options={
+                'verbose_name_plural': 'skill aliases',
+            },
+        ),
+        migrations.RunPython(merge_duplicate_skills, migrations.RunPython.noop),
+    ]
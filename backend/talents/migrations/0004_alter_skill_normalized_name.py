@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0003_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skill',
+            name='normalized_name',
+            field=models.CharField(editable=False, max_length=100, unique=True),
+        ),
+    ]
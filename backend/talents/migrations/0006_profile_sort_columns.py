@@ -0,0 +1,60 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:39
+
+from django.db import migrations, models
+
+from talents.stats import profile_stats_updates
+
+
+def fill_profile_stats(apps, schema_editor):
+    StudentProfile = apps.get_model("talents", "StudentProfile")
+    StudentProfile.objects.update(**profile_stats_updates(StudentProfile))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0005_studentprofile_photo_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='completeness',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='endorsement_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='skill_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_profile_stats, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-created_at', '-id'], name='profile_public_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-updated_at', '-id'], name='profile_public_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-views_count', '-id'], name='profile_public_views_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-endorsement_total', '-id'], name='profile_public_endorse_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-skill_count', '-id'], name='profile_public_skills_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-completeness', '-id'], name='profile_public_complete_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0006_profile_sort_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileViewSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('registers', models.BinaryField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_sketches', to='talents.studentprofile')),
+            ],
+            options={
+                'unique_together': {('student', 'day')},
+            },
+        ),
+    ]
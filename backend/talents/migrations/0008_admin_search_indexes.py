@@ -0,0 +1,20 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:43
+
+from django.db import migrations, models
+
+from config.migration_operations import prefix_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0007_profileviewsketch'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profileview',
+            index=models.Index(fields=['-viewed_at'], name='profileview_viewed_at_idx'),
+        ),
+        prefix_search_index('talents', 'StudentProfile', 'nim', 'profile_nim_upper_idx'),
+    ]
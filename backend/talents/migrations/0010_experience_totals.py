@@ -0,0 +1,46 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:49
+
+from django.db import migrations, models
+
+from talents.stats import refresh_experience_totals
+
+
+def fill_experience_totals(apps, schema_editor):
+    StudentProfile = apps.get_model("talents", "StudentProfile")
+    ids = list(StudentProfile.objects.filter(experiences__isnull=False).values_list("id", flat=True).distinct())
+    for start in range(0, len(ids), 1000):
+        refresh_experience_totals(ids[start:start + 1000], profile_model=StudentProfile)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0009_profilechange'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='currently_employed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='experience_months',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='studentprofile',
+            name='latest_company',
+            field=models.CharField(blank=True, editable=False, max_length=150),
+        ),
+        migrations.RunPython(fill_experience_totals, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_public', True)), fields=['-experience_months', '-id'], name='profile_public_exp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentprofile',
+            index=models.Index(condition=models.Q(('currently_employed', True), ('is_active', True), ('is_public', True)), fields=['-created_at', '-id'], name='profile_public_employed_idx'),
+        ),
+    ]
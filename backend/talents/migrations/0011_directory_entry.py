@@ -0,0 +1,47 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:52
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from talents.directory import rebuild_directory
+
+
+def fill_directory(apps, schema_editor):
+    rebuild_directory(profile_model=apps.get_model("talents", "StudentProfile"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0010_experience_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirectoryEntry',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='directory_entry', serialize=False, to='talents.studentprofile')),
+                ('full_name', models.CharField(blank=True, max_length=150)),
+                ('nim', models.CharField(max_length=20)),
+                ('prodi', models.CharField(max_length=100)),
+                ('angkatan', models.CharField(max_length=4)),
+                ('headline', models.CharField(blank=True, max_length=150)),
+                ('skills', models.JSONField(default=list)),
+                ('skill_text', models.TextField(blank=True)),
+                ('search_text', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('views_count', models.PositiveIntegerField(default=0)),
+                ('skill_count', models.PositiveIntegerField(default=0)),
+                ('endorsement_total', models.PositiveIntegerField(default=0)),
+                ('completeness', models.PositiveSmallIntegerField(default=0)),
+                ('experience_months', models.PositiveIntegerField(default=0)),
+                ('currently_employed', models.BooleanField(default=False)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-created_at', '-profile'], name='directory_created_idx'), models.Index(fields=['-updated_at', '-profile'], name='directory_updated_idx'), models.Index(fields=['-views_count', '-profile'], name='directory_views_idx'), models.Index(fields=['-endorsement_total', '-profile'], name='directory_endorse_idx'), models.Index(fields=['-skill_count', '-profile'], name='directory_skills_idx'), models.Index(fields=['-completeness', '-profile'], name='directory_complete_idx'), models.Index(fields=['-experience_months', '-profile'], name='directory_exp_idx'), models.Index(condition=models.Q(('currently_employed', True)), fields=['-created_at', '-profile'], name='directory_employed_idx'), models.Index(django.db.models.functions.text.Upper('prodi'), name='directory_prodi_upper_idx')],
+            },
+        ),
+        migrations.RunPython(fill_directory, migrations.RunPython.noop),
+    ]
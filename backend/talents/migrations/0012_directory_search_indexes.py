@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-19 01:54
+
+from django.db import migrations
+
+from config.migration_operations import prefix_search_index
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0011_directory_entry'),
+    ]
+
+    operations = [
+        prefix_search_index('talents', 'DirectoryEntry', 'nim', 'directory_nim_upper_idx'),
+        prefix_search_index('talents', 'DirectoryEntry', 'full_name', 'directory_name_upper_idx'),
+    ]
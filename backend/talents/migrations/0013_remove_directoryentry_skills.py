@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-19 02:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0012_directory_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='directoryentry',
+            name='skills',
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.3 on 2026-10-19 02:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('talents', '0013_remove_directoryentry_skills'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_views_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_endorse_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_skills_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_complete_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_exp_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='studentprofile',
+            name='profile_public_employed_idx',
+        ),
+    ]
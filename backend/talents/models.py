@@ -1,8 +1,11 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Upper
 
+from config.dirty_fields import DirtyFieldsMixin
 
-class StudentProfile(models.Model):
+
+class StudentProfile(DirtyFieldsMixin, models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -14,27 +17,82 @@ class StudentProfile(models.Model):
     headline = models.CharField(max_length=150, blank=True)
     bio = models.TextField(blank=True)
     photo = models.ImageField(upload_to="profiles/", blank=True, null=True)
+    # Dibuat worker (talents.tasks.make_photo_thumbnail) setelah foto diunggah.
+    photo_thumbnail = models.ImageField(
+        upload_to="profiles/thumbs/", blank=True, null=True, editable=False
+    )
     is_public = models.BooleanField(default=True)
     is_active = models.BooleanField(default=True)
     views_count = models.PositiveIntegerField(default=0)
+    # Ringkasan untuk pengurutan direktori, dijaga lewat signal
+    # (lihat talents.stats).
+    skill_count = models.PositiveIntegerField(default=0, editable=False)
+    endorsement_total = models.PositiveIntegerField(default=0, editable=False)
+    completeness = models.PositiveSmallIntegerField(default=0, editable=False)
+    # Ringkasan pengalaman untuk filter `min_experience_months` dan
+    # `currently_employed` (lihat talents.stats.experience_totals).
+    experience_months = models.PositiveIntegerField(default=0, editable=False)
+    currently_employed = models.BooleanField(default=False, editable=False)
+    latest_company = models.CharField(max_length=150, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-created_at"]
+        # Pengurutan direktori publik memakai index read model
+        # (DirectoryEntry), bukan tabel ini.
+        # Index pencarian admin `=nim` (UPPER(nim) = ...) dan awalan khusus
+        # PostgreSQL dibuat di migrasi 0008_admin_search_indexes.
 
     def __str__(self) -> str:  # pragma: no cover - simple repr
         return f"{self.user.full_name or self.user.email} ({self.nim})"
 
 
+def normalize_skill_name(name: str) -> str:
+    """
+    Kunci kanonik skill: spasi dirapikan dan huruf diseragamkan, sehingga
+    "Python", "python " dan "PYTHON" menjadi satu skill.
+    """
+    return " ".join(name.split()).casefold()
+
+
 class Skill(models.Model):
     name = models.CharField(max_length=100, unique=True)
+    normalized_name = models.CharField(max_length=100, unique=True, editable=False)
+
+    def save(self, *args, **kwargs):
+        self.name = " ".join(self.name.split())
+        self.normalized_name = normalize_skill_name(self.name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "normalized_name"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:  # pragma: no cover
         return self.name
 
 
-class StudentSkill(models.Model):
+class SkillAlias(models.Model):
+    """
+    Nama alternatif yang diarahkan ke satu skill kanonik (mis. "python3"
+    -> "Python").
+    """
+
+    alias = models.CharField(max_length=100, unique=True)
+    skill = models.ForeignKey(Skill, related_name="aliases", on_delete=models.CASCADE)
+
+    class Meta:
+        verbose_name_plural = "skill aliases"
+
+    def save(self, *args, **kwargs):
+        self.alias = normalize_skill_name(self.alias)
+        super().save(*args, **kwargs)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.alias} -> {self.skill.name}"
+
+
+class StudentSkill(DirtyFieldsMixin, models.Model):
     class Level(models.TextChoices):
         BEGINNER = "Beginner", "Beginner"
         INTERMEDIATE = "Intermediate", "Intermediate"
@@ -54,7 +112,7 @@ class StudentSkill(models.Model):
         return f"{self.student.nim} - {self.skill.name}"
 
 
-class Experience(models.Model):
+class Experience(DirtyFieldsMixin, models.Model):
     student = models.ForeignKey(
         StudentProfile, related_name="experiences", on_delete=models.CASCADE
     )
@@ -71,7 +129,7 @@ class Experience(models.Model):
         return f"{self.title} @ {self.company}"
 
 
-class PortfolioProject(models.Model):
+class PortfolioProject(DirtyFieldsMixin, models.Model):
     student = models.ForeignKey(
         StudentProfile, related_name="projects", on_delete=models.CASCADE
     )
@@ -84,7 +142,7 @@ class PortfolioProject(models.Model):
         return self.title
 
 
-class SocialLink(models.Model):
+class SocialLink(DirtyFieldsMixin, models.Model):
     class Platform(models.TextChoices):
         EMAIL = "email", "Email"
         LINKEDIN = "linkedin", "LinkedIn"
@@ -112,6 +170,92 @@ class ProfileView(models.Model):
 
     class Meta:
         ordering = ["-viewed_at"]
+        indexes = [models.Index(fields=["-viewed_at"], name="profileview_viewed_at_idx")]
+
+
+class ProfileViewSketch(models.Model):
+    """
+    Ringkasan kunjungan satu profil per hari: jumlah kunjungan dan sketsa
+    HyperLogLog pengunjung unik (lihat talents.hll).
+    """
+
+    student = models.ForeignKey(
+        StudentProfile, related_name="view_sketches", on_delete=models.CASCADE
+    )
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    registers = models.BinaryField()
+
+    class Meta:
+        unique_together = ("student", "day")
+
+
+class ProfileChange(models.Model):
+    """
+    Log perubahan profil untuk sinkronisasi delta (talents.changes). Hanya
+    menyimpan id profil, tanpa FK, supaya profil yang dihapus tetap
+    tercatat; id baris ini sekaligus menjadi token sinkronisasi.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    student_id = models.BigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+
+class DirectoryEntry(models.Model):
+    """
+    Read model direktori publik (talents.directory): satu baris per profil
+    publik dan aktif berisi field tampilan, teks skill dan kunci urutan,
+    sehingga filter, pencarian dan pengurutan daftar publik tidak perlu join.
+    """
+
+    profile = models.OneToOneField(
+        StudentProfile,
+        primary_key=True,
+        related_name="directory_entry",
+        on_delete=models.CASCADE,
+    )
+    full_name = models.CharField(max_length=150, blank=True)
+    nim = models.CharField(max_length=20)
+    prodi = models.CharField(max_length=100)
+    angkatan = models.CharField(max_length=4)
+    headline = models.CharField(max_length=150, blank=True)
+    # Teks yang sudah di-casefold untuk filter `skill` dan `search`.
+    skill_text = models.TextField(blank=True)
+    search_text = models.TextField(blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    views_count = models.PositiveIntegerField(default=0)
+    skill_count = models.PositiveIntegerField(default=0)
+    endorsement_total = models.PositiveIntegerField(default=0)
+    completeness = models.PositiveSmallIntegerField(default=0)
+    experience_months = models.PositiveIntegerField(default=0)
+    currently_employed = models.BooleanField(default=False)
+
+    class Meta:
+        # Satu index per mode `?sort=` (lihat talents.filters.SORT_ORDERINGS).
+        indexes = [
+            models.Index(fields=[f"-{field}", "-profile"], name=f"directory_{suffix}_idx")
+            for field, suffix in (
+                ("created_at", "created"),
+                ("updated_at", "updated"),
+                ("views_count", "views"),
+                ("endorsement_total", "endorse"),
+                ("skill_count", "skills"),
+                ("completeness", "complete"),
+                ("experience_months", "exp"),
+            )
+        ] + [
+            models.Index(
+                fields=["-created_at", "-profile"],
+                name="directory_employed_idx",
+                condition=models.Q(currently_employed=True),
+            ),
+            models.Index(Upper("prodi"), name="directory_prodi_upper_idx"),
+        ]
+        # Index pencarian terbatas (awalan NIM/nama) saat query penuh
+        # timeout khusus PostgreSQL, dibuat di migrasi
+        # 0012_directory_search_indexes.
 
 
 class Endorsement(models.Model):
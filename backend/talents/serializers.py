@@ -1,5 +1,8 @@
+from django.db import transaction
 from rest_framework import serializers
 
+from jobs.queue import enqueue
+
 from .models import (
     Endorsement,
     Experience,
@@ -26,6 +29,7 @@ class StudentSkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = StudentSkill
         fields = ["id", "skill", "skill_name", "level", "endorsement_count"]
+        read_only_fields = ["endorsement_count"]
 
     def create(self, validated_data):
         """
@@ -94,6 +98,7 @@ class StudentProfileSerializer(serializers.ModelSerializer):
     user_full_name = serializers.CharField(source="user.full_name", read_only=True)
     email = serializers.EmailField(source="user.email", read_only=True)
     photo_url = serializers.SerializerMethodField()
+    photo_thumbnail_url = serializers.SerializerMethodField()
     skills = StudentSkillSerializer(source="student_skills", many=True, read_only=True)
     experiences = ExperienceSerializer(many=True, read_only=True)
     projects = PortfolioProjectSerializer(many=True, read_only=True)
@@ -112,9 +117,16 @@ class StudentProfileSerializer(serializers.ModelSerializer):
             "bio",
             "photo",
             "photo_url",
+            "photo_thumbnail_url",
             "is_public",
             "is_active",
             "views_count",
+            "skill_count",
+            "endorsement_total",
+            "completeness",
+            "experience_months",
+            "currently_employed",
+            "latest_company",
             "created_at",
             "updated_at",
             "skills",
@@ -134,6 +146,16 @@ class StudentProfileSerializer(serializers.ModelSerializer):
         url = obj.photo.url
         return request.build_absolute_uri(url) if request else url
 
+    def get_photo_thumbnail_url(self, obj: StudentProfile):
+        """
+        Thumbnail dibuat di background; sampai siap, pakai foto aslinya.
+        """
+        if not obj.photo_thumbnail:
+            return self.get_photo_url(obj)
+        request = self.context.get("request")
+        url = obj.photo_thumbnail.url
+        return request.build_absolute_uri(url) if request else url
+
 
 class StudentProfileUpdateSerializer(serializers.ModelSerializer):
     user_full_name = serializers.CharField(source="user.full_name", required=False, allow_blank=True)
@@ -162,12 +184,24 @@ class StudentProfileUpdateSerializer(serializers.ModelSerializer):
         return value.strip() if value else value
     
     def update(self, instance, validated_data):
-        # Handle user full_name update
+        # Handle user full_name update. Model melacak field yang berubah,
+        # jadi save tanpa perubahan tidak menulis apa pun.
         user_data = validated_data.pop('user', {})
         if 'full_name' in user_data:
             instance.user.full_name = user_data['full_name']
-            instance.user.save()
-        return super().update(instance, validated_data)
+            instance.user.save(update_fields=["full_name"])
+        if "photo" in validated_data and instance.photo_thumbnail:
+            # Thumbnail lama dihapus setelah commit; yang baru dibuat worker.
+            storage, previous = instance.photo_thumbnail.storage, instance.photo_thumbnail.name
+            transaction.on_commit(lambda: storage.delete(previous))
+            instance.photo_thumbnail = None
+        instance = super().update(instance, validated_data)
+        if "photo" in validated_data and instance.photo:
+            enqueue(
+                "talents.make_photo_thumbnail",
+                {"profile_id": instance.pk, "photo_name": instance.photo.name},
+            )
+        return instance
 
     class Meta:
         model = StudentProfile
@@ -179,6 +213,29 @@ class StudentProfileUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
+class SkillRequirementSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    min_level = serializers.ChoiceField(
+        choices=StudentSkill.Level.choices, default=StudentSkill.Level.BEGINNER
+    )
+    weight = serializers.FloatField(default=1.0, min_value=0.1, max_value=10)
+
+
+class TalentMatchSerializer(serializers.Serializer):
+    """
+    Kebutuhan recruiter untuk pencocokan talenta, contoh:
+    {"skills": [{"name": "Django", "min_level": "Expert", "weight": 2}],
+     "prodi": ["Informatika"], "angkatan": ["2022", "2023"]}
+    """
+
+    skills = SkillRequirementSerializer(many=True, allow_empty=False, max_length=20)
+    prodi = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+    angkatan = serializers.ListField(
+        child=serializers.RegexField(r"^[0-9]{4}$"), required=False, default=list
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
 class EndorsementSerializer(serializers.ModelSerializer):
     endorser = serializers.StringRelatedField(read_only=True)
 
@@ -0,0 +1,214 @@
+import sys
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .cache import bump_directory_version
+from .changes import log_profile_changes, log_skill_holders
+from .models import (
+    Endorsement,
+    Experience,
+    PortfolioProject,
+    Skill,
+    SkillAlias,
+    SocialLink,
+    StudentProfile,
+    StudentSkill,
+)
+from .skills import bump_skill_map_version
+from .snapshot import schedule_snapshot
+from .stats import (
+    COMPLETENESS_FIELDS,
+    profile_stats_updates,
+    refresh_experience_totals,
+    refresh_profile_stats,
+)
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def refresh_skill_map(sender, **kwargs):
+    transaction.on_commit(bump_skill_map_version)
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+@receiver(post_save, sender=StudentSkill)
+@receiver(post_delete, sender=StudentSkill)
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=PortfolioProject)
+@receiver(post_delete, sender=PortfolioProject)
+@receiver(post_save, sender=SocialLink)
+@receiver(post_delete, sender=SocialLink)
+@receiver(post_save, sender=Endorsement)
+@receiver(post_delete, sender=Endorsement)
+def invalidate_directory_cache(sender, **kwargs):
+    transaction.on_commit(_directory_changed)
+
+
+# Kolom user yang tampil di data profil; perubahan lain (mis. last_login
+# saat login) tidak perlu membatalkan cache maupun dicatat sebagai delta.
+USER_PROFILE_FIELDS = {"full_name", "email"}
+
+
+@receiver(post_save, sender="accounts.User")
+def user_profile_changed(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and update_fields.isdisjoint(USER_PROFILE_FIELDS)):
+        return
+    transaction.on_commit(_directory_changed)
+    log_profile_changes(
+        StudentProfile.objects.filter(user_id=instance.pk).values_list("id", flat=True)
+    )
+
+
+def _directory_changed():
+    bump_directory_version()
+    schedule_snapshot()
+    hub = _event_hub()
+    if hub is not None:
+        hub.notify_changed()
+
+
+@receiver(post_init, sender=StudentProfile)
+def remember_listing(sender, instance, **kwargs):
+    # Hanya bila kolomnya sudah dimuat, jangan memicu query untuk field
+    # yang di-defer.
+    fields = instance.__dict__
+    instance._was_listed = bool(fields.get("is_public") and fields.get("is_active"))
+
+
+@receiver(post_save, sender=StudentProfile)
+def announce_listed_profile(sender, instance, **kwargs):
+    """
+    Kirim event `talent` ke stream SSE saat profil baru tampil di
+    direktori publik (menjadi publik dan aktif).
+    """
+    listed = instance.is_public and instance.is_active
+    if listed and not getattr(instance, "_was_listed", False):
+        hub = _event_hub()
+        if hub is not None:
+            profile_id = instance.pk
+            transaction.on_commit(lambda: hub.publish_talent(profile_id))
+    instance._was_listed = listed
+
+
+@receiver(post_save, sender=StudentSkill)
+@receiver(post_delete, sender=StudentSkill)
+def touch_profile_skills(sender, instance, **kwargs):
+    """
+    Perubahan skill memperbarui kolom ringkasan profil untuk pengurutan dan
+    menandai profil di indeks skill proses ini (worker lain membaca log
+    ProfileChange).
+    """
+    _touch_profile(instance.student_id)
+
+
+def _touch_profile(profile_id):
+    StudentProfile.objects.filter(pk=profile_id).update(**profile_stats_updates(StudentProfile))
+    _mark_index_dirty(profile_id)
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=PortfolioProject)
+@receiver(post_delete, sender=PortfolioProject)
+@receiver(post_save, sender=SocialLink)
+@receiver(post_delete, sender=SocialLink)
+def refresh_completeness(sender, instance, **kwargs):
+    refresh_profile_stats([instance.student_id])
+
+
+# Kolom Experience yang memengaruhi ringkasan pengalaman profil.
+EXPERIENCE_TOTAL_SOURCES = {"student", "start_date", "end_date", "company"}
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+def refresh_experience(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or not update_fields.isdisjoint(EXPERIENCE_TOTAL_SOURCES):
+        refresh_experience_totals([instance.student_id])
+
+
+@receiver(post_save, sender=StudentProfile)
+def refresh_own_completeness(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or not update_fields.isdisjoint(COMPLETENESS_FIELDS):
+        refresh_profile_stats([instance.pk])
+
+
+@receiver(post_save, sender=Endorsement)
+@receiver(post_delete, sender=Endorsement)
+def count_endorsement(sender, instance, created=False, **kwargs):
+    """
+    Jaga `StudentSkill.endorsement_count` beserta total endorsement profil.
+    """
+    if kwargs["signal"] is post_save and not created:
+        return
+    skills = StudentSkill.objects.filter(pk=instance.endorsed_skill_id)
+    if created:
+        skills.update(endorsement_count=F("endorsement_count") + 1)
+    else:
+        skills.filter(endorsement_count__gt=0).update(endorsement_count=F("endorsement_count") - 1)
+    student_id = skills.values_list("student_id", flat=True).first()
+    if student_id is not None:
+        _touch_profile(student_id)
+        log_profile_changes([student_id])
+
+
+# Kolom profil yang memengaruhi isi indeks skill.
+INDEX_FIELDS = {"is_public", "is_active"}
+
+
+@receiver(post_save, sender=StudentProfile)
+def mark_profile_dirty(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or not update_fields.isdisjoint(INDEX_FIELDS):
+        _mark_index_dirty(instance.pk)
+
+
+# Didaftarkan setelah receiver di atas: dalam autocommit, on_commit langsung
+# berjalan, dan baris read model direktori harus membaca kolom ringkasan
+# yang sudah diperbarui.
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+def log_profile_change(sender, instance, **kwargs):
+    log_profile_changes([instance.pk])
+
+
+@receiver(post_save, sender=StudentSkill)
+@receiver(post_delete, sender=StudentSkill)
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_save, sender=PortfolioProject)
+@receiver(post_delete, sender=PortfolioProject)
+@receiver(post_save, sender=SocialLink)
+@receiver(post_delete, sender=SocialLink)
+def log_child_change(sender, instance, **kwargs):
+    log_profile_changes([instance.student_id])
+
+
+@receiver(post_save, sender=Skill)
+def log_skill_rename(sender, instance, created, **kwargs):
+    if not created:
+        log_skill_holders([instance.pk])
+
+
+def _event_hub():
+    # Stream SSE hanya dimuat oleh config.asgi.
+    module = sys.modules.get("talents.events")
+    return module.hub if module is not None else None
+
+
+def _mark_index_dirty(profile_id):
+    # Indeks skill (dan NumPy) baru dimuat saat pertama kali dipakai; bila
+    # belum dimuat di proses ini, tidak ada yang perlu ditandai.
+    # Ditandai setelah commit, supaya sinkronisasi tidak membaca skill yang
+    # belum terlihat (atau batal).
+    module = sys.modules.get("talents.skill_index")
+    if module is not None:
+        transaction.on_commit(lambda: module.skill_index.mark_dirty(profile_id))
@@ -0,0 +1,311 @@
+import math
+import threading
+import time
+
+import numpy as np
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ProfileChange, StudentSkill
+
+LEVEL_CODES = {
+    StudentSkill.Level.BEGINNER: 1,
+    StudentSkill.Level.INTERMEDIATE: 2,
+    StudentSkill.Level.EXPERT: 3,
+}
+
+
+def skill_weight(level_code: int, endorsement_count: int) -> float:
+    """
+    Bobot satu skill dalam vektor profil: level dikali faktor endorsement
+    (logaritmik supaya beberapa endorsement tidak mendominasi).
+    """
+    return float(level_code) * (1.0 + math.log1p(endorsement_count))
+
+
+class SkillIndex:
+    """
+    Matriks jarang profil x skill milik talenta publik, disimpan per proses
+    sebagai array NumPy yang diurutkan per kolom skill (bentuk CSC), untuk
+    menjawab query kemiripan dan pencocokan skill secara tervektorisasi.
+
+    Untuk `similar()`, posisi entri setiap baris profil juga disimpan
+    terurut per baris (`row_entries`/`row_ptr`, bentuk CSR), sehingga
+    vektor satu profil cukup diambil sebagai slice.
+
+    Indeks dibangun ulang penuh setiap `TALENTS_SKILL_INDEX_MAX_AGE` detik.
+    Di antaranya, profil yang berubah (ditandai lewat signal di proses ini
+    setelah commit, atau tercatat di log ProfileChange untuk perubahan dari
+    worker lain) diperbarui secara inkremental.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._built_at = None
+        self._synced_at = None
+        self._change_token = 0
+        self._dirty: set[int] = set()
+        self._reset()
+
+    def _reset(self):
+        self.profile_ids = np.zeros(0, dtype=np.int64)
+        self.row_of: dict[int, int] = {}
+        self.col_of: dict[int, int] = {}
+        self.skill_ids = np.zeros(0, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self.prodi_codes: dict[str, int] = {}
+        self.prodi = np.zeros(0, dtype=np.int32)
+        self.angkatan = np.zeros(0, dtype=np.int32)
+        self.rows = np.zeros(0, dtype=np.int32)
+        self.cols = np.zeros(0, dtype=np.int32)
+        self.levels = np.zeros(0, dtype=np.int8)
+        self.weights = np.zeros(0, dtype=np.float32)
+        self.col_ptr = np.zeros(1, dtype=np.int64)
+        self.row_entries = np.zeros(0, dtype=np.int64)
+        self.row_ptr = np.zeros(1, dtype=np.int64)
+        self.norms = np.zeros(0, dtype=np.float64)
+        self.sizes = np.zeros(0, dtype=np.int32)
+
+    # -- pemeliharaan -----------------------------------------------------
+
+    def mark_dirty(self, profile_id: int) -> None:
+        self._dirty.add(profile_id)
+
+    def _fetch(self, profile_ids=None):
+        qs = StudentSkill.objects.filter(student__is_public=True, student__is_active=True)
+        if profile_ids is not None:
+            qs = qs.filter(student_id__in=profile_ids)
+        return qs.values_list(
+            "student_id",
+            "skill_id",
+            "level",
+            "endorsement_count",
+            "student__prodi",
+            "student__angkatan",
+        )
+
+    def _encode(self, records):
+        row_of, col_of = self.row_of, self.col_of
+        new_profiles, new_skills = [], []
+        rows, cols, levels, weights = [], [], [], []
+        attributes = {}
+        for profile_id, skill_id, level, endorsements, prodi, angkatan in records:
+            row = row_of.get(profile_id)
+            if row is None:
+                row = row_of[profile_id] = len(row_of)
+                new_profiles.append(profile_id)
+            if row not in attributes:
+                attributes[row] = (
+                    self.prodi_codes.setdefault(prodi.casefold(), len(self.prodi_codes)),
+                    int(angkatan) if angkatan.isdigit() else 0,
+                )
+            col = col_of.get(skill_id)
+            if col is None:
+                col = col_of[skill_id] = len(col_of)
+                new_skills.append(skill_id)
+            code = LEVEL_CODES.get(level, 1)
+            rows.append(row)
+            cols.append(col)
+            levels.append(code)
+            weights.append(skill_weight(code, endorsements))
+        self.profile_ids = np.concatenate(
+            (self.profile_ids, np.asarray(new_profiles, dtype=np.int64))
+        )
+        self.active = np.concatenate((self.active, np.ones(len(new_profiles), dtype=bool)))
+        grow = np.zeros(len(new_profiles), dtype=np.int32)
+        self.prodi = np.concatenate((self.prodi, grow))
+        self.angkatan = np.concatenate((self.angkatan, grow))
+        if attributes:
+            touched = np.fromiter(attributes, dtype=np.int64, count=len(attributes))
+            values = np.array(list(attributes.values()), dtype=np.int32)
+            self.prodi[touched] = values[:, 0]
+            self.angkatan[touched] = values[:, 1]
+        self.skill_ids = np.concatenate((self.skill_ids, np.asarray(new_skills, dtype=np.int64)))
+        return (
+            np.asarray(rows, dtype=np.int32),
+            np.asarray(cols, dtype=np.int32),
+            np.asarray(levels, dtype=np.int8),
+            np.asarray(weights, dtype=np.float32),
+        )
+
+    def _finalize(self, rows, cols, levels, weights):
+        order = np.argsort(cols, kind="stable")
+        self.rows, self.cols = rows[order], cols[order]
+        self.levels, self.weights = levels[order], weights[order]
+        counts = np.bincount(self.cols, minlength=len(self.col_of))
+        self.col_ptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        n = len(self.row_of)
+        self.norms = np.sqrt(
+            np.bincount(self.rows, weights=self.weights.astype(np.float64) ** 2, minlength=n)
+        )
+        self.sizes = np.bincount(self.rows, minlength=n).astype(np.int32)
+        self.row_entries = np.argsort(self.rows, kind="stable")
+        self.row_ptr = np.concatenate(([0], np.cumsum(self.sizes))).astype(np.int64)
+
+    def _read_changes(self):
+        """
+        Id profil di log ProfileChange sesudah token terakhir. Token hanya
+        maju melewati baris yang lebih tua dari TALENTS_CHANGES_SAFETY_LAG
+        detik (lihat talents.changes.changes_since), jadi baris dari
+        transaksi yang commit belakangan dengan id lebih kecil tetap
+        terbaca; baris yang lebih baru dibaca lagi pada sinkronisasi
+        berikutnya, yang tidak mengubah hasil.
+        """
+        cutoff = timezone.now() - datetime.timedelta(seconds=settings.TALENTS_CHANGES_SAFETY_LAG)
+        changed = set()
+        for change_id, student_id, created_at in ProfileChange.objects.filter(
+            id__gt=self._change_token
+        ).values_list("id", "student_id", "created_at").order_by("id"):
+            changed.add(student_id)
+            if created_at <= cutoff:
+                self._change_token = change_id
+        return changed
+
+    def rebuild(self) -> None:
+        with self._lock:
+            # Token diambil sebelum membaca skill: perubahan sesudahnya
+            # diterapkan oleh sync berikutnya.
+            self._change_token = 0
+            self._read_changes()
+            self._reset()
+            self._dirty.clear()
+            self._finalize(*self._encode(self._fetch().iterator(chunk_size=5000)))
+            self._built_at = self._synced_at = time.monotonic()
+
+    def sync(self) -> None:
+        """
+        Terapkan perubahan profil yang ditandai atau yang tercatat di log
+        ProfileChange sejak sinkronisasi terakhir, tanpa membangun ulang
+        penuh.
+        """
+        with self._lock:
+            changed = set(self._dirty)
+            self._dirty.clear()
+            changed.update(self._read_changes())
+            self._synced_at = time.monotonic()
+            if not changed:
+                return
+            records = list(self._fetch(changed))
+            stale_rows = [self.row_of[pid] for pid in changed if pid in self.row_of]
+            keep = ~np.isin(self.rows, stale_rows)
+            self.active[stale_rows] = False
+            new_rows, new_cols, new_levels, new_weights = self._encode(records)
+            self.active[new_rows] = True
+            self._finalize(
+                np.concatenate((self.rows[keep], new_rows)),
+                np.concatenate((self.cols[keep], new_cols)),
+                np.concatenate((self.levels[keep], new_levels)),
+                np.concatenate((self.weights[keep], new_weights)),
+            )
+
+    def ensure_fresh(self) -> None:
+        now = time.monotonic()
+        if self._built_at is None or now - self._built_at > settings.TALENTS_SKILL_INDEX_MAX_AGE:
+            self.rebuild()
+        elif self._dirty or now - self._synced_at > settings.TALENTS_SKILL_INDEX_SYNC_INTERVAL:
+            self.sync()
+
+    # -- query ------------------------------------------------------------
+
+    def _gather(self, cols):
+        """
+        Indeks entri (posisi di array CSC) untuk setiap kolom di `cols`,
+        beserta posisi kolom asal masing-masing entri.
+        """
+        starts = self.col_ptr[cols]
+        lengths = self.col_ptr[np.asarray(cols) + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        owner = np.repeat(np.arange(len(cols)), lengths)
+        offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return starts[owner] + offsets, owner
+
+    @staticmethod
+    def _top_k(scores, k):
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def similar(self, profile_id: int, k: int = 6, metric: str = "cosine"):
+        """
+        `k` profil dengan vektor skill paling mirip (cosine berbobot atau
+        Jaccard atas himpunan skill). Mengembalikan list (profile_id, skor).
+        """
+        with self._lock:
+            self.ensure_fresh()
+            row = self.row_of.get(profile_id)
+            if row is None or not self.active[row]:
+                return []
+            mine = self.row_entries[self.row_ptr[row]:self.row_ptr[row + 1]]
+            if not len(mine):
+                return []
+            entries, owner = self._gather(self.cols[mine])
+            n = len(self.row_of)
+            candidates = self.rows[entries]
+            overlap = np.bincount(candidates, minlength=n)
+            if metric == "jaccard":
+                union = self.sizes + len(mine) - overlap
+                scores = np.divide(
+                    overlap, union, out=np.zeros(n), where=union > 0
+                )
+            else:
+                dots = np.bincount(
+                    candidates,
+                    weights=self.weights[entries].astype(np.float64)
+                    * self.weights[mine][owner],
+                    minlength=n,
+                )
+                denom = self.norms * self.norms[row]
+                scores = np.divide(dots, denom, out=np.zeros(n), where=denom > 0)
+            scores[row] = 0
+            scores[~self.active] = 0
+            top = self._top_k(scores, k)
+            return [(int(self.profile_ids[i]), float(scores[i])) for i in top]
+
+    def match(self, requirements, prodi=None, angkatan=None, limit=20):
+        """
+        Peringkat profil untuk sekumpulan kebutuhan skill berbobot.
+
+        `requirements` berisi tuple (skill_id, level minimum, bobot). Skill
+        yang levelnya memenuhi mendapat nilai penuh, level di bawahnya
+        mendapat nilai sebagian (0.5 x level / minimum). Skor akhir adalah
+        rata-rata berbobot di rentang 0..1. `prodi` dan `angkatan` berupa
+        daftar nilai yang diizinkan (kosong berarti semua).
+        Mengembalikan list (profile_id, skor).
+        """
+        with self._lock:
+            self.ensure_fresh()
+            n = len(self.row_of)
+            scores = np.zeros(n)
+            total_weight = 0.0
+            for skill_id, min_level, weight in requirements:
+                total_weight += weight
+                col = self.col_of.get(skill_id)
+                if col is None:
+                    continue
+                start, end = self.col_ptr[col], self.col_ptr[col + 1]
+                levels = self.levels[start:end]
+                credit = np.where(levels >= min_level, 1.0, 0.5 * levels / min_level)
+                # Satu profil paling banyak satu entri per skill, jadi
+                # penjumlahan lewat fancy indexing aman.
+                scores[self.rows[start:end]] += weight * credit
+            if not total_weight:
+                return []
+            scores /= total_weight
+
+            allowed = self.active.copy()
+            if prodi:
+                codes = [self.prodi_codes.get(value.casefold(), -1) for value in prodi]
+                allowed &= np.isin(self.prodi, codes)
+            if angkatan:
+                allowed &= np.isin(self.angkatan, [int(value) for value in angkatan])
+            scores[~allowed] = 0
+            top = self._top_k(scores, limit)
+            return [(int(self.profile_ids[i]), float(scores[i])) for i in top]
+
+
+skill_index = SkillIndex()
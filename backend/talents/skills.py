@@ -0,0 +1,154 @@
+import threading
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from .changes import log_profile_changes
+from .models import (
+    Endorsement,
+    Skill,
+    SkillAlias,
+    StudentSkill,
+    normalize_skill_name,
+)
+
+SKILL_MAP_VERSION_KEY = "talents:skill-map:version"
+
+
+class SkillNameMap:
+    """
+    Peta nama skill ternormalisasi (termasuk alias) -> (id, nama kanonik)
+    yang disimpan per proses. Versi peta disimpan di cache bersama, jadi
+    perubahan skill/alias di worker lain membuat peta dimuat ulang. Tanpa
+    cache bersama (LocMemCache) versi itu tidak terlihat lintas proses;
+    penulis yang menyimpan skill hasil peta menangani id yang sudah hilang
+    dengan `reload()` (lihat MySkillViewSet.perform_create).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, str]] = {}
+        self._version = None
+
+    def _load(self, version):
+        entries = {
+            normalized: (pk, name)
+            for pk, name, normalized in Skill.objects.values_list(
+                "id", "name", "normalized_name"
+            )
+        }
+        for alias, pk, name in SkillAlias.objects.values_list(
+            "alias", "skill_id", "skill__name"
+        ):
+            entries.setdefault(alias, (pk, name))
+        self._entries = entries
+        self._version = version
+
+    def _ensure_fresh(self):
+        version = cache.get(SKILL_MAP_VERSION_KEY)
+        if version is None:
+            version = 1
+            cache.add(SKILL_MAP_VERSION_KEY, version, None)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._load(version)
+
+    def get(self, name: str):
+        self._ensure_fresh()
+        return self._entries.get(normalize_skill_name(name))
+
+    def reload(self) -> None:
+        with self._lock:
+            self._load(self._version)
+
+    def remember(self, skill: Skill) -> None:
+        self._entries[skill.normalized_name] = (skill.pk, skill.name)
+
+
+skill_name_map = SkillNameMap()
+
+
+def bump_skill_map_version() -> None:
+    try:
+        cache.incr(SKILL_MAP_VERSION_KEY)
+    except ValueError:
+        cache.set(SKILL_MAP_VERSION_KEY, 2, None)
+
+
+def resolve_skill(name: str) -> Skill:
+    """
+    Kembalikan skill kanonik untuk `name`. Pada kasus umum (skill sudah
+    dikenal) tidak ada query ke database sama sekali.
+    """
+    entry = skill_name_map.get(name)
+    if entry is not None:
+        pk, canonical = entry
+        skill = Skill(id=pk, name=canonical)
+        skill.normalized_name = normalize_skill_name(canonical)
+        return skill
+    skill, _ = Skill.objects.get_or_create(
+        normalized_name=normalize_skill_name(name),
+        defaults={"name": " ".join(name.split())},
+    )
+    skill_name_map.remember(skill)
+    return skill
+
+
+@transaction.atomic
+def merge_skills(target: Skill, sources) -> int:
+    """
+    Gabungkan skill `sources` ke `target`: baris StudentSkill dipindah
+    secara bulk, duplikat per mahasiswa dilebur (endorsement ikut pindah),
+    lalu nama sumber dicatat sebagai alias. Mengembalikan jumlah baris
+    StudentSkill yang dipindah atau dilebur.
+    """
+    sources = [skill for skill in sources if skill.pk != target.pk]
+    if not sources:
+        return 0
+    source_ids = [skill.pk for skill in sources]
+    moving = StudentSkill.objects.filter(skill_id__in=source_ids)
+
+    owned = dict(
+        StudentSkill.objects.filter(
+            skill=target,
+            student_id__in=moving.values("student_id"),
+        ).values_list("student_id", "id")
+    )
+    # Jika mahasiswa punya beberapa skill sumber sekaligus, hanya satu yang
+    # boleh dipindah; sisanya dianggap duplikat.
+    keepers = {}
+    duplicates = []
+    for row in moving.order_by("id").values("id", "student_id"):
+        student_id = row["student_id"]
+        if student_id in owned or student_id in keepers:
+            duplicates.append((row["id"], owned.get(student_id) or keepers[student_id]))
+        else:
+            keepers[student_id] = row["id"]
+
+    for duplicate_id, canonical_id in duplicates:
+        endorsers = Endorsement.objects.filter(endorsed_skill_id=canonical_id).values(
+            "endorser_id"
+        )
+        moved = (
+            Endorsement.objects.filter(endorsed_skill_id=duplicate_id)
+            .exclude(endorser_id__in=endorsers)
+            .update(endorsed_skill_id=canonical_id)
+        )
+        if moved:
+            StudentSkill.objects.filter(pk=canonical_id).update(
+                endorsement_count=F("endorsement_count") + moved
+            )
+    StudentSkill.objects.filter(pk__in=[pk for pk, _ in duplicates]).delete()
+    rewritten = StudentSkill.objects.filter(pk__in=keepers.values()).update(skill=target)
+    log_profile_changes(keepers)
+
+    SkillAlias.objects.filter(skill_id__in=source_ids).update(skill=target)
+    for skill in sources:
+        SkillAlias.objects.update_or_create(
+            alias=skill.normalized_name, defaults={"skill": target}
+        )
+    Skill.objects.filter(pk__in=source_ids).delete()
+    transaction.on_commit(bump_skill_map_version)
+    return rewritten + len(duplicates)
@@ -0,0 +1,160 @@
+"""
+Snapshot statis direktori publik: dokumen JSON (statistik, halaman daftar
+publik dan satu dokumen per profil) beserta versi .gz/.br-nya, ditulis ke
+TALENTS_SNAPSHOT_ROOT dengan nama berisi hash isi sehingga bisa di-cache
+selamanya oleh browser/CDN. `manifest.json` (nama tetap, di-cache singkat)
+menunjuk ke dokumen versi terkini:
+
+    {"version": ..., "built_at": ..., "count": ..., "page_size": ...,
+     "statistics": "statistics.<hash>.json",
+     "pages": ["list/1.<hash>.json", ...]}
+
+Setiap item halaman daftar membawa `document`, path dokumen profilnya.
+Dokumen yang isinya tidak berubah tidak ditulis ulang, dan file yang tidak
+lagi dirujuk dihapus setelah TALENTS_SNAPSHOT_KEEP_SECONDS.
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from config.renderers import FastJSONRenderer
+
+from .filters import public_profiles
+from .serializers import StudentProfileSerializer
+from .views import TalentDetailView, statistics_data
+from .warmup import warm_request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependensi opsional
+    brotli = None
+
+MANIFEST_NAME = "manifest.json"
+SCHEDULED_KEY = "talents:snapshot:scheduled"
+CHUNK_SIZE = 1000
+
+
+def _render(data) -> bytes:
+    return FastJSONRenderer().render(data)
+
+
+def _write_atomic(path, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(content)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+class SnapshotWriter:
+    def __init__(self, root):
+        self.root = str(root)
+        self.referenced: set[str] = set()
+        self.written = 0
+
+    def write(self, stem: str, data) -> str:
+        """
+        Tulis dokumen `<stem>.<hash>.json` (+ .gz/.br) bila belum ada dan
+        kembalikan path relatifnya.
+        """
+        content = _render(data)
+        digest = hashlib.md5(content).hexdigest()[:12]
+        name = f"{stem}.{digest}.json"
+        path = os.path.join(self.root, name)
+        variants = {name: content}
+        if not os.path.exists(path):
+            variants[name + ".gz"] = gzip.compress(content, compresslevel=9, mtime=0)
+            if brotli is not None:
+                variants[name + ".br"] = brotli.compress(content, quality=11)
+            # File utama ditulis terakhir: keberadaannya menandakan varian
+            # terkompresinya sudah siap.
+            for variant in sorted(variants, key=lambda item: item == name):
+                _write_atomic(os.path.join(self.root, variant), variants[variant])
+            self.written += 1
+        self.referenced.update(
+            [name, name + ".gz", name + ".br"]
+        )
+        return name
+
+    def collect_garbage(self) -> int:
+        """
+        Hapus file yang tidak dirujuk manifest baru dan sudah lebih tua dari
+        masa tenggang (klien yang masih memegang manifest lama tetap aman).
+        """
+        cutoff = time.time() - settings.TALENTS_SNAPSHOT_KEEP_SECONDS
+        removed = 0
+        for directory, _, files in os.walk(self.root):
+            for filename in files:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, "/")
+                if name == MANIFEST_NAME or name in self.referenced:
+                    continue
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+        return removed
+
+
+def build_snapshot(root=None, base_url=None) -> dict:
+    """
+    Bangun snapshot lengkap lalu terbitkan manifest barunya. Mengembalikan
+    manifest beserta jumlah file yang ditulis dan dihapus.
+    """
+    writer = SnapshotWriter(root or settings.TALENTS_SNAPSHOT_ROOT)
+    request = warm_request(base_url or settings.CACHE_WARM_BASE_URL)
+    page_size = settings.TALENTS_SNAPSHOT_PAGE_SIZE
+
+    ids = list(public_profiles().order_by("-created_at", "-id").values_list("id", flat=True))
+    pages = []
+    page_items = []
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+        profiles = TalentDetailView.queryset.in_bulk(chunk)
+        for pk in chunk:
+            if pk not in profiles:
+                continue
+            data = StudentProfileSerializer(profiles[pk], context={"request": request}).data
+            item = {**data, "document": writer.write(f"profiles/{pk}", data)}
+            page_items.append(item)
+            if len(page_items) == page_size:
+                pages.append(writer.write(f"list/{len(pages) + 1}", {
+                    "page": len(pages) + 1, "count": len(ids), "results": page_items,
+                }))
+                page_items = []
+    if page_items or not pages:
+        pages.append(writer.write(f"list/{len(pages) + 1}", {
+            "page": len(pages) + 1, "count": len(ids), "results": page_items,
+        }))
+
+    manifest = {
+        "statistics": writer.write("statistics", statistics_data()),
+        "pages": pages,
+        "count": len(ids),
+        "page_size": page_size,
+    }
+    manifest["version"] = hashlib.md5(_render(manifest)).hexdigest()[:12]
+    manifest["built_at"] = timezone.now().isoformat()
+    _write_atomic(os.path.join(writer.root, MANIFEST_NAME), _render(manifest))
+    return {**manifest, "written": writer.written, "removed": writer.collect_garbage()}
+
+
+def schedule_snapshot() -> None:
+    """
+    Jadwalkan pembangunan ulang lewat antrean job, paling cepat
+    TALENTS_SNAPSHOT_DEBOUNCE detik lagi. Perubahan selama jeda itu
+    digabung ke job yang sama.
+    """
+    if not settings.TALENTS_SNAPSHOT_ENABLED:
+        return
+    if cache.add(SCHEDULED_KEY, 1, settings.TALENTS_SNAPSHOT_DEBOUNCE + 60):
+        from jobs.queue import enqueue
+
+        enqueue("talents.build_snapshot", delay=settings.TALENTS_SNAPSHOT_DEBOUNCE)
@@ -0,0 +1,169 @@
+"""
+Kolom ringkasan di StudentProfile (jumlah skill, total endorsement dan skor
+kelengkapan) yang dipakai untuk mengurutkan direktori publik. Nilainya
+dihitung ulang di database lewat signal setiap kali data terkait berubah,
+sehingga pengurutan cukup membaca kolom yang terindeks.
+
+Ringkasan pengalaman (total bulan, sedang bekerja, perusahaan terakhir)
+juga bergantung pada tanggal hari ini, jadi selain lewat signal, profil
+dengan pengalaman yang masih berjalan disegarkan harian oleh
+`manage.py refresh_experience_totals`.
+"""
+
+import datetime
+from operator import itemgetter
+
+from django.db.models import Case, Count, Exists, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+# Bobot skor kelengkapan profil (total 100). Bagian "relasi" bernilai
+# penuh bila profil punya minimal satu baris.
+COMPLETENESS_FIELDS = {
+    "headline": 10,
+    "bio": 15,
+    "photo": 15,
+}
+COMPLETENESS_RELATIONS = {
+    "student_skills": 20,
+    "experiences": 15,
+    "projects": 15,
+    "social_links": 10,
+}
+
+
+def _related(profile_model, name):
+    return profile_model._meta.get_field(name).related_model.objects.filter(
+        student=OuterRef("pk")
+    )
+
+
+def profile_stats_updates(profile_model) -> dict:
+    """
+    Ekspresi `update()` untuk kolom ringkasan. Menerima model sebagai
+    argumen supaya bisa dipakai juga oleh model historis di migrasi.
+    """
+    skills = _related(profile_model, "student_skills").order_by().values("student")
+    completeness = Value(0)
+    for field, weight in COMPLETENESS_FIELDS.items():
+        filled = ~Q(**{field: ""}) & Q(**{f"{field}__isnull": False})
+        completeness += Case(When(filled, then=Value(weight)), default=Value(0))
+    for relation, weight in COMPLETENESS_RELATIONS.items():
+        completeness += Case(
+            When(Exists(_related(profile_model, relation)), then=Value(weight)), default=Value(0)
+        )
+    return {
+        "skill_count": Coalesce(
+            Subquery(skills.annotate(total=Count("pk")).values("total")), 0
+        ),
+        "endorsement_total": Coalesce(
+            Subquery(skills.annotate(total=Sum("endorsement_count")).values("total")), 0
+        ),
+        "completeness": completeness,
+    }
+
+
+def refresh_profile_stats(profile_ids) -> int:
+    from .models import StudentProfile
+
+    return StudentProfile.objects.filter(pk__in=profile_ids).update(
+        **profile_stats_updates(StudentProfile)
+    )
+
+
+EXPERIENCE_TOTAL_FIELDS = ("experience_months", "currently_employed", "latest_company")
+
+
+def _months_between(start, end) -> int:
+    months = (end.year - start.year) * 12 + end.month - start.month
+    if end.day < start.day:
+        months -= 1
+    return max(months, 0)
+
+
+# Urutkan baris pengalaman hanya berdasarkan (mulai, sampai): `end_date`
+# bisa None sehingga tuple lengkapnya tidak selalu bisa dibandingkan.
+_by_period = itemgetter(0, 1)
+
+
+def experience_totals(experiences, today) -> dict:
+    """
+    Ringkasan dari baris `(start_date, end_date, company)` satu profil.
+    Pengalaman tanpa `end_date` dihitung sampai `today`, periode yang
+    tumpang tindih hanya dihitung sekali, dan pengalaman yang belum
+    dimulai diabaikan.
+    """
+    started = sorted(
+        (
+            (start, min(end or today, today), end, company)
+            for start, end, company in experiences
+            if start <= today
+        ),
+        key=_by_period,
+    )
+    months = 0
+    current_start = current_end = None
+    for start, until, _, _ in started:
+        if current_end is not None and start <= current_end:
+            current_end = max(current_end, until)
+            continue
+        if current_end is not None:
+            months += _months_between(current_start, current_end)
+        current_start, current_end = start, until
+    if current_end is not None:
+        months += _months_between(current_start, current_end)
+
+    current = [row for row in started if row[2] is None or row[2] >= today]
+    latest = max(current or started, key=_by_period, default=None)
+    return {
+        "experience_months": months,
+        "currently_employed": bool(current),
+        "latest_company": latest[3] if latest else "",
+    }
+
+
+def refresh_experience_totals(profile_ids, today=None, profile_model=None) -> list:
+    """
+    Hitung ulang ringkasan pengalaman profil `profile_ids` dan tulis yang
+    berubah saja. Mengembalikan id profil yang berubah. `profile_model`
+    untuk model historis di migrasi.
+    """
+    if profile_model is None:
+        from .models import StudentProfile as profile_model
+    experience_model = profile_model._meta.get_field("experiences").related_model
+    today = today or timezone.localdate()
+    rows = {pk: [] for pk in profile_ids}
+    for student_id, *row in experience_model.objects.filter(
+        student_id__in=list(rows)
+    ).values_list("student_id", "start_date", "end_date", "company"):
+        rows[student_id].append(row)
+
+    changed = []
+    for profile in profile_model.objects.filter(pk__in=list(rows)).only("pk", *EXPERIENCE_TOTAL_FIELDS):
+        totals = experience_totals(rows[profile.pk], today)
+        if any(getattr(profile, field) != value for field, value in totals.items()):
+            for field, value in totals.items():
+                setattr(profile, field, value)
+            changed.append(profile)
+    profile_model.objects.bulk_update(changed, EXPERIENCE_TOTAL_FIELDS, batch_size=500)
+    return [profile.pk for profile in changed]
+
+
+def running_experience_profiles(today=None, days=2):
+    """
+    Id profil yang ringkasannya bisa berubah hanya karena tanggal berganti:
+    punya pengalaman tanpa `end_date`, atau yang baru (akan) dimulai atau
+    berakhir dalam `days` hari terakhir.
+    """
+    from .models import Experience
+
+    today = today or timezone.localdate()
+    since = today - datetime.timedelta(days=days)
+    return (
+        Experience.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=since) | Q(start_date__gte=since)
+        )
+        .order_by()
+        .values_list("student_id", flat=True)
+        .distinct()
+    )
@@ -0,0 +1,73 @@
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+
+from jobs.queue import task
+
+from .cache import bump_directory_version
+from .changes import log_profile_changes
+from .models import StudentProfile
+from .snapshot import SCHEDULED_KEY, build_snapshot, schedule_snapshot
+from .visitors import flush_pending_views
+
+SNAPSHOT_LOCK_KEY = "talents:snapshot:lock"
+SNAPSHOT_LOCK_TIMEOUT = 60 * 30
+
+THUMBNAIL_SIZE = (256, 256)
+
+
+@task("talents.make_photo_thumbnail")
+def make_photo_thumbnail(profile_id, photo_name):
+    """
+    Buat thumbnail JPEG dari foto profil. Dilewati bila foto sudah diganti
+    lagi sejak job diantrekan (job untuk foto terbaru yang akan membuatnya).
+    """
+    from PIL import Image, ImageOps
+
+    profile = StudentProfile.objects.filter(pk=profile_id).first()
+    if profile is None or profile.photo.name != photo_name:
+        return
+
+    with profile.photo.open("rb") as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.thumbnail(THUMBNAIL_SIZE)
+        buffer = BytesIO()
+        image.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+
+    previous = profile.photo_thumbnail.name
+    profile.photo_thumbnail.save(f"{profile_id}.jpg", ContentFile(buffer.getvalue()), save=False)
+    StudentProfile.objects.filter(pk=profile_id, photo=photo_name).update(
+        photo_thumbnail=profile.photo_thumbnail.name
+    )
+    if previous and previous != profile.photo_thumbnail.name:
+        profile.photo_thumbnail.storage.delete(previous)
+    bump_directory_version()
+    log_profile_changes([profile_id])
+    schedule_snapshot()
+
+
+@task("talents.flush_profile_views")
+def flush_profile_views():
+    """
+    Tulis kunjungan profil yang tertunda di cache (lihat talents.visitors).
+    """
+    flush_pending_views()
+
+
+@task("talents.build_snapshot")
+def build_directory_snapshot():
+    """
+    Bangun ulang snapshot statis direktori (lihat talents.snapshot). Hanya
+    satu build berjalan sekaligus; bila sedang ada, jadwalkan ulang.
+    """
+    if not cache.add(SNAPSHOT_LOCK_KEY, 1, SNAPSHOT_LOCK_TIMEOUT):
+        cache.delete(SCHEDULED_KEY)
+        schedule_snapshot()
+        return
+    try:
+        # Perubahan setelah titik ini menjadwalkan build berikutnya.
+        cache.delete(SCHEDULED_KEY)
+        build_snapshot()
+    finally:
+        cache.delete(SNAPSHOT_LOCK_KEY)
@@ -0,0 +1,117 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import hll
+from .changes import TokenExpired, changes_since, head_token, prune_changes
+from .models import ProfileChange, StudentProfile
+
+
+def _sketch(values):
+    registers = hll.empty()
+    for value in values:
+        registers = hll.add(registers, value) or registers
+    return registers
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_empty_sketch_estimates_zero(self):
+        self.assertEqual(len(hll.empty()), hll.REGISTERS)
+        self.assertEqual(hll.estimate(hll.empty()), 0)
+
+    def test_adding_a_seen_value_changes_nothing(self):
+        registers = hll.add(hll.empty(), "viewer-1")
+        self.assertIsNotNone(registers)
+        self.assertIsNone(hll.add(registers, "viewer-1"))
+
+    def test_position_is_stable(self):
+        index, rank = hll.position("viewer-1")
+        self.assertEqual((index, rank), hll.position("viewer-1"))
+        self.assertLess(index, hll.REGISTERS)
+        self.assertGreaterEqual(rank, 1)
+
+    def test_estimate_is_close(self):
+        for count in (10, 1000, 20000):
+            estimate = hll.estimate(_sketch(f"viewer-{i}" for i in range(count)))
+            self.assertAlmostEqual(estimate, count, delta=max(count * 0.05, 1))
+
+    def test_merge_counts_union(self):
+        first = _sketch(f"viewer-{i}" for i in range(0, 3000))
+        second = _sketch(f"viewer-{i}" for i in range(2000, 5000))
+        merged = hll.merge([first, second])
+        self.assertEqual(bytes(merged), _sketch(f"viewer-{i}" for i in range(5000)))
+        self.assertAlmostEqual(hll.estimate(merged), 5000, delta=250)
+
+
+@override_settings(TALENTS_CHANGES_SAFETY_LAG=0)
+class ChangeTokenTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def create_profile(self, number):
+        user = get_user_model().objects.create(
+            username=f"user{number}",
+            email=f"l2000000{number:02d}@student.ums.ac.id",
+            full_name=f"Mahasiswa {number}",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            return StudentProfile.objects.create(
+                user=user, nim=f"L2000000{number:02d}", prodi="Informatika", angkatan="2023"
+            )
+
+    def test_token_resumes_after_last_read_change(self):
+        first = self.create_profile(1)
+        updated, removed, token, has_more = changes_since(0, 10)
+        self.assertEqual((updated, removed, has_more), ([first.pk], [], False))
+        self.assertEqual(token, head_token())
+
+        second = self.create_profile(2)
+        self.assertEqual(changes_since(token, 10)[:2], ([second.pk], []))
+        self.assertEqual(changes_since(head_token(), 10)[:2], ([], []))
+
+    def test_limit_pages_through_the_log(self):
+        profiles = [self.create_profile(number) for number in range(1, 4)]
+        updated, _, token, has_more = changes_since(0, 2)
+        self.assertEqual(updated, [profiles[0].pk, profiles[1].pk])
+        self.assertTrue(has_more)
+        updated, _, _, has_more = changes_since(token, 2)
+        self.assertEqual(updated, [profiles[2].pk])
+        self.assertFalse(has_more)
+
+    def test_hidden_profile_is_reported_as_removed(self):
+        profile = self.create_profile(1)
+        token = changes_since(0, 10)[2]
+        profile.is_public = False
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        self.assertEqual(changes_since(token, 10)[:2], ([], [profile.pk]))
+
+    def test_safety_lag_holds_back_recent_changes(self):
+        self.create_profile(1)
+        with override_settings(TALENTS_CHANGES_SAFETY_LAG=60):
+            self.assertEqual(changes_since(0, 10), ([], [], 0, False))
+
+    def test_pruned_token_expires(self):
+        self.create_profile(1)
+        token = changes_since(0, 10)[2]
+        self.create_profile(2)
+        self.create_profile(3)
+        ProfileChange.objects.update(created_at=timezone.now() - datetime.timedelta(days=60))
+        prune_changes(timezone.now() - datetime.timedelta(days=30))
+        with self.assertRaises(TokenExpired):
+            changes_since(token, 10)
+        self.assertEqual(changes_since(head_token(), 10)[:2], ([], []))
+
+    def test_changes_endpoint(self):
+        profile = self.create_profile(1)
+        client = APIClient()
+        response = client.get("/api/talents/changes/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.json()["results"]], [profile.pk])
+        self.assertEqual(response.json()["next"], str(head_token()))
+        self.assertEqual(client.get("/api/talents/changes/?since=abc").status_code, 400)
+        self.assertEqual(client.get("/api/talents/changes/?since=-1").status_code, 400)
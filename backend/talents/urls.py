@@ -4,14 +4,21 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     AdminTalentViewSet,
     LatestTalentListView,
+    home_view,
     MyExperienceViewSet,
     MyProfileView,
     MyProjectViewSet,
     MySkillViewSet,
     MySocialLinkViewSet,
+    my_visitors_view,
     PublicTalentListView,
+    similar_talents_view,
     TalentDetailView,
     statistics_view,
+    talent_batch_view,
+    talent_changes_view,
+    talent_facets_view,
+    talent_match_view,
     top_talents_view,
 )
 
@@ -24,11 +31,18 @@ router.register(r"admin/talents", AdminTalentViewSet, basename="admin-talents")
 
 urlpatterns = [
     path("me/profile/", MyProfileView.as_view(), name="my-profile"),
+    path("me/visitors/", my_visitors_view, name="my-visitors"),
     path("public/", PublicTalentListView.as_view(), name="public-talents"),
     path("latest/", LatestTalentListView.as_view(), name="latest-talents"),
     path("statistics/", statistics_view, name="statistics"),
+    path("home/", home_view, name="talent-home"),
+    path("facets/", talent_facets_view, name="talent-facets"),
+    path("batch/", talent_batch_view, name="talent-batch"),
+    path("changes/", talent_changes_view, name="talent-changes"),
+    path("match/", talent_match_view, name="talent-match"),
     path("top-talents/", top_talents_view, name="top-talents"),
     path("<int:pk>/", TalentDetailView.as_view(), name="talent-detail"),
+    path("<int:pk>/similar/", similar_talents_view, name="similar-talents"),
     path("", include(router.urls)),
 ]
 
@@ -1,11 +1,37 @@
-from django.db.models import Q, Count
+import datetime
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Paginator as DjangoPaginator
+from django.db import IntegrityError, transaction
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
+from django.shortcuts import get_object_or_404
 from rest_framework import generics, mixins, permissions, viewsets
 from rest_framework.response import Response
-from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.exceptions import ValidationError
-
+from rest_framework.decorators import action, api_view, permission_classes, throttle_classes
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from config.db_router import use_primary
+from config.statement_timeout import StatementTimeout, statement_timeout
+from config.throttling import PublicThrottle
+
+from .cache import directory_cache_key, get_or_compute
+from .facets import compute_facets
+from .filters import (
+    DEFAULT_SORT,
+    SORT_ORDERINGS,
+    directory_entries,
+    directory_filter_params,
+    directory_list_params,
+    filter_public_talents,
+    public_profiles,
+)
 from .models import (
     Endorsement,
     Experience,
@@ -24,7 +50,18 @@ from .serializers import (
     StudentProfileSerializer,
     StudentProfileUpdateSerializer,
     StudentSkillSerializer,
+    TalentMatchSerializer,
 )
+from .skills import resolve_skill, skill_name_map
+
+# Header respons yang dijawab dalam mode darurat setelah statement timeout.
+DEGRADED_HEADER = "X-Degraded"
+
+
+class QueryTimedOut(APIException):
+    status_code = 503
+    default_detail = "Pencarian terlalu berat untuk saat ini. Persempit filter lalu coba lagi."
+    default_code = "query_timeout"
 
 
 class IsOwnerProfile(permissions.BasePermission):
@@ -34,8 +71,28 @@ class IsOwnerProfile(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         if isinstance(obj, StudentProfile):
-            return obj.user == request.user
-        return getattr(obj, "student", None) and obj.student.user == request.user
+            return obj.user_id == request.user.pk
+        student_id = getattr(obj, "student_id", None)
+        return student_id is not None and student_id == get_request_profile_id(request)
+
+
+def get_request_profile_id(request):
+    """
+    Id profil milik user yang login. Memakai id yang dibawa principal dari
+    CachedJWTAuthentication bila ada, sehingga tidak perlu query profil.
+    """
+    profile_id = getattr(request.user, "cached_profile_id", None)
+    if profile_id is None:
+        profile_id = request.user.profile.pk
+    return profile_id
+
+
+class OwnProfileMixin:
+    def get_profile_id(self):
+        # drf_yasg memanggil get_queryset tanpa user saat membuat skema.
+        if getattr(self, "swagger_fake_view", False):
+            return None
+        return get_request_profile_id(self.request)
 
 
 class MyProfileView(generics.RetrieveUpdateAPIView):
@@ -45,16 +102,58 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = StudentProfileUpdateSerializer
+    queryset = StudentProfile.objects.select_related("user")
 
     def get_object(self):
-        return self.request.user.profile
+        return get_object_or_404(self.get_queryset(), pk=get_request_profile_id(self.request))
 
     def get(self, request, *args, **kwargs):
-        serializer = StudentProfileSerializer(self.get_object(), context={"request": request})
+        profile = get_object_or_404(
+            self.get_queryset().prefetch_related(
+                "student_skills__skill", "experiences", "projects", "social_links"
+            ),
+            pk=get_request_profile_id(request),
+        )
+        serializer = StudentProfileSerializer(profile, context={"request": request})
         return Response(serializer.data)
 
 
-class MySkillViewSet(viewsets.ModelViewSet):
+def _date_param(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: "Format tanggal harus YYYY-MM-DD."})
+    return parsed
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def my_visitors_view(request):
+    """
+    Jumlah kunjungan dan taksiran pengunjung unik profil sendiri.
+    Query param `start`/`end` (YYYY-MM-DD), default 30 hari terakhir.
+    Kunjungan terbaru muncul setelah flush berikutnya (paling lambat
+    TALENTS_VIEWS_FLUSH_INTERVAL detik).
+    """
+    from .visitors import visitor_summary
+
+    end = _date_param(request, "end") or timezone.localdate()
+    start = _date_param(request, "start") or end - datetime.timedelta(days=29)
+    if start > end:
+        raise ValidationError({"start": "Harus sebelum atau sama dengan end."})
+    if (end - start).days >= settings.TALENTS_VISITORS_MAX_DAYS:
+        raise ValidationError(
+            {"start": f"Rentang maksimal {settings.TALENTS_VISITORS_MAX_DAYS} hari."}
+        )
+    return Response(visitor_summary(get_request_profile_id(request), start, end))
+
+
+class MySkillViewSet(OwnProfileMixin, viewsets.ModelViewSet):
     """
     CRUD skill milik mahasiswa yang sedang login.
     """
@@ -63,8 +162,8 @@ class MySkillViewSet(viewsets.ModelViewSet):
     serializer_class = StudentSkillSerializer
 
     def get_queryset(self):
-        return StudentSkill.objects.select_related("student", "skill").filter(
-            student=self.request.user.profile
+        return StudentSkill.objects.select_related("skill").filter(
+            student_id=self.get_profile_id()
         )
 
     def perform_create(self, serializer):
@@ -73,60 +172,77 @@ class MySkillViewSet(viewsets.ModelViewSet):
             raise ValidationError({"skill_name": "Skill wajib diisi."})
         skill_name = skill_name.strip()
         level = self.request.data.get("level", StudentSkill.Level.BEGINNER)
-        skill, _ = Skill.objects.get_or_create(name=skill_name)
+        try:
+            self._create_skill(serializer, resolve_skill(skill_name), level)
+        except IntegrityError:
+            # Peta skill proses ini basi: skill-nya sudah dilebur atau
+            # dihapus proses lain (FK diperiksa saat commit). Muat ulang
+            # peta lalu coba sekali lagi.
+            serializer.instance = None
+            skill_name_map.reload()
+            self._create_skill(serializer, resolve_skill(skill_name), level)
+
+    def _create_skill(self, serializer, skill, level):
         # Check if student already has this skill
         existing = StudentSkill.objects.filter(
-            student=self.request.user.profile,
+            student_id=self.get_profile_id(),
             skill=skill
         ).first()
         if existing:
             raise ValidationError({"skill_name": "Skill ini sudah ada di profil Anda."})
-        serializer.save(student=self.request.user.profile, skill=skill, level=level)
+        with transaction.atomic():
+            serializer.save(student_id=self.get_profile_id(), skill=skill, level=level)
 
 
-class MyExperienceViewSet(viewsets.ModelViewSet):
+class MyExperienceViewSet(OwnProfileMixin, viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ExperienceSerializer
 
     def get_queryset(self):
-        return Experience.objects.filter(student=self.request.user.profile)
+        return Experience.objects.filter(student_id=self.get_profile_id())
 
     def perform_create(self, serializer):
-        serializer.save(student=self.request.user.profile)
+        serializer.save(student_id=self.get_profile_id())
 
 
-class MyProjectViewSet(viewsets.ModelViewSet):
+class MyProjectViewSet(OwnProfileMixin, viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerProfile]
     serializer_class = PortfolioProjectSerializer
 
     def get_queryset(self):
-        return PortfolioProject.objects.filter(student=self.request.user.profile)
+        return PortfolioProject.objects.filter(student_id=self.get_profile_id())
 
     def perform_create(self, serializer):
-        serializer.save(student=self.request.user.profile)
+        serializer.save(student_id=self.get_profile_id())
 
 
-class MySocialLinkViewSet(viewsets.ModelViewSet):
+class MySocialLinkViewSet(OwnProfileMixin, viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerProfile]
     serializer_class = SocialLinkSerializer
 
     def get_queryset(self):
-        return SocialLink.objects.filter(student=self.request.user.profile)
+        return SocialLink.objects.filter(student_id=self.get_profile_id())
 
     def perform_create(self, serializer):
-        serializer.save(student=self.request.user.profile)
+        serializer.save(student_id=self.get_profile_id())
 
 
 class PublicTalentListView(generics.ListAPIView):
     """
-    List talenta publik dengan filter nama, skill, prodi.
+    List talenta publik dengan filter nama, skill, prodi, pengalaman
+    (`min_experience_months`, `currently_employed`) dan urutan `sort`
+    (lihat talents.filters.SORT_ORDERINGS).
+    Filter dan urutan dibaca dari read model talents.directory tanpa join.
+    Urutan id per kombinasi filter + halaman disimpan di cache (lihat
+    talents.cache.get_or_compute); detail profil selalu diambil segar.
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [PublicThrottle]
     serializer_class = StudentProfileSerializer
 
     def get_queryset(self):
-        qs = (
+        return (
             StudentProfile.objects.select_related("user")
             .prefetch_related(
                 "student_skills__skill",
@@ -136,21 +252,208 @@ class PublicTalentListView(generics.ListAPIView):
             )
             .filter(is_public=True, is_active=True)
         )
-        search = self.request.query_params.get("search")
-        prodi = self.request.query_params.get("prodi")
-        skill_name = self.request.query_params.get("skill")
-        if search:
-            qs = qs.filter(
-                Q(user__full_name__icontains=search)
-                | Q(nim__icontains=search)
-                | Q(prodi__icontains=search)
-                | Q(student_skills__skill__name__icontains=search)
+
+    def list(self, request, *args, **kwargs):
+        try:
+            params = directory_list_params(request.query_params)
+        except ValueError as exc:
+            raise ValidationError(exc.args[0])
+        number = self.get_page_number(request)
+        if number is None:
+            # `?page=last`: jumlah halaman dari total di halaman pertama.
+            first, _ = self.get_page(params, 1)
+            number = max(math.ceil(first["count"] / self.paginator.page_size), 1)
+        page, degraded = self.get_page(params, number)
+
+        profiles = self.get_queryset().in_bulk(page["ids"]) if page["ids"] else {}
+        results = [profiles[pk] for pk in page["ids"] if pk in profiles]
+        serializer = self.get_serializer(results, many=True)
+        url = request.build_absolute_uri()
+        query_param = self.paginator.page_query_param
+        next_url = None
+        if number * self.paginator.page_size < page["count"]:
+            next_url = replace_query_param(url, query_param, number + 1)
+        previous_url = None
+        if number > 1:
+            previous_url = (
+                remove_query_param(url, query_param)
+                if number == 2
+                else replace_query_param(url, query_param, number - 1)
             )
-        if prodi:
-            qs = qs.filter(prodi__iexact=prodi)
-        if skill_name:
-            qs = qs.filter(student_skills__skill__name__icontains=skill_name)
-        return qs.distinct()
+        response = Response({
+            "count": page["count"],
+            "next": next_url,
+            "previous": previous_url,
+            "results": serializer.data,
+        })
+        if degraded:
+            response[DEGRADED_HEADER] = degraded
+        return response
+
+    def get_page_number(self, request):
+        """
+        Nomor halaman dari `?page=` sebagai int, atau None untuk `last`.
+        Nilai lain ditolak sebelum menyentuh cache.
+        """
+        value = request.query_params.get(self.paginator.page_query_param) or "1"
+        if value in self.paginator.last_page_strings:
+            return None
+        try:
+            number = int(value)
+        except ValueError:
+            raise NotFound("Invalid page.")
+        if number < 1:
+            raise NotFound("Invalid page.")
+        return number
+
+    def get_page(self, params, number):
+        """
+        Halaman `number` dari cache (lihat get_page_ids), atau jawaban
+        pengganti setelah timeout. Mengembalikan (halaman, nilai header
+        X-Degraded). Halaman di luar jangkauan tidak disimpan di cache.
+        """
+        key = public_list_cache_key(params, number)
+        try:
+            try:
+                page = get_or_compute(
+                    key,
+                    lambda: self.get_page_ids(params, number),
+                    fresh_for=settings.TALENTS_LIST_CACHE_TIMEOUT,
+                    stale_for=settings.TALENTS_LIST_CACHE_STALE,
+                )
+            except StatementTimeout:
+                return self.get_degraded_page(key, params, number)
+        except InvalidPage:
+            raise NotFound("Invalid page.")
+        return page, None
+
+    def get_page_ids(self, params, page_number, limited_search=False):
+        """
+        Id profil (terurut) untuk satu halaman beserta total hasil.
+        Nomor halaman yang tidak valid menaikkan InvalidPage, sehingga
+        tidak ikut di-cache. Dibatasi statement timeout endpoint ini
+        (StatementTimeout).
+        """
+        ordering = SORT_ORDERINGS[params.get("sort", DEFAULT_SORT)]
+        ids = filter_public_talents(
+            directory_entries(), params, limited_search=limited_search
+        ).order_by(*ordering).values_list("profile_id", flat=True)
+        paginator = DjangoPaginator(ids, self.paginator.page_size)
+        with statement_timeout("public-talents"):
+            page = paginator.page(page_number)
+            return {"ids": list(page.object_list), "count": paginator.count}
+
+    def get_degraded_page(self, key, params, page_number):
+        """
+        Jawaban pengganti setelah timeout: hasil cache (bila sudah diisi
+        worker lain), atau pencarian yang dibatasi ke awalan NIM/nama.
+        Mengembalikan (halaman, nilai header X-Degraded).
+        """
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["value"], "stale"
+        if params.get("search"):
+            try:
+                return self.get_page_ids(params, page_number, limited_search=True), "search-limited"
+            except StatementTimeout:
+                pass
+        raise QueryTimedOut()
+
+
+def public_list_cache_key(params, page_number) -> str:
+    return directory_cache_key("list", {**params, "page": str(page_number)}, versioned=False)
+
+
+def home_cache_key(name, request=None) -> str:
+    """
+    Kunci cache respons halaman utama. Respons berisi URL foto absolut,
+    jadi host request ikut menjadi bagian kunci.
+    """
+    base_url = request.build_absolute_uri("/") if request is not None else None
+    return directory_cache_key(name, {"base": base_url}, versioned=False)
+
+
+def talent_detail_cache_key(pk, request) -> str:
+    return directory_cache_key(
+        "detail", {"pk": int(pk), "base": request.build_absolute_uri("/")}
+    )
+
+
+def latest_talent_ids(limit=5):
+    # Urutan `newest` dari read model direktori, memakai index-nya.
+    return directory_entries().order_by(*SORT_ORDERINGS[DEFAULT_SORT]).values_list(
+        "profile_id", flat=True
+    )[:limit]
+
+
+def latest_talents_data(request):
+    talents = (
+        StudentProfile.objects.filter(pk__in=list(latest_talent_ids()))
+        .select_related("user")
+        .prefetch_related("student_skills__skill", "experiences", "projects", "social_links")
+        .order_by("-created_at", "-id")
+    )
+    return StudentProfileSerializer(talents, many=True, context={"request": request}).data
+
+
+def top_talents_queryset():
+    return (
+        StudentProfile.objects
+        .filter(is_public=True, is_active=True)
+        # `skill_count` adalah kolom yang dijaga signal (talents.stats).
+        .annotate(experience_count=Count('experiences'))
+        .order_by('-skill_count', '-experience_count')[:2]
+    )
+
+
+def top_talents_data(request):
+    talents = top_talents_queryset().select_related("user").prefetch_related(
+        "student_skills__skill", "experiences", "projects", "social_links"
+    )
+    return StudentProfileSerializer(talents, many=True, context={"request": request}).data
+
+
+def statistics_data():
+    total_talents = StudentProfile.objects.filter(is_public=True, is_active=True).count()
+    total_skills = StudentSkill.objects.filter(student__is_public=True, student__is_active=True).values('skill').distinct().count()
+    total_experiences = Experience.objects.filter(student__is_public=True, student__is_active=True).count()
+    return {
+        'total_talents': total_talents,
+        'total_skills': total_skills,
+        'total_experiences': total_experiences,
+    }
+
+
+def home_data(request):
+    """
+    Ketiga bagian halaman utama sekaligus. Id talenta terbaru, id top
+    talents dan statistik dihitung berurutan di koneksi request (query
+    ringan; thread terpisah justru membuka koneksi baru masing-masing),
+    lalu semua profilnya diambil dengan satu prefetch dan diserialisasi
+    sekali.
+    """
+    latest_ids = list(latest_talent_ids())
+    top_ids = list(top_talents_queryset().values_list("id", flat=True))
+    statistics = statistics_data()
+    profiles = TalentDetailView.queryset.in_bulk(set(latest_ids) | set(top_ids))
+    serialized = {
+        pk: StudentProfileSerializer(profile, context={"request": request}).data
+        for pk, profile in profiles.items()
+    }
+    return {
+        "latest": [serialized[pk] for pk in latest_ids if pk in serialized],
+        "top_talents": [serialized[pk] for pk in top_ids if pk in serialized],
+        "statistics": statistics,
+    }
+
+
+def cached_home_data(name, compute, request=None):
+    return get_or_compute(
+        home_cache_key(name, request),
+        compute,
+        fresh_for=settings.TALENTS_LIST_CACHE_TIMEOUT,
+        stale_for=settings.TALENTS_LIST_CACHE_STALE,
+    )
 
 
 class LatestTalentListView(generics.ListAPIView):
@@ -159,26 +462,41 @@ class LatestTalentListView(generics.ListAPIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [PublicThrottle]
     serializer_class = StudentProfileSerializer
 
-    def get_queryset(self):
-        return (
-            StudentProfile.objects.filter(is_public=True, is_active=True)
-            .order_by("-created_at")[:5]
-        )
+    def list(self, request, *args, **kwargs):
+        # Selalu muat dalam satu halaman; bentuk respons tetap mengikuti
+        # paginator default.
+        results = cached_home_data("latest", lambda: latest_talents_data(request), request)
+        return Response({"count": len(results), "next": None, "previous": None, "results": results})
 
 
 class TalentDetailView(generics.RetrieveAPIView):
     """
-    Detail satu talenta.
+    Detail satu talenta. Hasil serialisasi disimpan di cache sampai data
+    direktori berubah.
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [PublicThrottle]
     serializer_class = StudentProfileSerializer
     queryset = StudentProfile.objects.select_related("user").prefetch_related(
         "student_skills__skill", "experiences", "projects", "social_links"
     )
 
+    def retrieve(self, request, *args, **kwargs):
+        from .visitors import record_profile_view
+
+        key = talent_detail_cache_key(self.kwargs["pk"], request)
+        data = cache.get(key)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(key, data, settings.TALENTS_DETAIL_CACHE_TIMEOUT)
+        if data["is_public"] and data["is_active"]:
+            record_profile_view(request, data["id"])
+        return Response(data)
+
 
 class AdminTalentViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     """
@@ -193,52 +511,249 @@ class AdminTalentViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
     def deactivate(self, request, pk=None):
         profile = self.get_object()
         profile.is_active = False
-        profile.save(update_fields=["is_active"])
+        profile.save(update_fields=["is_active", "updated_at"])
         return Response({"status": "deactivated"})
 
     @action(detail=True, methods=["post"])
     def activate(self, request, pk=None):
         profile = self.get_object()
         profile.is_active = True
-        profile.save(update_fields=["is_active"])
+        profile.save(update_fields=["is_active", "updated_at"])
         return Response({"status": "activated"})
 
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
 def statistics_view(request):
     """
     Endpoint untuk mendapatkan statistik publik.
     """
-    total_talents = StudentProfile.objects.filter(is_public=True, is_active=True).count()
-    total_skills = StudentSkill.objects.filter(student__is_public=True, student__is_active=True).values('skill').distinct().count()
-    total_experiences = Experience.objects.filter(student__is_public=True, student__is_active=True).count()
-    
-    return Response({
-        'total_talents': total_talents,
-        'total_skills': total_skills,
-        'total_experiences': total_experiences,
-    })
+    return Response(cached_home_data("statistics", statistics_data))
 
 
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
 def top_talents_view(request):
     """
     Endpoint untuk mendapatkan top 2 talents dengan skill dan experience terbanyak.
     """
-    talents = (
-        StudentProfile.objects
-        .filter(is_public=True, is_active=True)
-        .annotate(
-            skill_count=Count('student_skills'),
-            experience_count=Count('experiences')
+    return Response(cached_home_data("top", lambda: top_talents_data(request), request))
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def home_view(request):
+    """
+    Gabungan latest/, top-talents/ dan statistics/ untuk halaman utama
+    dalam satu respons.
+    """
+    return Response(get_or_compute(
+        home_cache_key("home", request),
+        lambda: home_data(request),
+        fresh_for=settings.TALENTS_HOME_CACHE_TIMEOUT,
+        stale_for=settings.TALENTS_LIST_CACHE_STALE,
+    ))
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def talent_facets_view(request):
+    """
+    Jumlah talenta per prodi, angkatan, skill dan level untuk filter
+    direktori yang sedang aktif.
+    """
+    try:
+        params = directory_filter_params(request.query_params)
+    except ValueError as exc:
+        raise ValidationError(exc.args[0])
+    key = directory_cache_key("facets", params)
+    facets = cache.get(key)
+    if facets is not None:
+        return Response(facets)
+    # Salinan tanpa versi sebagai cadangan bila perhitungan ulang timeout.
+    fallback_key = directory_cache_key("facets-fallback", params, versioned=False)
+    try:
+        with statement_timeout("talent-facets"):
+            facets = compute_facets(params)
+    except StatementTimeout:
+        facets = cache.get(fallback_key)
+        if facets is None:
+            raise QueryTimedOut()
+        return Response(facets, headers={DEGRADED_HEADER: "stale"})
+    cache.set(key, facets, settings.TALENTS_FACETS_CACHE_TIMEOUT)
+    cache.set(fallback_key, facets, settings.TALENTS_DEGRADED_CACHE_TIMEOUT)
+    return Response(facets)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def similar_talents_view(request, pk):
+    """
+    Talenta dengan skill paling mirip dengan talenta `pk`.
+    Query param: `k` (jumlah, maks 20) dan `metric` (`cosine`/`jaccard`).
+    """
+    from .skill_index import skill_index
+
+    get_object_or_404(public_profiles(), pk=pk)
+    try:
+        k = min(max(int(request.query_params.get("k", 6)), 1), 20)
+    except ValueError:
+        raise ValidationError({"k": "Harus berupa angka."})
+    metric = request.query_params.get("metric", "cosine")
+    if metric not in ("cosine", "jaccard"):
+        raise ValidationError({"metric": "Pilih 'cosine' atau 'jaccard'."})
+
+    ranked = skill_index.similar(pk, k=k, metric=metric)
+    return Response(_serialize_ranked(request, ranked, "similarity"))
+
+
+def profile_payloads(request, ids) -> dict:
+    """
+    Data detail untuk banyak profil ({id: data}), memakai cache detail yang
+    sama dengan TalentDetailView; sisanya diambil dengan satu prefetch lalu
+    disimpan ke cache. Profil yang tidak ada tidak disertakan.
+    """
+    keys = {pk: talent_detail_cache_key(pk, request) for pk in ids}
+    cached = cache.get_many(keys.values())
+    found = {pk: cached[key] for pk, key in keys.items() if key in cached}
+    missing = [pk for pk in ids if pk not in found]
+    if missing:
+        fresh = serialize_profiles(request, missing)
+        cache.set_many({keys[pk]: data for pk, data in fresh.items()}, settings.TALENTS_DETAIL_CACHE_TIMEOUT)
+        found.update(fresh)
+    return found
+
+
+def serialize_profiles(request, ids) -> dict:
+    """
+    Data detail untuk banyak profil ({id: data}) langsung dari database
+    dengan satu prefetch, tanpa cache. Profil yang tidak ada tidak
+    disertakan.
+    """
+    profiles = TalentDetailView.queryset.in_bulk(ids)
+    return {
+        pk: StudentProfileSerializer(profile, context={"request": request}).data
+        for pk, profile in profiles.items()
+    }
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def talent_batch_view(request):
+    """
+    Banyak detail talenta sekaligus: `?ids=3,1,7` (maks
+    TALENTS_BATCH_MAX_SIZE). Urutan mengikuti `ids`; profil yang tidak
+    ada, tidak publik atau nonaktif dilewati. Memakai cache detail yang
+    sama dengan TalentDetailView, sisanya diambil dengan satu prefetch.
+    """
+    raw = [value.strip() for value in request.query_params.get("ids", "").split(",")]
+    try:
+        ids = list(dict.fromkeys(int(value) for value in raw if value))
+    except ValueError:
+        raise ValidationError({"ids": "Harus berupa daftar id yang dipisah koma."})
+    if len(ids) > settings.TALENTS_BATCH_MAX_SIZE:
+        raise ValidationError(
+            {"ids": f"Maksimal {settings.TALENTS_BATCH_MAX_SIZE} id per request."}
         )
-        .order_by('-skill_count', '-experience_count')[:2]
-    )
-    
-    serializer = StudentProfileSerializer(talents, many=True, context={"request": request})
-    return Response(serializer.data)
 
+    found = profile_payloads(request, ids)
+    return Response([
+        found[pk] for pk in ids
+        if pk in found and found[pk]["is_public"] and found[pk]["is_active"]
+    ])
 
 
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def talent_changes_view(request):
+    """
+    Sinkronisasi delta untuk mirror direktori. `since` adalah token dari
+    respons sebelumnya (0 atau kosong = dari awal log). Mengembalikan
+    profil yang berubah dan masih tampil (`results`), id profil yang
+    dihapus/disembunyikan/dinonaktifkan (`removed`), token berikutnya
+    (`next`) dan `has_more`. 410 bila token sudah kedaluwarsa: sinkron
+    ulang penuh lalu lanjutkan dari `next`.
+    """
+    from .changes import TokenExpired, changes_since, head_token
+
+    try:
+        since = int(request.query_params.get("since") or 0)
+        limit = int(request.query_params.get("limit") or settings.TALENTS_CHANGES_PAGE_SIZE)
+    except ValueError:
+        raise ValidationError({"since": "Token dan limit harus berupa angka."})
+    if since < 0:
+        raise ValidationError({"since": "Token tidak valid."})
+    limit = min(max(limit, 1), settings.TALENTS_CHANGES_PAGE_SIZE)
+
+    try:
+        updated, removed, next_token, has_more = changes_since(since, limit)
+    except TokenExpired:
+        return Response(
+            {"detail": "Token kedaluwarsa, lakukan sinkronisasi penuh.", "next": str(head_token())},
+            status=410,
+        )
+    # Payload dibaca dari primary tanpa cache detail: cache (hingga
+    # TALENTS_DETAIL_CACHE_TIMEOUT) maupun replica (hingga
+    # DATABASE_REPLICA_MAX_LAG) bisa lebih tua dari safety lag log, sehingga
+    # mirror menerima data lama sementara tokennya sudah melewati perubahan.
+    with use_primary():
+        payloads = serialize_profiles(request, updated)
+    return Response({
+        "next": str(next_token),
+        "has_more": has_more,
+        "results": [payloads[pk] for pk in updated if pk in payloads],
+        "removed": removed,
+    })
+
+
+def _serialize_ranked(request, ranked, score_field):
+    """
+    Serialisasi hasil peringkat [(profile_id, skor), ...] dengan satu kali
+    prefetch, mempertahankan urutan dan melewati profil yang sudah tidak
+    publik.
+    """
+    profiles = public_profiles().select_related("user").prefetch_related(
+        "student_skills__skill", "experiences", "projects", "social_links"
+    ).in_bulk([profile_id for profile_id, _ in ranked])
+    data = []
+    for profile_id, score in ranked:
+        if profile_id in profiles:
+            item = StudentProfileSerializer(profiles[profile_id], context={"request": request}).data
+            item[score_field] = round(score, 4)
+            data.append(item)
+    return data
+
+
+@api_view(['POST'])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([PublicThrottle])
+def talent_match_view(request):
+    """
+    Cari talenta yang paling cocok dengan kebutuhan skill berbobot
+    (lihat TalentMatchSerializer), diurutkan dari skor tertinggi.
+    """
+    from .skill_index import LEVEL_CODES, skill_index
+
+    serializer = TalentMatchSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    criteria = serializer.validated_data
+
+    requirements = []
+    for item in criteria["skills"]:
+        entry = skill_name_map.get(item["name"])
+        skill_id = entry[0] if entry else None
+        requirements.append((skill_id, LEVEL_CODES[item["min_level"]], item["weight"]))
+    ranked = skill_index.match(
+        requirements,
+        prodi=criteria["prodi"],
+        angkatan=criteria["angkatan"],
+        limit=criteria["limit"],
+    )
+    return Response(_serialize_ranked(request, ranked, "match_score"))
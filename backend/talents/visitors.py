@@ -0,0 +1,210 @@
+"""
+Pencatatan kunjungan profil publik: total `views_count`, jumlah kunjungan
+harian dan sketsa HyperLogLog pengunjung unik harian (ProfileViewSketch).
+
+Request detail hanya menambah hitungan di cache; job
+`talents.flush_profile_views` menuliskannya ke database paling lambat
+TALENTS_VIEWS_FLUSH_INTERVAL detik kemudian, sehingga request detail
+(yang biasanya dijawab dari cache) tidak menulis ke database. Bila cache
+hanya berlaku per proses (config.W001), hitungan yang tertunda tidak
+terlihat oleh worker, jadi kunjungan langsung ditulis ke database.
+
+Pengunjung hanya disimpan sebagai hash dengan salt harian; IP maupun id
+user tidak pernah masuk ke cache atau database.
+"""
+
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+from rest_framework.throttling import BaseThrottle
+
+from config.checks import cache_is_process_local
+
+from . import hll
+from .directory import count_directory_view
+from .models import ProfileViewSketch, StudentProfile
+
+# Hitungan per (profil, hari) yang belum ditulis, daftar (profil, hari)
+# yang menunggu flush, dan pengunjung baru per (profil, hari).
+PENDING_VIEWS_KEY = "talents:views:%s"
+PENDING_LISTED_KEY = "talents:views:%s:listed"
+PENDING_VIEWERS_KEY = "talents:views:%s:viewers"
+PENDING_PAIRS_KEY = "talents:views:pending"
+FLUSH_SCHEDULED_KEY = "talents:views:flush-scheduled"
+FLUSH_LOCK_KEY = "talents:views:flush-lock"
+FLUSH_LOCK_TIMEOUT = 60 * 10
+# Cukup lama untuk melewati pergantian hari maupun worker yang sempat mati.
+PENDING_TIMEOUT = 60 * 60 * 48
+
+
+def viewer_key(request, day: str) -> str:
+    """
+    Hash pengunjung untuk hari `day`: id user bila login, selain itu IP
+    (menghormati NUM_PROXIES seperti throttle), di-HMAC dengan SECRET_KEY
+    dan tanggal. Salt berganti tiap hari, sehingga kunjungan di hari yang
+    berbeda tidak bisa dikaitkan satu sama lain.
+    """
+    if request.user and request.user.is_authenticated:
+        identity = f"user:{request.user.pk}"
+    else:
+        identity = f"ip:{BaseThrottle().get_ident(request)}"
+    return salted_hmac(f"talents.visitors.viewer:{day}", identity).hexdigest()
+
+
+def _incr(key, delta=1) -> int:
+    cache.add(key, 0, PENDING_TIMEOUT)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:  # kedaluwarsa di antara add dan incr
+        cache.set(key, delta, PENDING_TIMEOUT)
+        return delta
+
+
+def _append(list_key, value) -> None:
+    """
+    Tambahkan `value` ke daftar di cache: nomor urut dari `incr`, isi di
+    slot masing-masing, sehingga penulis yang bersamaan tidak saling
+    menimpa.
+    """
+    index = _incr(f"{list_key}:seq")
+    cache.set(f"{list_key}:{index}", value, PENDING_TIMEOUT)
+
+
+def _pending(list_key):
+    """
+    Isi daftar yang belum diproses: (nomor terakhir, slot, nilai). Slot
+    yang hilang (kedaluwarsa, atau penulisnya belum sempat `set`)
+    dilewati.
+    """
+    done = cache.get(f"{list_key}:done", 0)
+    last = cache.get(f"{list_key}:seq", 0)
+    keys = [f"{list_key}:{index}" for index in range(done + 1, last + 1)]
+    values = cache.get_many(keys) if keys else {}
+    return last, keys, [values[key] for key in keys if key in values]
+
+
+def _mark_done(list_key, last, keys) -> None:
+    cache.set(f"{list_key}:done", last, PENDING_TIMEOUT)
+    cache.delete_many(keys)
+
+
+def record_profile_view(request, profile_id) -> None:
+    """
+    Catat satu kunjungan di cache. Pengunjung yang belum terlihat hari ini
+    ikut dicatat untuk sketsa pengunjung unik.
+    """
+    if getattr(request.user, "cached_profile_id", None) == profile_id:
+        return  # pemilik melihat profilnya sendiri
+
+    today = timezone.localdate()
+    day = today.isoformat()
+    viewer = viewer_key(request, day)
+    if cache_is_process_local():
+        _write_views(profile_id, today, 1, [viewer])
+        return
+
+    pair = f"{profile_id}:{day}"
+    _incr(PENDING_VIEWS_KEY % pair)
+
+    seen_key = "talents:viewer:%s:%s:%s" % (profile_id, day, viewer)
+    if cache.add(seen_key, 1, 60 * 60 * 24):
+        _append(PENDING_VIEWERS_KEY % pair, viewer)
+
+    # Tanda `listed` berumur pendek: bila pendaftarannya sempat hilang,
+    # kunjungan berikutnya setelah tanda kedaluwarsa mendaftarkannya lagi.
+    if cache.add(PENDING_LISTED_KEY % pair, 1, settings.TALENTS_VIEWS_FLUSH_INTERVAL * 10):
+        _append(PENDING_PAIRS_KEY, [profile_id, day])
+    schedule_view_flush()
+
+
+def schedule_view_flush() -> None:
+    """
+    Jadwalkan satu job flush untuk semua kunjungan yang masuk dalam
+    TALENTS_VIEWS_FLUSH_INTERVAL detik ke depan.
+    """
+    interval = settings.TALENTS_VIEWS_FLUSH_INTERVAL
+    if cache.add(FLUSH_SCHEDULED_KEY, 1, interval + 60):
+        from jobs.queue import enqueue
+
+        enqueue("talents.flush_profile_views", delay=interval)
+
+
+def _write_views(profile_id, day, views, viewers) -> None:
+    with transaction.atomic():
+        if not StudentProfile.objects.filter(pk=profile_id).update(
+            views_count=F("views_count") + views
+        ):
+            return  # profil sudah dihapus
+        count_directory_view(profile_id, views)
+        sketch, _ = ProfileViewSketch.objects.select_for_update().get_or_create(
+            student_id=profile_id, day=day, defaults={"registers": hll.empty()}
+        )
+        registers = bytes(sketch.registers)
+        for viewer in viewers:
+            registers = hll.add(registers, viewer) or registers
+        sketch.views += views
+        sketch.registers = registers
+        sketch.save(update_fields=["views", "registers"])
+
+
+def flush_pending_views() -> int:
+    """
+    Tulis hitungan kunjungan yang tertunda di cache ke database. Hitungan
+    baru dikurangi setelah penulisannya commit, jadi flush yang gagal
+    diulang tanpa kehilangan kunjungan. Mengembalikan jumlah kunjungan
+    yang ditulis.
+    """
+    if not cache.add(FLUSH_LOCK_KEY, 1, FLUSH_LOCK_TIMEOUT):
+        cache.delete(FLUSH_SCHEDULED_KEY)
+        schedule_view_flush()
+        return 0
+    try:
+        # Kunjungan setelah titik ini menjadwalkan flush berikutnya.
+        cache.delete(FLUSH_SCHEDULED_KEY)
+        last, keys, pairs = _pending(PENDING_PAIRS_KEY)
+        total = 0
+        for profile_id, day in dict.fromkeys(tuple(pair) for pair in pairs):
+            pair = f"{profile_id}:{day}"
+            cache.delete(PENDING_LISTED_KEY % pair)
+            views = cache.get(PENDING_VIEWS_KEY % pair, 0)
+            viewers_last, viewer_keys, viewers = _pending(PENDING_VIEWERS_KEY % pair)
+            if views or viewers:
+                _write_views(profile_id, datetime.date.fromisoformat(day), views, viewers)
+            if views:
+                try:
+                    cache.decr(PENDING_VIEWS_KEY % pair, views)
+                except ValueError:  # sudah kedaluwarsa
+                    pass
+            _mark_done(PENDING_VIEWERS_KEY % pair, viewers_last, viewer_keys)
+            total += views
+        _mark_done(PENDING_PAIRS_KEY, last, keys)
+        return total
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def visitor_summary(profile_id, start: datetime.date, end: datetime.date) -> dict:
+    """
+    Total kunjungan dan taksiran pengunjung unik untuk rentang [start, end],
+    beserta rincian harian.
+    """
+    sketches = list(
+        ProfileViewSketch.objects.filter(student_id=profile_id, day__range=(start, end))
+        .order_by("day")
+        .values_list("day", "views", "registers")
+    )
+    return {
+        "start": start,
+        "end": end,
+        "views": sum(views for _, views, _ in sketches),
+        "unique_visitors": hll.estimate(hll.merge(bytes(registers) for _, _, registers in sketches)),
+        "daily": [
+            {"date": day, "views": views, "unique_visitors": hll.estimate(bytes(registers))}
+            for day, views, registers in sketches
+        ],
+    }
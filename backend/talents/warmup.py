@@ -0,0 +1,167 @@
+"""
+Pemanasan cache direktori publik setelah deploy atau flush cache, supaya
+pengunjung pertama tidak serentak menghitung ulang respons halaman utama
+(latest, top talents, statistik), halaman awal daftar publik beserta
+facet-nya, dan detail profil yang paling sering dilihat.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import QueryDict
+from django.test import RequestFactory
+
+from .cache import directory_cache_key, refresh
+from .facets import compute_facets
+from .filters import (
+    SORT_ORDERINGS,
+    directory_entries,
+    directory_filter_params,
+    directory_list_params,
+)
+from .serializers import StudentProfileSerializer
+from .views import (
+    PublicTalentListView,
+    TalentDetailView,
+    home_cache_key,
+    home_data,
+    latest_talents_data,
+    public_list_cache_key,
+    statistics_data,
+    talent_detail_cache_key,
+    top_talents_data,
+)
+
+
+def warm_request(base_url: str):
+    """
+    Request tiruan dengan host/skema `base_url`, hanya untuk membangun URL
+    absolut yang sama dengan request sungguhan.
+    """
+    parts = urlsplit(base_url)
+    return RequestFactory().get("/", HTTP_HOST=parts.netloc, secure=parts.scheme == "https")
+
+
+def _refresh_home(name, compute, request=None):
+    return lambda: refresh(
+        home_cache_key(name, request),
+        compute,
+        fresh_for=settings.TALENTS_LIST_CACHE_TIMEOUT,
+        stale_for=settings.TALENTS_LIST_CACHE_STALE,
+    )
+
+
+def _refresh_list_page(params, page_number):
+    view = PublicTalentListView()
+    return lambda: refresh(
+        public_list_cache_key(params, page_number),
+        lambda: view.get_page_ids(params, page_number),
+        fresh_for=settings.TALENTS_LIST_CACHE_TIMEOUT,
+        stale_for=settings.TALENTS_LIST_CACHE_STALE,
+    )
+
+
+def _refresh_facets(params):
+    def run():
+        cache.set(
+            directory_cache_key("facets", params),
+            compute_facets(params),
+            settings.TALENTS_FACETS_CACHE_TIMEOUT,
+        )
+    return run
+
+
+def _refresh_detail(pk, request):
+    def run():
+        profile = TalentDetailView.queryset.get(pk=pk)
+        cache.set(
+            talent_detail_cache_key(pk, request),
+            StudentProfileSerializer(profile, context={"request": request}).data,
+            settings.TALENTS_DETAIL_CACHE_TIMEOUT,
+        )
+    return run
+
+
+def warm_targets(base_url=None, queries=None, pages=None, popular=None):
+    """
+    Daftar (label, fungsi) yang akan dijalankan. Default diambil dari
+    setting CACHE_WARM_*; `queries` berupa query string daftar publik.
+    """
+    base_url = base_url or settings.CACHE_WARM_BASE_URL
+    queries = settings.CACHE_WARM_QUERIES if queries is None else queries
+    pages = settings.CACHE_WARM_PAGES if pages is None else pages
+    popular = settings.CACHE_WARM_POPULAR_PROFILES if popular is None else popular
+    request = warm_request(base_url)
+
+    targets = [
+        ("latest", _refresh_home("latest", lambda: latest_talents_data(request), request)),
+        ("top-talents", _refresh_home("top", lambda: top_talents_data(request), request)),
+        ("statistics", _refresh_home("statistics", statistics_data)),
+        ("home", lambda: refresh(
+            home_cache_key("home", request),
+            lambda: home_data(request),
+            fresh_for=settings.TALENTS_HOME_CACHE_TIMEOUT,
+            stale_for=settings.TALENTS_LIST_CACHE_STALE,
+        )),
+    ]
+    seen = set()
+    for query in queries:
+        try:
+            params = directory_list_params(QueryDict(query.strip()))
+        except ValueError:
+            continue
+        frozen = tuple(sorted(params.items()))
+        if frozen in seen:
+            continue
+        seen.add(frozen)
+        label = query.strip() or "(semua)"
+        targets.append((f"facets {label}", _refresh_facets(directory_filter_params(params))))
+        for page_number in range(1, pages + 1):
+            targets.append(
+                (f"list {label} page={page_number}", _refresh_list_page(params, page_number))
+            )
+
+    popular_ids = directory_entries().order_by(*SORT_ORDERINGS["views"]).values_list(
+        "profile_id", flat=True
+    )[:popular]
+    for pk in popular_ids:
+        targets.append((f"detail {pk}", _refresh_detail(pk, request)))
+    return targets
+
+
+def _run(target):
+    label, func = target
+    started = time.perf_counter()
+    error = None
+    try:
+        func()
+    except Exception as exc:  # laporkan, jangan hentikan target lain
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        connections.close_all()
+    return label, time.perf_counter() - started, error
+
+
+def warm_caches(workers=None, **kwargs):
+    """
+    Jalankan semua target secara paralel. Mengembalikan list
+    (label, detik, error atau None) sesuai urutan target.
+    """
+    targets = warm_targets(**kwargs)
+    workers = workers or settings.CACHE_WARM_WORKERS
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        results = list(executor.map(_run, targets))
+    connections.close_all()
+    return results
+
+
+def warm_after_migrate(sender, using="default", **kwargs):
+    """
+    Handler post_migrate (aktif bila CACHE_WARM_ON_MIGRATE=True).
+    """
+    if using == "default":
+        warm_caches()